@@ -0,0 +1,55 @@
+"""
+Cold and warm scans of a parquet dataset stored in a local moto S3 server, with and without a BlockCache.
+
+    python -m benchmarks.bench_block_cache
+"""
+import tempfile
+import time
+
+import boto3
+import numpy
+import pyarrow as pa
+
+from benchmarks.bench_s3_transfers import start_server
+from cloud.core import BlockCache, ParquetWriteOptions
+from cloud.s3 import S3Storage
+
+BUCKET = "cloud-arrow-bench"
+PATH = "bench/block_cache"
+SCANS = 3
+
+
+def scan(storage) -> float:
+    start = time.perf_counter()
+    storage.read_to_arrow_table(file_format="parquet", path=PATH)
+    return time.perf_counter() - start
+
+
+def main():
+    server, endpoint_url = start_server()
+
+    try:
+        boto3.client("s3", endpoint_url=endpoint_url, region_name="us-east-1", aws_access_key_id="bench",
+                     aws_secret_access_key="bench").create_bucket(Bucket=BUCKET)
+        options = dict(access_key="bench", secret_key="bench", bucket=BUCKET, region="us-east-1",
+                       endpoint_url=endpoint_url)
+
+        table = pa.table({f"feature_{i}": numpy.random.uniform(size=2 ** 20) for i in range(8)})
+        S3Storage(**options).write(data=table, file_format="parquet", path=PATH, basename_template=None,
+                                   write_options=ParquetWriteOptions(partitions=[], compression_codec="None",
+                                                                     existing_data_behavior="overwrite_or_ignore"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name, block_cache in [("no cache", None),
+                                      ("block cache", BlockCache(directory, max_bytes=2 ** 30))]:
+                storage = S3Storage(block_cache=block_cache, **options)
+                timings = ", ".join(f"{scan(storage) * 1000:7.1f} ms" for _ in range(SCANS))
+                print(f"{name:>11}: {timings}" + ("" if block_cache is None else f" | {block_cache.stats()}"))
+                storage.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Count the filesystem clients created by a storage object while reading the same dataset 1,000 times.
+
+    python -m benchmarks.bench_filesystem_clients
+"""
+import tempfile
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cloud.local import LocalFileSystemStorage
+
+READS = 1000
+
+
+class CountingLocalFileSystemStorage(LocalFileSystemStorage):
+
+    def __init__(self):
+        super().__init__()
+        self.created = 0
+
+    def _create_filesystem(self):
+        self.created += 1
+        return super()._create_filesystem()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as path:
+        pq.write_to_dataset(pa.table({"id": range(100), "value": [float(i) for i in range(100)]}), root_path=path)
+
+        storage = CountingLocalFileSystemStorage()
+        start = time.perf_counter()
+        for _ in range(READS):
+            storage.read_to_arrow_table(file_format="parquet", path=path)
+        elapsed = time.perf_counter() - start
+
+        print(f"reads: {READS}, clients created: {storage.created}, "
+              f"mean read latency: {elapsed / READS * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
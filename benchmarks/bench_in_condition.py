@@ -0,0 +1,55 @@
+"""
+Lookups of a list of ids in a local parquet dataset, with an In condition and with the equivalent chained Eq
+conditions.
+
+    python -m benchmarks.bench_in_condition
+"""
+import tempfile
+import time
+
+import numpy
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from cloud.core import ConditionFactory, In, Or
+from cloud.local import LocalFileSystemStorage
+
+ROWS = 2 ** 22
+LOOKUPS = [100, 1000, 5000, 50000]
+# the chained conditions build one expression node per value, larger lists are not practical
+MAX_CHAINED = 1000
+
+
+def lookup(storage, path, condition) -> tuple:
+    start = time.perf_counter()
+    table = storage.read_to_arrow_table(file_format="parquet", path=path, filters=condition)
+    return time.perf_counter() - start, table.num_rows
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = f"{directory}/ids"
+        table = pa.table({"id": pa.array(numpy.arange(ROWS)), "value": numpy.random.uniform(size=ROWS)})
+        ds.write_dataset(table, path, format="parquet", max_rows_per_group=2 ** 16)
+
+        storage = LocalFileSystemStorage()
+        rng = numpy.random.default_rng(0)
+
+        for count in LOOKUPS:
+            # ids clustered in a few ranges, like the ids of recent customers
+            ids = numpy.concatenate([rng.integers(start, start + 2 ** 18, count // 4)
+                                     for start in rng.integers(0, ROWS - 2 ** 18, 4)]).tolist()
+
+            elapsed, rows = lookup(storage, path, In("id", ids))
+            line = f"{count:>6} ids | in: {elapsed * 1000:8.1f} ms ({rows} rows)"
+
+            if count <= MAX_CHAINED:
+                chained = Or(*[ConditionFactory.get_condition("eq", "id", value, None) for value in ids])
+                elapsed, rows = lookup(storage, path, chained)
+                line += f" | chained eq: {elapsed * 1000:8.1f} ms ({rows} rows)"
+
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
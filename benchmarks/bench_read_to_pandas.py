@@ -0,0 +1,73 @@
+"""
+Peak memory and wall time of read_to_pandas on a local partitioned parquet dataset, with the default conversion and
+with PandasOptions.lean(). Each read runs in a fresh process, the peak RSS is not shared between them.
+
+    python -m benchmarks.bench_read_to_pandas
+"""
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+ROWS = 2 ** 23
+PROFILES = ["default", "lean"]
+
+
+def peak_rss() -> int:
+    """
+    :return: peak resident set size of the process in bytes. VmHWM, unlike ru_maxrss, is not inherited from the
+        parent process
+    """
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 2 ** 10
+
+    raise RuntimeError("VmHWM is not available, the benchmark runs on linux only")
+
+
+def read(path: str, profile: str):
+    from cloud.core import PandasOptions
+    from cloud.local import LocalFileSystemStorage
+
+    storage = LocalFileSystemStorage()
+    baseline = peak_rss()
+
+    start = time.perf_counter()
+    dataframe = storage.read_to_pandas(file_format="parquet", path=path,
+                                       pandas_options=PandasOptions.lean() if profile == "lean" else None)
+    elapsed = time.perf_counter() - start
+
+    peak = peak_rss() - baseline
+    size = dataframe.memory_usage(deep=True).sum()
+
+    print(f"{profile:>8}: {elapsed * 1000:8.1f} ms | peak rss +{peak / 2 ** 20:7.1f} MiB | "
+          f"dataframe {size / 2 ** 20:7.1f} MiB")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = f"{directory}/events"
+        rng = numpy.random.default_rng(0)
+        table = pa.table({
+            "id": pa.array(numpy.arange(ROWS)),
+            "value": pa.array(rng.uniform(size=ROWS)),
+            "user": pa.array(numpy.char.add("user-", rng.integers(0, 10 ** 6, ROWS).astype(str))),
+            "country": pa.array(rng.choice(["ES", "UY", "US", "DE"], ROWS))
+        })
+        ds.write_dataset(table, path, format="parquet", partitioning=["country"], partitioning_flavor="hive")
+        del table
+
+        for profile in PROFILES:
+            subprocess.run([sys.executable, "-m", "benchmarks.bench_read_to_pandas", path, profile], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        read(sys.argv[1], sys.argv[2])
+    else:
+        main()
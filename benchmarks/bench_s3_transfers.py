@@ -0,0 +1,118 @@
+"""
+Throughput and request counts of S3Storage writes and reads against a local moto S3 server. Each request first waits
+as long as it would take on a remote store, LATENCY seconds plus its size at the BANDWIDTH of a single connection of
+a client outside the region of the bucket, the local server alone answers too fast for max_concurrency to matter.
+moto serves one request at a time and reads the whole object to answer each ranged GET, the concurrent requests and
+the reads of many small ranges gain less than on S3.
+
+    python -m benchmarks.bench_s3_transfers
+"""
+import asyncio
+import io
+import re
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+
+import boto3
+import numpy
+import pyarrow as pa
+
+from cloud.core import ParquetWriteOptions
+from cloud.s3 import S3Storage
+
+BUCKET = "cloud-arrow-bench"
+ROWS = 8 * 2 ** 20  # 64 MiB of doubles
+LATENCY = 0.03
+BANDWIDTH = 16 * 2 ** 20  # bytes per second of a connection
+
+
+def start_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = subprocess.Popen([sys.executable, "-m", "moto.server", "-H", "127.0.0.1", "-p", str(port)],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(300):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.1)
+
+    return server, f"http://127.0.0.1:{port}"
+
+
+def request_size(params) -> int:
+    """
+    :return: bytes sent by an upload or requested by a ranged GET
+    """
+    body = params.get("body")
+
+    # the parts are sent as BytesIO, the other requests as (empty) bytes
+    if isinstance(body, io.BytesIO):
+        return body.getbuffer().nbytes
+
+    if body:
+        return len(body)
+
+    byte_range = re.fullmatch(r"bytes=(\d+)-(\d+)", params.get("headers", {}).get("Range", ""))
+    return 0 if byte_range is None else int(byte_range.group(2)) - int(byte_range.group(1)) + 1
+
+
+def count_requests(filesystem) -> Counter:
+    requests = Counter()
+
+    async def count(model, params, **kwargs):
+        requests[model.name] += 1
+        await asyncio.sleep(LATENCY + request_size(params) / BANDWIDTH)
+
+    filesystem.connect()
+    filesystem.s3.meta.events.register("before-call.s3", count)
+    return requests
+
+
+def main():
+    server, endpoint_url = start_server()
+
+    try:
+        boto3.client("s3", endpoint_url=endpoint_url, region_name="us-east-1", aws_access_key_id="bench",
+                     aws_secret_access_key="bench").create_bucket(Bucket=BUCKET)
+        table = pa.table({"value": numpy.random.uniform(size=ROWS)})
+        size_mib = table.nbytes / 2 ** 20
+
+        for part_size_mib in (5, 16, 64):
+            for range_size_mib in (1, 32):
+                for max_concurrency in (1, 8):
+                    storage = S3Storage(access_key="bench", secret_key="bench", bucket=BUCKET, region="us-east-1",
+                                        endpoint_url=endpoint_url, part_size=part_size_mib * 2 ** 20,
+                                        range_size=range_size_mib * 2 ** 20, max_concurrency=max_concurrency)
+                    requests = count_requests(storage._get_filesystem())
+                    path = f"bench/part_{part_size_mib}_{range_size_mib}_{max_concurrency}"
+
+                    start = time.perf_counter()
+                    storage.write(data=table, file_format="parquet", path=path, basename_template=None,
+                                  write_options=ParquetWriteOptions(partitions=[], compression_codec="None",
+                                                                    existing_data_behavior="overwrite_or_ignore"))
+                    write_elapsed = time.perf_counter() - start
+                    uploads = requests["UploadPart"]
+
+                    start = time.perf_counter()
+                    storage.read_to_arrow_table(file_format="parquet", path=path)
+                    read_elapsed = time.perf_counter() - start
+
+                    print(f"part_size: {part_size_mib:>2} MiB, range_size: {range_size_mib:>2} MiB, "
+                          f"max_concurrency: {max_concurrency} | "
+                          f"write {size_mib / write_elapsed:7.1f} MiB/s, {uploads:>3} parts | "
+                          f"read {size_mib / read_elapsed:7.1f} MiB/s, {requests['GetObject']:>3} GETs")
+                    storage.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
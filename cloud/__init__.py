@@ -9,6 +9,7 @@ core
 adls
 gcsfs
 local
+s3
 """
 
-__all__ = ["core", "adls", "gcsfs", "local"]
+__all__ = ["core", "adls", "gcsfs", "local", "s3"]
@@ -3,8 +3,10 @@ from abc import ABCMeta
 from typing import Any
 
 from adlfs import AzureBlobFileSystem
+from adlfs.utils import close_service_client
+from fsspec.asyn import sync
 
-from ..core import AbstractStorage
+from ..core import AbstractStorage, BlockCache, DatasetCache, MetadataCache, ScanOptions, SnapshotCache
 
 
 class ADLSStorage(AbstractStorage, metaclass=ABCMeta):
@@ -14,7 +16,11 @@ class ADLSStorage(AbstractStorage, metaclass=ABCMeta):
                  client_id: str,
                  client_secret: str,
                  account_name: str,
-                 container: str):
+                 container: str,
+                 dataset_cache: DatasetCache = None,
+                 block_cache: BlockCache = None,
+                 metadata_cache: MetadataCache = None,
+                 snapshot_cache: SnapshotCache = None):
 
         """
         :param tenant_id:
@@ -22,9 +28,14 @@ class ADLSStorage(AbstractStorage, metaclass=ABCMeta):
         :param client_secret:
         :param account_name:
         :param container:
+        :param dataset_cache: Cache for the discovered datasets, default None
+        :param block_cache: Local cache for the blocks read from the storage, default None
+        :param metadata_cache: Cache for the parquet footers, default None
+        :param snapshot_cache: Cache for the opened delta tables, default None
         """
 
-        super().__init__()
+        super().__init__(dataset_cache=dataset_cache, block_cache=block_cache, metadata_cache=metadata_cache,
+                         snapshot_cache=snapshot_cache)
         self._logger = logging.getLogger('cloud_arrow.adlsReader')
 
         self._tenant_id = tenant_id
@@ -33,14 +44,35 @@ class ADLSStorage(AbstractStorage, metaclass=ABCMeta):
         self._account_name = account_name
         self._container = container
 
-    def _get_filesystem(self) -> Any:
+    def _create_filesystem(self) -> Any:
+        # skip the fsspec instance cache, the client lifetime is owned by the storage object
         return AzureBlobFileSystem(
             account_name=self._account_name,
             tenant_id=self._tenant_id,
             client_id=self._client_id,
-            client_secret=self._client_secret
+            client_secret=self._client_secret,
+            skip_instance_cache=True
         )
 
+    def _close_filesystem(self, filesystem):
+        sync(filesystem.loop, close_service_client, filesystem)
+
+    def refresh_credentials(self, client_secret: str = None):
+        """
+        Discard the cached filesystem client, the next read or write authenticates again
+
+        :param client_secret: New service principal client secret, default None keeps the current one
+        """
+        if client_secret is not None:
+            self._client_secret = client_secret
+
+        super().refresh_credentials()
+
+    def _get_scan_options(self) -> ScanOptions:
+        # each file costs a few round trips to the storage account before its first batch, twice as many files as
+        # the pyarrow default are read at once
+        return ScanOptions(fragment_readahead=8)
+
     def _get_filesystem_base_path(self, path):
         return f"{self._container}/{AbstractStorage._normalize_path(path)}"
 
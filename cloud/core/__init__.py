@@ -1,2 +1,9 @@
-from .core import Condition, ConditionFactory, ParquetWriteOptions, DeltaLakeWriteOptions, WriteOptions
+from .core import Condition, And, Or, Not, In, NotIn, ConditionFactory
+from .core import ParquetWriteOptions, DeltaLakeWriteOptions, WriteOptions, ScanOptions, PandasOptions
 from .core import AbstractStorage
+from .cache import DatasetCache
+from .index import DatasetIndex
+from .blockcache import BlockCache
+from .metadatacache import MetadataCache
+from .prefetch import PrefetchIterator
+from .snapshotcache import SnapshotCache
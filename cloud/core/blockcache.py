@@ -0,0 +1,329 @@
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pyarrow as pa
+from fsspec.implementations.arrow import ArrowFSWrapper
+from pyarrow.fs import FileSystem, FSSpecHandler, PyFileSystem
+
+__all__ = ['BlockCache']
+
+# info keys identifying the version of an object, in order of preference
+# (GCS generation, ADLS/GCS/S3 etag, local and fallback modification times)
+_VERSION_KEYS = ["generation", "etag", "ETag", "VersionId", "mtime", "last_modified", "LastModified"]
+
+# age in seconds of the temporary block files left by a crashed process, younger ones may still be written
+_STALE_TMP_SECONDS = 3600
+
+
+class BlockCache:
+    def __init__(self, directory: str, max_bytes: int, block_size: int = 4 * 2 ** 20):
+        """
+        On-disk read-through cache of fixed size blocks of the remote objects. Blocks are keyed by the object path,
+        its version (generation, etag or modification time) and the block index, so a modified object never
+        serves stale blocks. The blocks already in the directory are reused, warming up new processes.
+
+        :param directory: Local directory holding the cached blocks
+        :param max_bytes: Maximum size in bytes of the cached blocks, the least recently used ones are evicted first
+        :param block_size: Size in bytes of the cached blocks, default 4 MiB
+        """
+        if max_bytes < block_size:
+            raise ValueError("max_bytes must be greater or equal than block_size")
+
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._block_size = block_size
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    @property
+    def size(self) -> int:
+        """
+        :return: bytes currently cached
+        """
+        return self._size
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "blocks": len(self._entries),
+            "bytes": self._size
+        }
+
+    def wrap(self, filesystem) -> FileSystem:
+        """
+        Wrap a filesystem so the files opened for reading are served through the cache
+
+        :param filesystem: fsspec or pyarrow filesystem
+        :return: pyarrow filesystem
+        """
+        if isinstance(filesystem, FileSystem):
+            filesystem = ArrowFSWrapper(filesystem)
+
+        return PyFileSystem(_BlockCacheHandler(filesystem, self))
+
+    def block_key(self, path: str, version: str, index: int) -> str:
+        return hashlib.sha256(f"{path}\0{version}\0{self._block_size}\0{index}".encode()).hexdigest()
+
+    def get(self, key: str):
+        """
+        :return: bytes of the block or None when not cached
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+
+        try:
+            with open(self._block_path(key), "rb") as block:
+                data = block.read()
+        except FileNotFoundError:
+            # evicted by another thread or process meanwhile
+            with self._lock:
+                self._forget(key)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+
+        return data
+
+    def put(self, key: str, data: bytes):
+        path = self._block_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as block:
+                block.write(data)
+            os.replace(tmp_path, path)
+        except FileNotFoundError:
+            # removed by another process sharing the directory, the block is just not cached
+            return
+
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = len(data)
+            self._size += len(data)
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _block_path(self, key: str) -> str:
+        return os.path.join(self._directory, key[:2], key)
+
+    def _load(self):
+        blocks = []
+        stale_time = time.time() - _STALE_TMP_SECONDS
+
+        for root, _, files in os.walk(self._directory):
+            for name in files:
+                path = os.path.join(root, name)
+
+                try:
+                    stat = os.stat(path)
+
+                    # the temporary files of the blocks other processes are writing are kept
+                    if name.endswith(".tmp"):
+                        if stat.st_mtime < stale_time:
+                            os.remove(path)
+                    else:
+                        blocks.append((stat.st_mtime, name, stat.st_size))
+                except FileNotFoundError:
+                    # renamed or evicted by another process meanwhile
+                    pass
+
+        for _, key, size in sorted(blocks):
+            self._entries[key] = size
+            self._size += size
+
+        self._evict()
+
+    def _forget(self, key: str):
+        size = self._entries.pop(key, None)
+
+        if size is not None:
+            self._size -= size
+
+    def _remove(self, key: str):
+        self._forget(key)
+
+        try:
+            os.remove(self._block_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        while self._size > self._max_bytes:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+
+def _object_version(info: dict):
+    for key in _VERSION_KEYS:
+        value = info.get(key)
+
+        if value is not None:
+            return f"{key}={value}:size={info.get('size')}"
+
+    return None
+
+
+class _BlockCacheHandler(FSSpecHandler):
+
+    def __init__(self, fs, cache: BlockCache):
+        super().__init__(fs)
+        self._cache = cache
+
+    def __eq__(self, other):
+        if isinstance(other, _BlockCacheHandler):
+            return self.fs == other.fs and self._cache is other._cache
+        return NotImplemented
+
+    def __ne__(self, other):
+        return not self == other
+
+    def get_type_name(self):
+        return f"blockcache+{super().get_type_name()}"
+
+    def open_input_file(self, path):
+        info = self.fs.info(path)
+
+        if info["type"] != "file":
+            raise FileNotFoundError(path)
+
+        version = _object_version(info)
+
+        if version is None:
+            # without a version a cached block could be stale, read through the filesystem
+            return pa.PythonFile(self.fs.open(path, mode="rb"), mode="r")
+
+        return pa.PythonFile(_BlockCachedFile(self.fs, self._cache, path, version, info["size"]), mode="r")
+
+
+class _RandomAccessFile(io.RawIOBase):
+    """
+    Read-only file of a known size, reads are delegated to _read_range()
+    """
+
+    def __init__(self, size: int):
+        super().__init__()
+        self._size = size
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def size(self):
+        return self._size
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self._size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+
+        return self._position
+
+    def read(self, size=-1):
+        start = self._position
+        end = self._size if size is None or size < 0 else min(self._size, start + size)
+
+        if start >= end:
+            return b""
+
+        data = self._read_range(start, end)
+        self._position = end
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        raise NotImplementedError()
+
+
+class _BlockCachedFile(_RandomAccessFile):
+
+    def __init__(self, fs, cache: BlockCache, path: str, version: str, size: int):
+        super().__init__(size)
+        self._fs = fs
+        self._cache = cache
+        self._path = path
+        self._version = version
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        block_size = self._cache.block_size
+        first, last = start // block_size, (end - 1) // block_size
+        data = b"".join(self._read_blocks(first, last))
+        offset = start - first * block_size
+
+        return data[offset:offset + end - start]
+
+    def _read_blocks(self, first: int, last: int) -> list:
+        block_size = self._cache.block_size
+        keys = [self._cache.block_key(self._path, self._version, index) for index in range(first, last + 1)]
+        blocks = [self._cache.get(key) for key in keys]
+
+        # fetch each run of missing blocks with a single ranged request
+        index = 0
+        while index < len(blocks):
+            if blocks[index] is not None:
+                index += 1
+                continue
+
+            run_end = index
+            while run_end + 1 < len(blocks) and blocks[run_end + 1] is None:
+                run_end += 1
+
+            range_start = (first + index) * block_size
+            range_end = min(self._size, (first + run_end + 1) * block_size)
+            data = self._fs.cat_file(self._path, start=range_start, end=range_end)
+
+            for position in range(index, run_end + 1):
+                block = data[(position - index) * block_size:(position - index + 1) * block_size]
+                self._cache.put(keys[position], block)
+                blocks[position] = block
+
+            index = run_end + 1
+
+        return blocks
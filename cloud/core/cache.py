@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+
+__all__ = ['DatasetCache']
+
+
+class DatasetCache:
+    def __init__(self, max_entries: int = 128, ttl: float = None):
+        """
+        Cache of discovered datasets shared by the read methods of a storage object. Caching a dataset skips the
+        recursive listing, partition discovery and schema inference done when a dataset is opened.
+
+        :param max_entries: Maximum number of datasets kept, the least recently used one is evicted first
+        :param ttl: Seconds an entry is valid after being cached, default None keeps entries until evicted
+            or invalidated
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than 0")
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(file_format: str, path: str, partitioning, version: int = None):
+        """
+        :return: hashable key for the dataset, None when the partitioning can not be used as key
+        """
+        if isinstance(partitioning, list):
+            partitioning = tuple(partitioning)
+
+        key = (file_format, path, partitioning, version)
+
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def get(self, key):
+        """
+        :return: the cached dataset or None when missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            dataset, cached_at = entry
+
+            if self._ttl is not None and time.monotonic() - cached_at > self._ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return dataset
+
+    def put(self, key, dataset):
+        with self._lock:
+            self._entries[key] = (dataset, time.monotonic())
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str = None):
+        """
+        Remove the cached datasets located at, above or below the given path
+
+        :param path: Normalized dataset path, default None removes every entry
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if _overlaps(key[1], path)]:
+                del self._entries[key]
+
+
+def _overlaps(cached_path: str, path: str) -> bool:
+    return (cached_path == path
+            or cached_path.startswith(f"{path}/")
+            or path.startswith(f"{cached_path}/"))
@@ -1,21 +1,60 @@
+import bisect
+import json
 import logging
+import operator
+import os
+import threading
+import weakref
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache, reduce
 from typing import Any
+from urllib.parse import unquote
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
+from pyarrow.fs import FileSystem, FileType, FSSpecHandler, PyFileSystem, SubTreeFileSystem
 from deltalake import DeltaTable, write_deltalake
+from fsspec.implementations.arrow import ArrowFSWrapper
 from pandas import DataFrame
 
+from .blockcache import BlockCache, _object_version
+from .cache import DatasetCache, _overlaps
+from .index import INDEX_FILE, DatasetIndex
+from .metadatacache import MetadataCache
+from .prefetch import PrefetchIterator
+from .snapshotcache import SnapshotCache
+
 __all__ = ['Condition',
+           'And',
+           'Or',
+           'Not',
+           'In',
+           'NotIn',
            'ConditionFactory',
            'ParquetWriteOptions',
            'DeltaLakeWriteOptions',
            'WriteOptions',
            'AbstractStorage']
 
+# summary files of a parquet dataset, holding the footers of all its data files and their common schema
+METADATA_FILE = "_metadata"
+COMMON_METADATA_FILE = "_common_metadata"
+
+# maximum number of candidate files a lookup reads concurrently
+LOOKUP_READAHEAD = 64
+
+# maximum number of footers read concurrently to skip row groups, each footer read is a round trip to the storage
+FOOTER_READAHEAD = 16
+
+# rows of the arrays read_to_numpy fills when the metadata does not tell the number of matching rows
+NUMPY_CHUNK_ROWS = 1 << 16
+
 """
 The following is a context-free grammar for DNF:
     DNF → (Conjunction) ∨ DNF
@@ -36,6 +75,16 @@ class Condition(metaclass=ABCMeta):
         self._key = key
         self._value_1 = value_1
         self._type_1 = type(value_1)
+        self._hash = None
+
+    def __and__(self, other):
+        return And(self, other)
+
+    def __or__(self, other):
+        return Or(self, other)
+
+    def __invert__(self):
+        return Not(self)
 
     @abstractmethod
     def gen_expression(self, **kwargs):
@@ -47,6 +96,113 @@ class Condition(metaclass=ABCMeta):
         """
         pass
 
+    def gen_tuples(self) -> list:
+        """
+        Definition for getting the conjunction of filter tuples of a literal condition
+        Returns
+        -------
+        :return: conjunction : List[Tuple]
+        """
+        raise NotImplementedError(f"{type(self).__name__} is not a literal condition")
+
+    def negate(self):
+        """
+        Definition for getting the condition matching the rows this condition does not match
+        Returns
+        -------
+        :return: condition : Condition
+        """
+        raise NotImplementedError(f"{type(self).__name__} can not be negated")
+
+    def matches(self, value) -> bool:
+        """
+        :return: whether a literal condition holds for a value of its field
+        """
+        raise NotImplementedError(f"{type(self).__name__} is not a literal condition")
+
+    # whether pyarrow skips the row groups from their statistics by itself, otherwise the footers are read to
+    # evaluate may_match against them
+    _pruned_by_pyarrow = True
+
+    def may_match(self, minimum, maximum) -> bool:
+        """
+        :return: whether a literal condition may hold for some value in [minimum, maximum], used to skip the files
+            and row groups from their statistics
+        """
+        return True
+
+    def must_match(self, minimum, maximum) -> bool:
+        """
+        :return: whether a literal condition holds for every value in [minimum, maximum], used to answer the
+            aggregates from the statistics. False when unknown
+        """
+        return False
+
+    def probe_values(self):
+        """
+        :return: values one of which the field must be equal to for a literal condition to hold, checked against
+            the bloom filters of the index. None when the condition is not a point lookup
+        """
+        return None
+
+    def to_dnf(self) -> list:
+        """
+        Definition for getting the condition in disjunctive normal form, each conjunction being a list of literal
+        conditions. An empty list never matches.
+        Returns
+        -------
+        :return: dnf : List[List[Condition]]
+        """
+        return [[self]]
+
+    def gen_filters(self) -> list:
+        """
+        Definition for getting the simplified disjunctive normal form as filter tuples, the List[List[Tuple]]
+        form accepted by the filters argument of the read methods
+        Returns
+        -------
+        :return: filters : List[List[Tuple]]
+        """
+        return [[condition_tuple for literal in conjunction for condition_tuple in literal.gen_tuples()]
+                for conjunction in self.dnf()]
+
+    def dnf(self) -> tuple:
+        """
+        Definition for getting the simplified disjunctive normal form: the ranges on each field are folded into a
+        single interval, and redundant literals and conjunctions are removed. The result is cached per condition
+        tree. An empty tuple never matches.
+        Returns
+        -------
+        :return: dnf : Tuple[Tuple[Condition]]
+        """
+        return _cached(_compile_dnf, self)
+
+    def never_matches(self) -> bool:
+        """
+        :return: whether the condition is a contradiction, no row can match it
+        """
+        return len(self.dnf()) == 0
+
+    def _arguments(self) -> tuple:
+        return self._key, self._value_1
+
+    def _identity(self) -> tuple:
+        # the types tell apart values comparing equal, like 1, 1.0 and True
+        return (type(self),) + tuple(_typed(argument) for argument in self._arguments())
+
+    def __eq__(self, other):
+        if not isinstance(other, Condition):
+            return NotImplemented
+        return self._identity() == other._identity()
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self._identity())
+        return self._hash
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self._arguments()}"
+
 
 class UnaryCondition(Condition, metaclass=ABCMeta):
     def __init__(self, key, value_1):
@@ -88,6 +244,9 @@ class BinaryCondition(Condition, metaclass=ABCMeta):
         """
         pass
 
+    def _arguments(self) -> tuple:
+        return self._key, self._value_1, self._value_2
+
 
 class Eq(UnaryCondition, metaclass=ABCMeta):
     def gen_expression(self, **kwargs):
@@ -99,6 +258,24 @@ class Eq(UnaryCondition, metaclass=ABCMeta):
         """
         return ds.field(self._key) == self._value_1
 
+    def gen_tuples(self) -> list:
+        return [(self._key, "==", self._value_1)]
+
+    def negate(self):
+        return Neq(self._key, self._value_1)
+
+    def matches(self, value) -> bool:
+        return value == self._value_1
+
+    def may_match(self, minimum, maximum) -> bool:
+        return _within(minimum, maximum, self._value_1, self._value_1)
+
+    def must_match(self, minimum, maximum) -> bool:
+        return _covers(minimum, maximum, self._value_1, self._value_1)
+
+    def probe_values(self):
+        return (self._value_1,)
+
 
 class Neq(UnaryCondition, metaclass=ABCMeta):
     def gen_expression(self, **kwargs):
@@ -110,6 +287,23 @@ class Neq(UnaryCondition, metaclass=ABCMeta):
         """
         return (ds.field(self._key) != self._value_1)
 
+    def gen_tuples(self) -> list:
+        return [(self._key, "!=", self._value_1)]
+
+    def negate(self):
+        return Eq(self._key, self._value_1)
+
+    def matches(self, value) -> bool:
+        return value != self._value_1
+
+    def may_match(self, minimum, maximum) -> bool:
+        # only a row group holding nothing but the value is skipped
+        return not (_within(minimum, maximum, self._value_1, self._value_1) and minimum == maximum)
+
+    def must_match(self, minimum, maximum) -> bool:
+        return minimum is not None and maximum is not None and \
+            not _within(minimum, maximum, self._value_1, self._value_1)
+
 
 class Lt(UnaryCondition, metaclass=ABCMeta):
     def __init__(self, key, value_1, equals=False):
@@ -128,6 +322,30 @@ class Lt(UnaryCondition, metaclass=ABCMeta):
         else:
             return (ds.field(self._key) < self._value_1)
 
+    def gen_tuples(self) -> list:
+        return [(self._key, "<=" if self._equals else "<", self._value_1)]
+
+    def negate(self):
+        return Gt(self._key, self._value_1, equals=not self._equals)
+
+    def matches(self, value) -> bool:
+        return value <= self._value_1 if self._equals else value < self._value_1
+
+    def may_match(self, minimum, maximum) -> bool:
+        try:
+            return minimum is None or self.matches(minimum)
+        except TypeError:
+            return True
+
+    def must_match(self, minimum, maximum) -> bool:
+        try:
+            return maximum is not None and self.matches(maximum)
+        except TypeError:
+            return False
+
+    def _arguments(self) -> tuple:
+        return self._key, self._value_1, self._equals
+
 
 class Gt(UnaryCondition, metaclass=ABCMeta):
     def __init__(self, key, value_1, equals=False):
@@ -146,6 +364,30 @@ class Gt(UnaryCondition, metaclass=ABCMeta):
         else:
             return (ds.field(self._key) > self._value_1)
 
+    def gen_tuples(self) -> list:
+        return [(self._key, ">=" if self._equals else ">", self._value_1)]
+
+    def negate(self):
+        return Lt(self._key, self._value_1, equals=not self._equals)
+
+    def matches(self, value) -> bool:
+        return value >= self._value_1 if self._equals else value > self._value_1
+
+    def may_match(self, minimum, maximum) -> bool:
+        try:
+            return maximum is None or self.matches(maximum)
+        except TypeError:
+            return True
+
+    def must_match(self, minimum, maximum) -> bool:
+        try:
+            return minimum is not None and self.matches(minimum)
+        except TypeError:
+            return False
+
+    def _arguments(self) -> tuple:
+        return self._key, self._value_1, self._equals
+
 
 class Btw(BinaryCondition, metaclass=ABCMeta):
     def gen_expression(self, **kwargs):
@@ -157,6 +399,414 @@ class Btw(BinaryCondition, metaclass=ABCMeta):
         """
         return ((ds.field(self._key) >= self._value_1) & (ds.field(self._key) <= self._value_2))
 
+    def gen_tuples(self) -> list:
+        return [(self._key, ">=", self._value_1), (self._key, "<=", self._value_2)]
+
+    def negate(self):
+        return Or(Lt(self._key, self._value_1), Gt(self._key, self._value_2))
+
+    def matches(self, value) -> bool:
+        return self._value_1 <= value <= self._value_2
+
+    def may_match(self, minimum, maximum) -> bool:
+        return _within(minimum, maximum, self._value_1, self._value_2)
+
+    def must_match(self, minimum, maximum) -> bool:
+        return _covers(minimum, maximum, self._value_1, self._value_2)
+
+
+class In(UnaryCondition, metaclass=ABCMeta):
+    def __init__(self, key, values):
+        """
+        :param key: Name of the field
+        :param values: Iterable of the values matched, sorted and deduplicated
+        """
+        values = list(values)
+
+        try:
+            values = sorted(set(values))
+            self._sorted = True
+        except TypeError:
+            # not comparable, keep the first occurrence of each value
+            values = list(dict.fromkeys(values))
+            self._sorted = False
+
+        super().__init__(key, tuple(values))
+        self._values_set = frozenset(values)
+
+    _pruned_by_pyarrow = False
+
+    @property
+    def values(self) -> tuple:
+        return self._value_1
+
+    def gen_expression(self, **kwargs):
+        """
+        Definition for getting the operation expression for the IN operator. The bounds of the sorted values let
+        pyarrow skip the row groups and fragments from their statistics, the rows are filtered with a hashed
+        is_in kernel.
+        Returns
+        -------
+        :return: condition : Expression
+        """
+        if len(self._value_1) == 0:
+            return ds.scalar(False)
+
+        expression = ds.field(self._key).isin(self._value_1)
+
+        if self._sorted:
+            expression = ((ds.field(self._key) >= self._value_1[0]) & (ds.field(self._key) <= self._value_1[-1])
+                          & expression)
+
+        return expression
+
+    def gen_tuples(self) -> list:
+        return [(self._key, "in", list(self._value_1))]
+
+    def negate(self):
+        return NotIn(self._key, self._value_1)
+
+    def matches(self, value) -> bool:
+        return value in self._values_set
+
+    def probe_values(self):
+        return self._value_1
+
+    def may_match(self, minimum, maximum) -> bool:
+        if not self._sorted or minimum is None or maximum is None:
+            return True
+
+        try:
+            index = bisect.bisect_left(self._value_1, minimum)
+            return index < len(self._value_1) and self._value_1[index] <= maximum
+        except TypeError:
+            return True
+
+    def must_match(self, minimum, maximum) -> bool:
+        try:
+            return minimum is not None and minimum == maximum and self.matches(minimum)
+        except TypeError:
+            return False
+
+
+class NotIn(In, metaclass=ABCMeta):
+    def gen_expression(self, **kwargs):
+        """
+        Definition for getting the operation expression for the NOT IN operator, null values do not match
+        Returns
+        -------
+        :return: condition : Expression
+        """
+        return ds.field(self._key).is_valid() & ~ds.field(self._key).isin(self._value_1)
+
+    def gen_tuples(self) -> list:
+        return [(self._key, "not in", list(self._value_1))]
+
+    def negate(self):
+        return In(self._key, self._value_1)
+
+    def matches(self, value) -> bool:
+        return value not in self._values_set
+
+    # any row group may hold values out of the list
+    _pruned_by_pyarrow = True
+    may_match = Condition.may_match
+
+    def must_match(self, minimum, maximum) -> bool:
+        # no value of the list falls within [minimum, maximum]
+        return minimum is not None and maximum is not None and not In.may_match(self, minimum, maximum)
+
+    def probe_values(self):
+        return None
+
+
+class BooleanCondition(Condition, metaclass=ABCMeta):
+    def __init__(self, *conditions: Condition):
+        """
+        :param conditions: Conditions combined by the operator
+        """
+        if len(conditions) == 0:
+            raise ValueError("At least one condition is required.")
+
+        super().__init__(key=None, value_1=None)
+        self._conditions = list(conditions)
+
+    @property
+    def conditions(self) -> list:
+        return self._conditions
+
+    def gen_expression(self, **kwargs):
+        """
+        Definition for getting the expression of the simplified disjunctive normal form of the condition
+        Returns
+        -------
+        :return: condition : Expression
+        """
+        return _cached(_compile_expression, self)
+
+    def _arguments(self) -> tuple:
+        return tuple(self._conditions)
+
+    def _identity(self) -> tuple:
+        return type(self), tuple(self._conditions)
+
+
+class And(BooleanCondition, metaclass=ABCMeta):
+    def to_dnf(self) -> list:
+        # distribute the conjunction over the disjunctions of each operand
+        dnf = [[]]
+
+        for condition in self._conditions:
+            dnf = [conjunction + other for conjunction in dnf for other in condition.to_dnf()]
+
+        return dnf
+
+    def negate(self):
+        return Or(*[condition.negate() for condition in self._conditions])
+
+
+class Or(BooleanCondition, metaclass=ABCMeta):
+    def to_dnf(self) -> list:
+        return [conjunction for condition in self._conditions for conjunction in condition.to_dnf()]
+
+    def negate(self):
+        return And(*[condition.negate() for condition in self._conditions])
+
+
+class Not(BooleanCondition, metaclass=ABCMeta):
+    def __init__(self, condition: Condition):
+        """
+        :param condition: Condition negated
+        """
+        super().__init__(condition)
+
+    def to_dnf(self) -> list:
+        # push the negation down to the literals (De Morgan)
+        return self._conditions[0].negate().to_dnf()
+
+    def negate(self):
+        return self._conditions[0]
+
+
+def _within(minimum, maximum, lower, upper) -> bool:
+    """
+    :return: whether [minimum, maximum] and [lower, upper] overlap, True when unknown or not comparable
+    """
+    if minimum is None or maximum is None:
+        return True
+
+    try:
+        return minimum <= upper and lower <= maximum
+    except TypeError:
+        return True
+
+
+def _covers(minimum, maximum, lower, upper) -> bool:
+    """
+    :return: whether [minimum, maximum] is within [lower, upper], False when unknown or not comparable
+    """
+    if minimum is None or maximum is None:
+        return False
+
+    try:
+        return lower <= minimum and maximum <= upper
+    except TypeError:
+        return False
+
+
+def _fold_ranges(ranges: list):
+    """
+    :return: (lower, upper) bounds of the interval matched by all the ranges, each a (value, inclusive) tuple or None
+        when unbounded, None when the interval is empty
+    """
+    lower = upper = None
+
+    for literal in ranges:
+        if isinstance(literal, Btw):
+            new_lower, new_upper = (literal._value_1, True), (literal._value_2, True)
+        elif isinstance(literal, Gt):
+            new_lower, new_upper = (literal._value_1, literal._equals), None
+        else:
+            new_lower, new_upper = None, (literal._value_1, literal._equals)
+
+        # an exclusive bound is tighter than an inclusive one on the same value
+        if new_lower is not None and (lower is None or new_lower[0] > lower[0]
+                                      or (new_lower[0] == lower[0] and not new_lower[1])):
+            lower = new_lower
+        if new_upper is not None and (upper is None or new_upper[0] < upper[0]
+                                      or (new_upper[0] == upper[0] and not new_upper[1])):
+            upper = new_upper
+
+    if lower is not None and upper is not None:
+        if lower[0] > upper[0] or (lower[0] == upper[0] and not (lower[1] and upper[1])):
+            return None
+
+    return lower, upper
+
+
+def _interval_literals(key, lower, upper) -> list:
+    """
+    :return: the minimal literals matching the interval
+    """
+    if lower is not None and upper is not None and lower[1] and upper[1]:
+        return [Eq(key, lower[0])] if lower[0] == upper[0] else [Btw(key, lower[0], upper[0])]
+
+    literals = []
+
+    if lower is not None:
+        literals.append(Gt(key, lower[0], equals=lower[1]))
+    if upper is not None:
+        literals.append(Lt(key, upper[0], equals=upper[1]))
+
+    return literals
+
+
+def _simplify_field(key, literals: list):
+    """
+    :return: the minimal literals on a field equivalent to the conjunction of literals, None when it never matches
+    """
+    ranges = [literal for literal in literals if type(literal) in (Gt, Lt, Btw)]
+    others = [literal for literal in literals if type(literal) not in (Gt, Lt, Btw)]
+
+    try:
+        interval = _fold_ranges(ranges)
+
+        if interval is None:
+            return None
+
+        ranges = _interval_literals(key, *interval)
+        literals = ranges + others
+
+        # equalities and memberships restrict the field to a set of values, the other literals filter them
+        values = None
+
+        for literal in literals:
+            if type(literal) in (Eq, In):
+                literal_values = {literal._value_1} if type(literal) is Eq else set(literal.values)
+                values = literal_values if values is None else values & literal_values
+
+        if values is not None:
+            values = [value for value in values
+                      if all(literal.matches(value) for literal in literals if type(literal) not in (Eq, In))]
+
+            if len(values) == 0:
+                return None
+
+            return [Eq(key, values[0])] if len(values) == 1 else [In(key, values)]
+
+        # exclusions out of the interval are implied by it
+        return ranges + [literal for literal in others
+                         if type(literal) not in (Neq, NotIn)
+                         or any(all(range_literal.matches(value) for range_literal in ranges)
+                                for value in ([literal._value_1] if type(literal) is Neq else literal.values))]
+    except (TypeError, NotImplementedError):
+        # values that can not be compared, or literals unknown to the simplifier
+        return literals
+
+
+def _typed(value):
+    """
+    :return: the value tagged with its type, and each element of a list, tuple or set value with its own type
+    """
+    if isinstance(value, list):
+        return list, [_typed(element) for element in value]
+    if isinstance(value, tuple):
+        return tuple, tuple(_typed(element) for element in value)
+    if isinstance(value, (set, frozenset)):
+        return type(value), type(value)(_typed(element) for element in value)
+
+    return type(value), value
+
+
+def _unique(items: list) -> list:
+    """
+    :return: the items without duplicates in their order, compared one by one when some are unhashable
+    """
+    try:
+        return list(dict.fromkeys(items))
+    except TypeError:
+        unique = []
+
+        for item in items:
+            if item not in unique:
+                unique.append(item)
+
+        return unique
+
+
+def _simplify_conjunction(conjunction: list):
+    """
+    :return: the conjunction without duplicated nor redundant literals and with a single interval per field,
+        None when it never matches
+    """
+    literals_by_key = {}
+
+    for literal in _unique(conjunction):
+        literals_by_key.setdefault(literal._key, []).append(literal)
+
+    simplified = []
+
+    for key, literals in literals_by_key.items():
+        literals = _simplify_field(key, literals)
+
+        if literals is None:
+            return None
+
+        simplified.extend(literals)
+
+    return simplified
+
+
+def _simplify_dnf(dnf: list) -> list:
+    """
+    Remove the conjunctions that never match, the duplicated ones and the ones absorbed by a more general one
+
+    :param dnf: List[List[Condition]]
+    :return: simplified dnf
+    """
+    conjunctions = [conjunction for conjunction in map(_simplify_conjunction, dnf) if conjunction is not None]
+
+    try:
+        literal_sets = [set(conjunction) for conjunction in conjunctions]
+    except TypeError:
+        # literals holding unhashable values, only the duplicated conjunctions are removed
+        return _unique(conjunctions)
+
+    unique = []
+    unique_sets = []
+
+    for conjunction, literals in zip(conjunctions, literal_sets):
+        if literals not in unique_sets:
+            unique.append(conjunction)
+            unique_sets.append(literals)
+
+    return [conjunction for conjunction, literals in zip(unique, unique_sets)
+            if not any(other < literals for other in unique_sets)]
+
+
+@lru_cache(maxsize=256)
+def _compile_dnf(condition: Condition) -> tuple:
+    return tuple(tuple(conjunction) for conjunction in _simplify_dnf(condition.to_dnf()))
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(condition: Condition) -> ds.Expression:
+    dnf = condition.dnf()
+
+    if len(dnf) == 0:
+        return ds.scalar(False)
+
+    return reduce(operator.or_, [reduce(operator.and_, [literal.gen_expression() for literal in conjunction])
+                                 for conjunction in dnf])
+
+
+def _cached(compile_function, condition: Condition):
+    try:
+        return compile_function(condition)
+    except TypeError:
+        # a condition holding unhashable values is compiled every time
+        return compile_function.__wrapped__(condition)
+
 
 class ConditionFactory:
     @staticmethod
@@ -164,7 +814,7 @@ class ConditionFactory:
         """
         :param condition_name: Literal value representing the condition to be instanced
         :param key: Name of the field
-        :param value_1: Value of the field1
+        :param value_1: Value of the field1, an iterable of values for the in and not_in conditions
         :param value_2: Value od the field2 only valid for the btw condition
         :return:
         """
@@ -183,10 +833,42 @@ class ConditionFactory:
             condition = Gt(key, value_1, equals=True)
         elif condition_name == "btw":
             condition = Btw(key, value_1, value_2)
+        elif condition_name == "in":
+            condition = In(key, value_1)
+        elif condition_name == "not_in":
+            condition = NotIn(key, value_1)
         else:
-            raise ValueError("type should be one of: ['eq', 'neq', 'lt', 'lte', 'gt', 'gte', 'btw'].")
+            raise ValueError("type should be one of: ['eq', 'neq', 'lt', 'lte', 'gt', 'gte', 'btw', 'in', "
+                             "'not_in'].")
         return condition
 
+    @staticmethod
+    def from_filters(filters) -> Condition:
+        """
+        :param filters: List[Tuple] or List[List[Tuple]], the filters in disjunctive normal form
+        :return: the equivalent condition
+        """
+        operators = {"=": "eq", "==": "eq", "!=": "neq", "<": "lt", "<=": "lte", ">": "gt", ">=": "gte",
+                     "in": "in", "not in": "not_in"}
+
+        if len(filters) > 0 and not isinstance(filters[0], list):
+            filters = [filters]
+
+        conjunctions = []
+
+        for conjunction in filters:
+            literals = []
+
+            for key, operator_name, value in conjunction:
+                if operator_name not in operators:
+                    raise ValueError(f"Unsupported filter operator '{operator_name}'")
+
+                literals.append(ConditionFactory.get_condition(operators[operator_name], key, value, None))
+
+            conjunctions.append(And(*literals))
+
+        return Or(*conjunctions)
+
 
 class WriteOptions(metaclass=ABCMeta):
     def __init__(self,
@@ -212,7 +894,15 @@ class ParquetWriteOptions(WriteOptions, metaclass=ABCMeta):
     def __init__(self,
                  partitions: list[str],
                  compression_codec: str,
-                 existing_data_behavior: str):
+                 existing_data_behavior: str,
+                 write_metadata: bool = False):
+        """
+        :param partitions: Names of the partition columns
+        :param compression_codec: Compression codec of the data files
+        :param existing_data_behavior: One of 'error', 'overwrite_or_ignore' or 'delete_matching'
+        :param write_metadata: Write the _metadata and _common_metadata summary files next to the data files,
+            letting the reads open the dataset without listing it nor reading every footer. Default False
+        """
         super().__init__(partitions=partitions, compression_codec=compression_codec)
 
         if existing_data_behavior not in ['error', 'overwrite_or_ignore', 'delete_matching']:
@@ -220,6 +910,11 @@ class ParquetWriteOptions(WriteOptions, metaclass=ABCMeta):
                              "'delete_matching'].")
 
         self._existing_data_behavior = existing_data_behavior
+        self._write_metadata = write_metadata
+
+    @property
+    def write_metadata(self) -> bool:
+        return self._write_metadata
 
     def existing_data_behavior(self):
         return self._existing_data_behavior
@@ -241,40 +936,407 @@ class DeltaLakeWriteOptions(WriteOptions, metaclass=ABCMeta):
         return self._existing_data_behavior
 
 
-class AbstractStorage(metaclass=ABCMeta):
-    def __init__(self):
-        self._logger = logging.getLogger('cloud_arrow')
-
-    def _validate_format(self, file_format):
-        if file_format not in ["parquet", "deltalake"]:
-            error_msg = f"The file_format must be one of: 'parquet', 'deltalake'"
-            self._logger.error(error_msg)
-            raise ValueError(error_msg)
-
-    @staticmethod
-    def _normalize_path(path) -> str:
+class ScanOptions:
+    def __init__(self,
+                 batch_readahead: int = None,
+                 fragment_readahead: int = None,
+                 use_threads: bool = None,
+                 memory_pool: pa.MemoryPool = None,
+                 prefetch_batches: int = None,
+                 prefetch_bytes: int = None,
+                 target_batch_bytes: int = None,
+                 min_batch_rows: int = None):
         """
-
-        :param path:
-        :return:
+        Options of the scans run by the read methods. The options left to None take the defaults of the storage:
+        the pyarrow ones for the local filesystem, 8 files read ahead for ADLS, GCS and S3.
+
+        :param batch_readahead: Number of record batches read ahead in each file, pyarrow default 16. Higher values
+            keep more requests in flight on high latency object stores, lower values use less memory
+        :param fragment_readahead: Number of files read ahead, pyarrow default 4
+        :param use_threads: Read and decode on the pyarrow thread pools, default True. False scans in the calling
+            thread, one batch at a time
+        :param memory_pool: pyarrow MemoryPool allocating the data read, default None uses the default pool. The
+            pool must outlive the tables and batches read
+        :param prefetch_batches: Maximum number of record batches read ahead of the consumer of read_batches(),
+            read_changes() and read_new_batches() by a background thread, so the reads overlap with the work done
+            on each batch. Default None reads the batches when the consumer asks for them
+        :param prefetch_bytes: Maximum size in bytes of the record batches read ahead of the consumer, default None
+        :param target_batch_bytes: Size in bytes of the record batches returned by read_batches(), read_changes()
+            and read_new_batches(). The small batches of small files and row groups are concatenated and the larger
+            ones sliced, zero-copy, to about this size. Default None returns the batches as scanned
+        :param min_batch_rows: Minimum number of rows of the record batches returned, small batches are
+            concatenated until they hold as many rows. Only the last batch may be smaller. Default None
         """
-        if path is None or path == "":
-            raise "The path argument can not be empty"
+        for name, value in [("batch_readahead", batch_readahead), ("fragment_readahead", fragment_readahead)]:
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be greater or equal to 0")
+
+        for name, value in [("prefetch_batches", prefetch_batches), ("prefetch_bytes", prefetch_bytes),
+                            ("target_batch_bytes", target_batch_bytes), ("min_batch_rows", min_batch_rows)]:
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be greater than 0")
+
+        self._batch_readahead = batch_readahead
+        self._fragment_readahead = fragment_readahead
+        self._use_threads = use_threads
+        self._memory_pool = memory_pool
+        self._prefetch_batches = prefetch_batches
+        self._prefetch_bytes = prefetch_bytes
+        self._target_batch_bytes = target_batch_bytes
+        self._min_batch_rows = min_batch_rows
 
-        return path[:-1] if path.endswith("/") else path
+    @property
+    def batch_readahead(self) -> int:
+        return self._batch_readahead
 
-    @abstractmethod
-    def _get_filesystem_base_path(self, path) -> str:
-        pass
+    @property
+    def fragment_readahead(self) -> int:
+        return self._fragment_readahead
 
-    @abstractmethod
-    def _get_filesystem(self) -> Any:
-        """
+    @property
+    def use_threads(self) -> bool:
+        return self._use_threads
+
+    @property
+    def memory_pool(self) -> pa.MemoryPool:
+        return self._memory_pool
+
+    @property
+    def prefetch_batches(self) -> int:
+        return self._prefetch_batches
+
+    @property
+    def prefetch_bytes(self) -> int:
+        return self._prefetch_bytes
+
+    @property
+    def prefetch(self) -> bool:
+        return self._prefetch_batches is not None or self._prefetch_bytes is not None
+
+    @property
+    def target_batch_bytes(self) -> int:
+        return self._target_batch_bytes
+
+    @property
+    def min_batch_rows(self) -> int:
+        return self._min_batch_rows
+
+    @property
+    def coalesce(self) -> bool:
+        return self._target_batch_bytes is not None or self._min_batch_rows is not None
+
+    def to_dict(self) -> dict:
+        """
+        :return: keyword arguments of the pyarrow scanner for the options set, the prefetch and batch size
+            options are not scanner options
+        """
+        return {name: value for name, value in [
+            ("batch_readahead", self._batch_readahead),
+            ("fragment_readahead", self._fragment_readahead),
+            ("use_threads", self._use_threads),
+            ("memory_pool", self._memory_pool)
+        ] if value is not None}
+
+
+class PandasOptions:
+    def __init__(self,
+                 self_destruct: bool = False,
+                 arrow_strings: bool = False,
+                 categorical_partitions: bool = False):
+        """
+        Options of the conversion of the arrow table read by read_to_pandas() to a pandas dataframe
+
+        :param self_destruct: Release the arrow buffers of each column as soon as it is converted, the dataframe
+            gets one block per column. The peak memory stays close to the size of the data instead of twice it.
+            Default False
+        :param arrow_strings: Keep the string columns in arrow memory as pd.ArrowDtype columns instead of
+            converting them to python str objects. Default False
+        :param categorical_partitions: Return the partition columns as pandas Categorical instead of repeating
+            their value on every row, dictionary encoded columns always are Categorical. Default False
+        """
+        self._self_destruct = self_destruct
+        self._arrow_strings = arrow_strings
+        self._categorical_partitions = categorical_partitions
+
+    @staticmethod
+    def lean():
+        """
+        :return: PandasOptions converting with the least memory, every option enabled
+        """
+        return PandasOptions(self_destruct=True, arrow_strings=True, categorical_partitions=True)
+
+    @property
+    def self_destruct(self) -> bool:
+        return self._self_destruct
+
+    @property
+    def arrow_strings(self) -> bool:
+        return self._arrow_strings
+
+    @property
+    def categorical_partitions(self) -> bool:
+        return self._categorical_partitions
+
+    def to_dict(self) -> dict:
+        """
+        :return: keyword arguments of pyarrow.Table.to_pandas()
+        """
+        arguments = {}
+
+        if self._self_destruct:
+            arguments.update(self_destruct=True, split_blocks=True)
+
+        if self._arrow_strings:
+            arguments.update(types_mapper=_arrow_string_dtype)
+
+        return arguments
+
+
+def _arrow_string_dtype(data_type: pa.DataType):
+    if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+        return pd.ArrowDtype(data_type)
+
+    return None
+
+
+class AbstractStorage(metaclass=ABCMeta):
+    def __init__(self,
+                 dataset_cache: DatasetCache = None,
+                 block_cache: BlockCache = None,
+                 metadata_cache: MetadataCache = None,
+                 snapshot_cache: SnapshotCache = None):
+        """
+        :param dataset_cache: Cache for the discovered datasets, default None discovers the dataset on every read
+        :param block_cache: Local cache for the blocks read from the storage, default None
+        :param metadata_cache: Cache for the parquet footers, can be shared by several storages, default None
+        :param snapshot_cache: Cache for the opened delta tables, default None replays the delta log on every read
+        """
+        self._logger = logging.getLogger('cloud_arrow')
+        self._client = None
+        self._filesystem = None
+        self._filesystem_lock = threading.Lock()
+        self._dataset_cache = dataset_cache
+        self._block_cache = block_cache
+        self._metadata_cache = metadata_cache
+        self._snapshot_cache = snapshot_cache
+        # row group statistics and sidecar index, kept as long as the dataset they were read for
+        self._dataset_states = weakref.WeakKeyDictionary()
+        self._dataset_states_lock = threading.Lock()
+        # (dataset path, file name) of the sidecar files found missing, not looked up again until invalidated
+        self._missing_sidecar_files = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _validate_format(self, file_format):
+        if file_format not in ["parquet", "deltalake"]:
+            error_msg = f"The file_format must be one of: 'parquet', 'deltalake'"
+            self._logger.error(error_msg)
+            raise ValueError(error_msg)
+
+    @staticmethod
+    def _normalize_path(path) -> str:
+        """
+
+        :param path:
+        :return:
+        """
+        if path is None or path == "":
+            raise "The path argument can not be empty"
+
+        return path[:-1] if path.endswith("/") else path
+
+    @staticmethod
+    def _projection(schema: pa.Schema, columns):
+        """
+        Translate the columns argument of the read methods to the scanner projection
+
+        :param schema: Schema of the dataset
+        :param columns: list of str or dict of str to Expression
+        :return: list of str or dict of str to Expression, None when every column is read
+        """
+        if columns is None or isinstance(columns, dict):
+            return columns
+
+        columns = list(columns)
+        nested = [column for column in columns if column not in schema.names and "." in column]
+
+        if not nested:
+            return columns
+
+        # a dotted name that is not a top-level column refers to a nested struct field
+        return {column: ds.field(*column.split(".")) if column in nested else ds.field(column)
+                for column in columns}
+
+    @abstractmethod
+    def _get_filesystem_base_path(self, path) -> str:
+        pass
+
+    @abstractmethod
+    def _create_filesystem(self) -> Any:
+        """
+        Build a new filesystem client for the storage. Called once per client lifetime by _get_filesystem()
 
         :return: fsspec or pyarrow filesystem, default None
         """
         pass
 
+    def _close_filesystem(self, filesystem):
+        """
+        Release the connections held by a filesystem client created by _create_filesystem()
+
+        :param filesystem: fsspec or pyarrow filesystem
+        """
+        pass
+
+    def _get_filesystem(self) -> Any:
+        """
+        Return the filesystem client of the storage, creating it on first use. The same client (and its
+        credentials, http session and connection pool) is shared by every read and write until close()
+        or refresh_credentials() is called.
+
+        When a block or metadata cache is configured the client is wrapped so that reads are served through it.
+
+        :return: fsspec or pyarrow filesystem, default None
+        """
+        filesystem = self._filesystem
+
+        if filesystem is None:
+            _, filesystem = self._open_filesystem()
+
+        return filesystem
+
+    def _get_client(self) -> Any:
+        """
+        :return: the filesystem client without the cache wrappers, whose listings hold the object versions
+        """
+        client, _ = self._open_filesystem()
+        return client
+
+    def _open_filesystem(self):
+        with self._filesystem_lock:
+            if self._filesystem is None:
+                self._logger.debug(f"Creating filesystem client for {type(self).__name__}")
+                self._client = self._create_filesystem()
+                self._filesystem = self._wrap_filesystem(self._client)
+
+            return self._client, self._filesystem
+
+    def _wrap_filesystem(self, filesystem):
+        # the footers are looked up in memory first, then the blocks on the local disk
+        if self._block_cache is not None:
+            filesystem = self._block_cache.wrap(filesystem)
+
+        if self._metadata_cache is not None:
+            filesystem = self._metadata_cache.wrap(filesystem)
+
+        return filesystem
+
+    def _release_filesystem(self):
+        with self._filesystem_lock:
+            client = self._client
+            self._client = None
+            self._filesystem = None
+
+        if client is not None:
+            # the cached datasets hold a reference to the released client
+            self.invalidate()
+            self._close_filesystem(client)
+
+    def refresh_credentials(self):
+        """
+        Discard the cached filesystem client, the next read or write creates a new one with fresh credentials.
+        """
+        self._release_filesystem()
+
+    def close(self):
+        """
+        Close the cached filesystem client and release its connections. The storage can still be used
+        afterwards, a new client is created on the next read or write.
+        """
+        self._release_filesystem()
+
+    @property
+    def dataset_cache(self) -> DatasetCache:
+        return self._dataset_cache
+
+    @property
+    def block_cache(self) -> BlockCache:
+        return self._block_cache
+
+    @property
+    def metadata_cache(self) -> MetadataCache:
+        return self._metadata_cache
+
+    @property
+    def snapshot_cache(self) -> SnapshotCache:
+        return self._snapshot_cache
+
+    def invalidate(self, path: str = None):
+        """
+        Remove the datasets and delta tables cached for a path, forcing the next read to discover the dataset again.
+        The sidecar files found missing are looked up again, e.g. an index built by another process.
+        Writes made through this storage object invalidate the written path automatically.
+
+        :param path: str, default None invalidates every cached dataset
+        """
+        path = None if path is None else AbstractStorage._normalize_path(path)
+
+        if self._dataset_cache is not None:
+            self._dataset_cache.invalidate(path)
+
+        if self._snapshot_cache is not None:
+            self._snapshot_cache.invalidate(None if path is None else self._get_deltalake_url(path=path))
+
+        for key in list(self._missing_sidecar_files):
+            if path is None or _overlaps(key[0], path):
+                self._missing_sidecar_files.discard(key)
+
+    def _get_parquet_file_format(self) -> ds.ParquetFileFormat:
+        """
+        :return: ParquetFileFormat used to read the parquet datasets
+        """
+        return ds.ParquetFileFormat()
+
+    def _get_scan_options(self) -> ScanOptions:
+        """
+        :return: ScanOptions used by the reads when not given, default the pyarrow defaults
+        """
+        return ScanOptions()
+
+    def _scan_arguments(self, scan_options: ScanOptions = None) -> dict:
+        """
+        :return: keyword arguments of the pyarrow scanner, the options not set in scan_options take the defaults
+            of the storage
+        """
+        arguments = self._get_scan_options().to_dict()
+
+        if scan_options is not None:
+            arguments.update(scan_options.to_dict())
+
+        return arguments
+
+    @staticmethod
+    def _consumer_batches(record_batches, scan_options: ScanOptions = None):
+        """
+        :return: the record batches resized and read ahead by a background thread when scan_options asks for it
+        """
+        if scan_options is None:
+            return record_batches
+
+        if scan_options.coalesce:
+            record_batches = _coalesce_batches(record_batches, target_bytes=scan_options.target_batch_bytes,
+                                               min_rows=scan_options.min_batch_rows)
+
+        if scan_options.prefetch:
+            record_batches = PrefetchIterator(record_batches, max_batches=scan_options.prefetch_batches,
+                                              max_bytes=scan_options.prefetch_bytes)
+
+        return record_batches
+
     @abstractmethod
     def _get_deltalake_storage_options(self):
         pass
@@ -286,7 +1348,9 @@ class AbstractStorage(metaclass=ABCMeta):
     def dataset(self,
                 file_format: str,
                 path: str,
-                partitioning: str = "hive") -> ds.Dataset:
+                partitioning: str = "hive",
+                filters=None,
+                version: int = None) -> ds.Dataset:
         """
         Open a dataset.
 
@@ -308,32 +1372,331 @@ class AbstractStorage(metaclass=ABCMeta):
             The partitioning scheme specified with the ``partitioning()``
             function. A flavor string can be used as shortcut, and with a list of
             field names a DirectionaryPartitioning will be inferred.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Delta tables keep only the data files that may hold matching rows, according to the partition
+            values and the min/max/null count statistics of the transaction log. With a Condition holding In
+            literals, only the row groups whose statistics may hold one of the values are kept. The rows are not
+            filtered.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
         :return:
         -------
         dataset : Dataset
             pyarrow.Dataset
         """
         self._validate_format(file_format=file_format)
+
+        if version is not None and file_format != "deltalake":
+            raise ValueError("version is only supported for the 'deltalake' format")
+
+        if self._dataset_cache is None:
+            dataset = self._discover_dataset(file_format=file_format, path=path, partitioning=partitioning,
+                                             filters=filters, version=version)
+        else:
+            key = DatasetCache.make_key(file_format, AbstractStorage._normalize_path(path), partitioning, version)
+            dataset = None if key is None else self._dataset_cache.get(key)
+
+            if dataset is None:
+                dataset = self._discover_dataset(file_format=file_format, path=path, partitioning=partitioning,
+                                                 version=version)
+
+                if key is not None:
+                    self._dataset_cache.put(key, dataset)
+
+        if isinstance(filters, Condition) and filters.never_matches():
+            # a contradiction, no data file is read
+            return ds.FileSystemDataset([], dataset.schema, dataset.format, dataset.filesystem)
+
+        with self._dataset_states_lock:
+            state = self._dataset_states.setdefault(dataset, _DatasetState())
+
+        if file_format == "deltalake" and filters is not None:
+            dataset = self._skip_files(dataset, AbstractStorage._filter_expression(filters))
+
+        condition = AbstractStorage._filter_condition(filters)
+
+        if condition is not None:
+            if state.index is _NOT_LOADED:
+                state.index = self._read_index(path=path)
+
+            dataset = self._skip_row_groups(dataset, condition, state.statistics, state.index,
+                                            self._get_filesystem_base_path(path=path),
+                                            AbstractStorage._filter_expression(filters))
+
+        return dataset
+
+    def _skip_row_groups(self, dataset: ds.FileSystemDataset, condition: Condition, statistics: dict = None,
+                         index: DatasetIndex = None, base_dir: str = None,
+                         expression: ds.Expression = None) -> ds.FileSystemDataset:
+        """
+        Keep the files and row groups that may satisfy the condition according to the sidecar index, then the row
+        groups whose statistics may satisfy the literals pyarrow can not evaluate against them, such as the values
+        of an In condition falling between the minimum and maximum of a row group.
+
+        The files dropped by the index are not opened. The footers of the files missing from the index are read
+        only when the condition holds literals pyarrow can not evaluate, FOOTER_READAHEAD at a time.
+
+        :param statistics: dict caching the row group statistics by file and column, reused by the next passes
+            over the same dataset
+        :param index: DatasetIndex of the dataset, default None
+        :param base_dir: Root of the dataset in the filesystem, the index is keyed by the paths relative to it
+        :param expression: Filter expression pruning the partitions, default the expression of the condition
+        """
+        dnf = condition.dnf()
+        read_statistics = any(not literal._pruned_by_pyarrow for conjunction in dnf for literal in conjunction)
+
+        if index is None and not read_statistics:
+            return dataset
+
+        if statistics is None:
+            statistics = {}
+
+        indexed = {} if index is None else index.prune(dnf)
+        columns = {literal._key for conjunction in dnf for literal in conjunction}
+
+        def may_match(row_group):
+            return any(all(literal.may_match(*row_group[literal._key][:2])
+                           for literal in conjunction if row_group.get(literal._key) is not None)
+                       for conjunction in dnf)
+
+        fragments = []
+        files = 0
+        row_groups = 0
+
+        if expression is None:
+            expression = condition.gen_expression()
+
+        # the partitions are pruned first, the footers of the skipped files are not read
+        candidates = list(dataset.get_fragments(filter=expression))
+
+        if read_statistics:
+            _read_footers([fragment for fragment in candidates
+                           if _relative_path(fragment.path, base_dir) not in indexed
+                           and any((fragment.path, column) not in statistics for column in columns)])
+
+        for fragment in candidates:
+            file_path = _relative_path(fragment.path, base_dir)
+            row_group_ids = indexed.get(file_path)
+            files += 1
+
+            if row_group_ids is not None:
+                num_row_groups = index.num_row_groups(file_path)
+            elif read_statistics:
+                row_group_ids = [row_group_id for row_group_id, row_group
+                                 in _row_group_statistics(fragment, dataset.schema, columns, statistics)
+                                 if may_match(row_group)]
+                num_row_groups = fragment.num_row_groups
+            else:
+                fragments.append(fragment)
+                continue
+
+            row_groups += num_row_groups
+
+            if len(row_group_ids) == num_row_groups:
+                fragments.append(fragment)
+            elif len(row_group_ids) > 0:
+                fragments.append(fragment.subset(row_group_ids=row_group_ids))
+
+        self._logger.debug(f"Kept {len(fragments)} of {files} files and {row_groups} row groups checked for the "
+                           f"condition {condition}")
+
+        return ds.FileSystemDataset(fragments, dataset.schema, dataset.format, dataset.filesystem)
+
+    def _skip_files(self, dataset: ds.FileSystemDataset, expression: ds.Expression) -> ds.FileSystemDataset:
+        """
+        Keep the fragments whose partition expression, holding the partition values and the file statistics of
+        the delta log, may satisfy the filter. No file is opened.
+        """
+        fragments = list(dataset.get_fragments(filter=expression))
+
+        self._logger.debug(f"Skipped {len(dataset.files) - len(fragments)} of {len(dataset.files)} files "
+                           f"for the filter {expression}")
+
+        return ds.FileSystemDataset(fragments, dataset.schema, dataset.format, dataset.filesystem)
+
+    @staticmethod
+    def _filter_expression(filters) -> ds.Expression:
+        """
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]] in disjunctive normal form, or None
+        :return: the filters as an Expression, None when there are no filters
+        """
+        if filters is None or isinstance(filters, ds.Expression):
+            return filters
+
+        if isinstance(filters, Condition):
+            return filters.gen_expression()
+
+        return pq.filters_to_expression(filters)
+
+    @staticmethod
+    def _filter_condition(filters):
+        """
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]] in disjunctive normal form, or None
+        :return: Condition matching at least the rows matching the filters, used to skip files and row groups.
+            None when there are no filters or they are an Expression, which can not be inspected
+        """
+        if isinstance(filters, Condition):
+            return filters
+
+        if not isinstance(filters, list) or len(filters) == 0:
+            return None
+
+        if not isinstance(filters[0], list):
+            filters = [filters]
+
+        # the "not in" tuples keep the null values unlike NotIn, leaving them out only widens the condition
+        filters = [[literal for literal in conjunction if literal[1] != "not in"] for conjunction in filters]
+
+        if any(len(conjunction) == 0 for conjunction in filters):
+            # a conjunction left empty matches every row
+            return None
+
+        return ConditionFactory.from_filters(filters)
+
+    @staticmethod
+    def _delta_partition_filters(filters, partition_columns) -> list:
+        """
+        Translate the equality and membership filters on the partition columns to the partition filters of the
+        delta log, pruning the data files before the fragments are built.
+
+        :param filters: Condition, List[Tuple] or List[List[Tuple]], expressions are not translated
+        :return: list of (column, operator, value) tuples, None when no filter can be translated
+        """
+        if isinstance(filters, Condition):
+            filters = filters.gen_filters()
+
+        if not isinstance(filters, list) or len(filters) == 0:
+            return None
+
+        if isinstance(filters[0], list):
+            # only a single conjunction restricts the files, disjunctions are left to the statistics pruning
+            if len(filters) != 1:
+                return None
+            filters = filters[0]
+
+        operators = {"=": "=", "==": "=", "!=": "!=", "in": "in", "not in": "not in"}
+        partition_filters = []
+
+        for column, operator, value in filters:
+            if column not in partition_columns or operator not in operators:
+                continue
+
+            values = list(value) if operator in ["in", "not in"] else [value]
+
+            # the delta log holds the partition values as strings, str() matches the way they are written only
+            # for str and int values, e.g. not for True written as "true". Other values are left to the expression
+            if not all(isinstance(item, str) or (isinstance(item, int) and not isinstance(item, bool))
+                       for item in values):
+                continue
+
+            if operator in ["in", "not in"]:
+                value = [str(item) for item in values]
+            else:
+                value = str(value)
+
+            partition_filters.append((column, operators[operator], value))
+
+        return partition_filters or None
+
+    def _delta_table(self, path, version=None):
+        """
+        :return: context manager yielding the DeltaTable at path, from the snapshot cache when configured
+        """
+        table_uri = self._get_deltalake_url(path=AbstractStorage._normalize_path(path))
+
+        if self._snapshot_cache is None:
+            return nullcontext(DeltaTable(
+                table_uri=table_uri,
+                version=version,
+                storage_options=self._get_deltalake_storage_options()
+            ))
+
+        return self._snapshot_cache.snapshot(table_uri, version, self._get_deltalake_storage_options())
+
+    def _discover_dataset(self, file_format, path, partitioning, filters=None, version=None) -> ds.Dataset:
         filesystem = self._get_filesystem()
 
         if file_format == "parquet":
+            # a summary file lists every data file with its footer, no listing nor footer reads are needed
+            if self._sidecar_file_exists(path=path, file_name=METADATA_FILE):
+                return ds.parquet_dataset(
+                    metadata_path=f"{self._get_filesystem_base_path(path=path)}/{METADATA_FILE}",
+                    filesystem=filesystem,
+                    format=self._get_parquet_file_format(),
+                    partitioning=partitioning
+                )
+
             return ds.dataset(
                 source=self._get_filesystem_base_path(path=path),
                 filesystem=filesystem,
+                format=self._get_parquet_file_format(),
                 partitioning=partitioning
             )
         elif file_format == "deltalake":
-            return DeltaTable(
-                table_uri=self._get_deltalake_url(path=AbstractStorage._normalize_path(path)),
-                storage_options=self._get_deltalake_storage_options()
-            ).to_pyarrow_dataset()
+            with self._delta_table(path=path, version=version) as delta_table:
+                partitions = AbstractStorage._delta_partition_filters(filters,
+                                                                      delta_table.metadata().partition_columns)
+
+                return self._delta_dataset(delta_table=delta_table, path=path, partitions=partitions)
+
+    def _sidecar_file_exists(self, path, file_name) -> bool:
+        """
+        :return: whether the file, e.g. the summary file, is in the root directory of the dataset at path. A missing
+            file is remembered until the path is invalidated, the datasets without it are not probed on every read
+        """
+        key = (AbstractStorage._normalize_path(path), file_name)
+
+        if key in self._missing_sidecar_files:
+            return False
+
+        file_path = f"{self._get_filesystem_base_path(path=path)}/{file_name}"
+
+        if _as_arrow_filesystem(self._get_filesystem()).get_file_info(file_path).type == FileType.File:
+            return True
+
+        self._missing_sidecar_files.add(key)
+        return False
+
+    def _delta_dataset(self, delta_table: DeltaTable, path, partitions=None) -> ds.FileSystemDataset:
+        if self._block_cache is None and self._metadata_cache is None:
+            return delta_table.to_pyarrow_dataset(partitions=partitions)
+
+        # read the data files through the cached filesystem, rooted at the table directory
+        return delta_table.to_pyarrow_dataset(
+            partitions=partitions,
+            filesystem=SubTreeFileSystem(self._get_filesystem_base_path(path=path), self._get_filesystem())
+        )
+
+    def read_metadata(self, path: str) -> pq.FileMetaData:
+        """
+        Read the metadata (footer) of a parquet file, through the metadata cache when configured.
+
+        Parameters
+        ----------
+        :param path: str
+            Path pointing to a single parquet file.
+        :return:
+            metadata : pyarrow.parquet.FileMetaData
+        """
+        filesystem = self._get_filesystem()
+        file_path = self._get_filesystem_base_path(path=path)
+
+        if self._metadata_cache is None:
+            return pq.read_metadata(file_path, filesystem=filesystem)
+
+        # read through the filesystem wrapped by the metadata cache
+        return self._metadata_cache.metadata(filesystem.handler.fs, file_path)
 
     def read_batches(self,
                      file_format: str,
                      path: str,
                      partitioning: str = "hive",
                      filters=None,
-                     batch_size: int = 1000) -> pa.RecordBatch:
+                     batch_size: int = 1000,
+                     columns=None,
+                     version: int = None,
+                     limit: int = None,
+                     scan_options: ScanOptions = None) -> pa.RecordBatch:
         """
         Read the dataset as materialized record batches.
 
@@ -351,34 +1714,79 @@ class AbstractStorage(metaclass=ABCMeta):
             The partitioning scheme specified with the ``partitioning()``
             function. A flavor string can be used as shortcut, and with a list of
             field names a Dictionary Partitioning will be inferred.
-        :param filters: Expression, default None
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
             Scan will return only the rows matching the filter.
             If possible the predicate will be pushed down to exploit the
             partition information or internal metadata found in the data
             source, e.g. Parquet statistics. Otherwise, filters the loaded
             RecordBatches before yielding them.
         :param batch_size:  int, default 1000
-            The number of batches to read ahead in a file. This might not work
-            for all file formats. Increasing this number will increase
-            RAM usage but could also improve IO utilization.
+            The maximum row count of the record batches. The number of batches
+            read ahead is set by scan_options.
+        :param columns: list of str or dict of str to Expression, default None
+            The columns to read, the remaining columns are neither fetched nor
+            decoded. A list selects columns by name, nested struct fields can
+            be selected with a dotted name, e.g. "address.city". A dict maps
+            the output column names to the expressions computing them.
+            Default None reads all the columns.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param limit: int, default None
+            Maximum number of rows to read, default None reads every row. The files and row groups are then
+            scanned one at a time and the scan stops as soon as enough rows matched the filters.
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
         :return:
             record_batches : iterator of RecordBatch
         """
 
-        return self.dataset(
+        dataset = self.dataset(
             file_format=file_format,
             path=path,
-            partitioning=partitioning
-        ).to_batches(
-            batch_size=batch_size,
-            filter=filters
+            partitioning=partitioning,
+            filters=filters,
+            version=version
+        )
+
+        record_batches = self._scan_batches(dataset=dataset, filters=filters, columns=columns, batch_size=batch_size,
+                                            limit=limit, scan_options=scan_options)
+
+        return AbstractStorage._consumer_batches(record_batches, scan_options)
+
+    def _scan_batches(self, dataset, filters=None, columns=None, batch_size=None, limit=None, scan_options=None):
+        """
+        :return: iterator of the record batches of the dataset matching the filters, see read_batches()
+        """
+        if limit is not None:
+            return _limited_batches(
+                dataset=dataset,
+                limit=limit,
+                columns=AbstractStorage._projection(dataset.schema, columns),
+                expression=AbstractStorage._filter_expression(filters),
+                batch_size=batch_size,
+                scan_arguments=self._scan_arguments(scan_options)
+            )
+
+        scan_arguments = self._scan_arguments(scan_options)
+
+        if batch_size is not None:
+            scan_arguments["batch_size"] = batch_size
+
+        return dataset.to_batches(
+            columns=AbstractStorage._projection(dataset.schema, columns),
+            filter=AbstractStorage._filter_expression(filters),
+            **scan_arguments
         )
 
     def read_to_arrow_table(self,
                             file_format: str,
                             path: str,
                             partitioning: str = "hive",
-                            filters=None) -> pa.Table:
+                            filters=None,
+                            columns=None,
+                            version: int = None,
+                            limit: int = None,
+                            scan_options: ScanOptions = None) -> pa.Table:
         """
         Read the dataset as arrow table.
 
@@ -396,34 +1804,462 @@ class AbstractStorage(metaclass=ABCMeta):
             The partitioning scheme specified with the ``partitioning()``
             function. A flavor string can be used as shortcut, and with a list of
             field names a DirectionaryPartitioning will be inferred.
-        :param filters: Expression, default None
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
             Scan will return only the rows matching the filter.
             If possible the predicate will be pushed down to exploit the
             partition information or internal metadata found in the data
             source, e.g. Parquet statistics. Otherwise filters the loaded
             RecordBatches before yielding them.
+        :param columns: list of str or dict of str to Expression, default None
+            The columns to read, the remaining columns are neither fetched nor
+            decoded. A list selects columns by name, nested struct fields can
+            be selected with a dotted name, e.g. "address.city". A dict maps
+            the output column names to the expressions computing them.
+            Default None reads all the columns.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param limit: int, default None
+            Maximum number of rows to read, default None reads every row. The files and row groups are then
+            scanned one at a time and the scan stops as soon as enough rows matched the filters.
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
         :return:
             table : arrow.Table
         """
 
-        if filters is not None:
-            return self.dataset(
-                file_format=file_format,
-                path=path,
-                partitioning=partitioning
-            ).to_table(filter=filters)
-        else:
-            return self.dataset(
-                file_format=file_format,
-                path=path,
-                partitioning=partitioning
-            ).to_table()
+        dataset = self.dataset(
+            file_format=file_format,
+            path=path,
+            partitioning=partitioning,
+            filters=filters,
+            version=version
+        )
 
-    def read_to_pandas(self,
+        return self._scan_table(dataset=dataset, filters=filters, columns=columns, limit=limit,
+                                scan_options=scan_options)
+
+    def _scan_table(self, dataset, filters=None, columns=None, limit=None, scan_options=None) -> pa.Table:
+        """
+        :return: the rows of the dataset matching the filters as arrow table, see read_to_arrow_table()
+        """
+        if limit is not None:
+            projection = AbstractStorage._projection(dataset.schema, columns)
+            expression = AbstractStorage._filter_expression(filters)
+
+            return pa.Table.from_batches(
+                list(_limited_batches(dataset=dataset, limit=limit, columns=projection, expression=expression,
+                                      scan_arguments=self._scan_arguments(scan_options))),
+                schema=ds.Scanner.from_dataset(dataset, columns=projection, filter=expression).projected_schema
+            )
+
+        return dataset.to_table(
+            columns=AbstractStorage._projection(dataset.schema, columns),
+            filter=AbstractStorage._filter_expression(filters),
+            **self._scan_arguments(scan_options)
+        )
+
+    def lookup(self,
+               file_format: str,
+               path: str,
+               key_column: str,
+               keys,
+               columns=None,
+               partitioning: str = "hive",
+               version: int = None,
+               scan_options: ScanOptions = None) -> pa.Table:
+        """
+        Read the rows whose key is one of the given keys, e.g. a few rows by primary key.
+
+        Only the candidate row groups are read: the partitions and the delta files that can not hold the keys are
+        skipped first, then the row groups whose min/max statistics do not enclose any of the keys. On data sorted
+        by the key column the row group ranges do not overlap and each key hits at most one row group. The
+        candidate row groups are read concurrently.
+
+        With a dataset cache the fragments keep their parsed footers between lookups, with a metadata cache the
+        footers are fetched once per process.
+
+        Parameters
+        ----------
+        :param file_format: str
+            Currently "parquet", "deltalake" supported.
+        :param path: str
+            Path pointing to a single file or to the directory of the dataset.
+        :param key_column: str
+            Column holding the keys.
+        :param keys: iterable of values
+            Keys of the rows to read.
+        :param columns: list of str or dict of str to Expression, default None
+            The columns to read, default None reads all the columns.
+        :param partitioning: Partitioning, PartitioningFactory, str, list of str default "hive"
+            The partitioning scheme of the dataset.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage,
+            reading up to 64 candidate files at once.
+        :return:
+            table : arrow.Table with the matching rows
+        """
+        condition = In(key_column, keys)
+
+        dataset = self.dataset(
+            file_format=file_format,
+            path=path,
+            partitioning=partitioning,
+            filters=condition,
+            version=version
+        )
+
+        fragments = len(dataset.files)
+        self._logger.debug(f"Looking up {len(condition.values)} keys of '{path}' in {fragments} files")
+
+        scan_arguments = self._scan_arguments(scan_options)
+
+        if scan_options is None or scan_options.fragment_readahead is None:
+            # the candidates are few, they are read at once instead of a few files at a time
+            scan_arguments["fragment_readahead"] = min(max(fragments, 1), LOOKUP_READAHEAD)
+
+        return dataset.to_table(
+            columns=AbstractStorage._projection(dataset.schema, columns),
+            filter=condition.gen_expression(),
+            **scan_arguments
+        )
+
+    def read_sample(self,
+                    file_format: str,
+                    path: str,
+                    fraction: float = None,
+                    n_rows: int = None,
+                    seed: int = None,
+                    partitioning: str = "hive",
+                    filters=None,
+                    columns=None,
+                    version: int = None,
+                    scan_options: ScanOptions = None) -> pa.Table:
+        """
+        Read a random sample of the rows matching the filters, reading only the sampled row groups.
+
+        The row groups are drawn at random without replacement, weighted by their row counts from the footers, and
+        only the drawn ones are read. The rows are then sampled uniformly among the rows read, the I/O scales with
+        the size of the sample rather than the size of the dataset. The rows of a row group are sampled together, a
+        sample from data clustered by some column is less diverse than a sample of independent rows.
+
+        Parameters
+        ----------
+        :param file_format: str
+            Currently "parquet", "deltalake" supported.
+        :param path: str
+            Path pointing to a single file or to the directory of the dataset.
+        :param fraction: float, default None
+            Fraction of the rows to sample, in (0, 1]. Exactly one of fraction and n_rows must be given.
+        :param n_rows: int, default None
+            Number of rows to sample, fewer when fewer rows match the filters.
+        :param seed: int, default None
+            Seed of the random generator, the same seed samples the same rows of an unchanged dataset.
+        :param partitioning: Partitioning, PartitioningFactory, str, list of str default "hive"
+            The partitioning scheme of the dataset.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Only the rows matching the filter are sampled.
+        :param columns: list of str or dict of str to Expression, default None
+            The columns to read, default None reads all the columns.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :return:
+            table : arrow.Table with the sampled rows, in the order of the dataset within each row group
+        """
+        if (fraction is None) == (n_rows is None):
+            raise ValueError("Exactly one of fraction and n_rows must be given")
+
+        if fraction is not None and not 0 < fraction <= 1:
+            raise ValueError("fraction must be greater than 0 and less or equal to 1")
+
+        if n_rows is not None and n_rows < 0:
+            raise ValueError("n_rows must be greater or equal to 0")
+
+        dataset = self.dataset(
+            file_format=file_format,
+            path=path,
+            partitioning=partitioning,
+            filters=filters,
+            version=version
+        )
+
+        projection = AbstractStorage._projection(dataset.schema, columns)
+        expression = AbstractStorage._filter_expression(filters)
+        rng = np.random.default_rng(seed)
+
+        # the partitions not matching the filters are left out before reading the footers
+        row_groups = [(fragment, row_group.id, row_group.num_rows)
+                      for fragment in dataset.get_fragments(filter=expression)
+                      for row_group in fragment.row_groups if row_group.num_rows > 0]
+        num_rows = np.array([row_group[2] for row_group in row_groups], dtype=float)
+
+        # weighted sampling without replacement: the row groups sorted by log(u) / weight, largest first
+        order = np.argsort(-np.log(rng.random(len(row_groups))) / num_rows) if row_groups else []
+
+        def read(positions):
+            selected = {}
+
+            for position in positions:
+                fragment, row_group_id, _ = row_groups[position]
+                selected.setdefault(id(fragment), (fragment, []))[1].append(row_group_id)
+
+            fragments = [fragment.subset(row_group_ids=sorted(row_group_ids))
+                         for fragment, row_group_ids in selected.values()]
+
+            return ds.FileSystemDataset(fragments, dataset.schema, dataset.format, dataset.filesystem).to_table(
+                columns=projection,
+                filter=expression,
+                **self._scan_arguments(scan_options)
+            )
+
+        tables = []
+        read_rows = 0
+        matched_rows = 0
+        start = 0
+
+        if fraction is not None:
+            # the rows of the row groups drawn until they hold the fraction of the rows, the last one is partial
+            target = fraction * num_rows.sum()
+            end = int(np.searchsorted(np.cumsum(num_rows[order]), target)) + 1 if row_groups else 0
+
+            if end:
+                tables.append(read(order[:end]))
+                read_rows = num_rows[order[:end]].sum()
+                matched_rows = tables[0].num_rows
+
+            sample_rows = round(matched_rows * min(1.0, target / read_rows)) if read_rows else 0
+        else:
+            while matched_rows < n_rows and start < len(order):
+                # enough row groups to reach n_rows at the share of matching rows seen so far
+                selectivity = max(matched_rows, 1) / read_rows if read_rows else 1.0
+                cumulative = np.cumsum(num_rows[order[start:]])
+                end = start + int(np.searchsorted(cumulative, (n_rows - matched_rows) / selectivity)) + 1
+
+                table = read(order[start:end])
+                tables.append(table)
+                read_rows += num_rows[order[start:end]].sum()
+                matched_rows += table.num_rows
+                start = end
+
+            sample_rows = min(n_rows, matched_rows)
+
+        self._logger.debug(f"Sampling {sample_rows} of {matched_rows} rows read from {int(read_rows)} rows of "
+                           f"'{path}'")
+
+        if not tables:
+            return pa.Table.from_batches(
+                [], schema=ds.Scanner.from_dataset(dataset, columns=projection, filter=expression).projected_schema
+            )
+
+        table = pa.concat_tables(tables)
+
+        return table.take(np.sort(rng.choice(table.num_rows, size=sample_rows, replace=False)))
+
+    def count_rows(self,
+                   file_format: str,
+                   path: str,
+                   partitioning: str = "hive",
+                   filters=None,
+                   version: int = None,
+                   scan_options: ScanOptions = None) -> int:
+        """
+        Count the rows of the dataset matching the filters, from the metadata when possible: the row counts of the
+        delta log and of the parquet footers are used for the files and row groups whose partition values and
+        min/max/null count statistics prove that every row matches. Only the remaining row groups are scanned,
+        reading just the filtered columns.
+
+        Parameters
+        ----------
+        :param file_format: str
+            Currently "parquet", "deltalake" supported.
+        :param path: str
+            Path pointing to a single file or to the directory of the dataset.
+        :param partitioning: Partitioning, PartitioningFactory, str, list of str default "hive"
+            The partitioning scheme of the dataset.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Only the rows matching the filter are counted. Expressions can not be checked against the statistics,
+            the rows are then counted by pyarrow.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :return:
+            num_rows : int
+        """
+        num_rows, _ = self._aggregate(file_format=file_format, path=path, columns=[], partitioning=partitioning,
+                                      filters=filters, version=version, scan_options=scan_options)
+        return num_rows
+
+    def column_stats(self,
+                     file_format: str,
+                     path: str,
+                     columns: list,
+                     partitioning: str = "hive",
+                     filters=None,
+                     version: int = None,
+                     scan_options: ScanOptions = None) -> dict:
+        """
+        Compute the minimum, maximum and null count of columns over the rows matching the filters, from the
+        metadata when possible like count_rows(). The row groups lacking statistics of a column, or whose rows
+        may not all match, are scanned reading only the requested and filtered columns.
+
+        Parameters
+        ----------
+        :param file_format: str
+            Currently "parquet", "deltalake" supported.
+        :param path: str
+            Path pointing to a single file or to the directory of the dataset.
+        :param columns: list of str
+            Names of the columns, partition columns included.
+        :param partitioning: Partitioning, PartitioningFactory, str, list of str default "hive"
+            The partitioning scheme of the dataset.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Only the rows matching the filter are aggregated.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :return:
+            statistics : dict of column name to {"min": value, "max": value, "null_count": int}, min and max are
+            None when every value is null
+        """
+        _, statistics = self._aggregate(file_format=file_format, path=path, columns=columns,
+                                        partitioning=partitioning, filters=filters, version=version,
+                                        scan_options=scan_options)
+        return statistics
+
+    def _aggregate(self, file_format, path, columns, partitioning, filters, version, scan_options=None,
+                   dataset=None, metadata_only=False):
+        """
+        :param dataset: Dataset opened by the caller with the same arguments, default None opens it
+        :param metadata_only: return None instead of scanning the row groups the metadata does not answer
+        :return: (num_rows, statistics) of the rows matching the filters, see count_rows() and column_stats()
+        """
+        if dataset is None:
+            dataset = self.dataset(
+                file_format=file_format,
+                path=path,
+                partitioning=partitioning,
+                filters=filters,
+                version=version
+            )
+
+        for column in columns:
+            if dataset.schema.get_field_index(column) < 0:
+                raise ValueError(f"The column '{column}' is not in the dataset '{path}'")
+
+        condition = AbstractStorage._filter_condition(filters)
+        dnf = None if condition is None else condition.dnf()
+        # the condition left out the "not in" tuples, it proves which rows may match but not which ones must
+        exact = isinstance(filters, Condition) or (condition is not None and not any(
+            literal[1] == "not in" for conjunction in _as_dnf(filters) for literal in conjunction))
+
+        involved = set(columns) | ({literal._key for conjunction in dnf for literal in conjunction} if dnf else set())
+        log_statistics = self._delta_log_statistics(path=path, version=version) \
+            if file_format == "deltalake" else {}
+
+        totals = {column: _ColumnTotals() for column in columns}
+        num_rows = 0
+        scanned = []
+        row_groups = 0
+
+        candidates = []
+
+        for fragment in dataset.get_fragments():
+            partition_values = ds.get_partition_keys(fragment.partition_expression)
+
+            # the partitions are pruned first, the footers of the skipped files are not read
+            if not _unit_matches(dnf, {}, partition_values, 0)[0]:
+                continue
+
+            data_columns = involved - set(partition_values)
+            units = _log_units(log_statistics.get(_relative_path(fragment.path, None)), dataset.schema, data_columns)
+            candidates.append((fragment, partition_values, data_columns, units))
+
+        _read_footers([fragment for fragment, _, _, units in candidates if units is None])
+
+        for fragment, partition_values, data_columns, units in candidates:
+            if units is None:
+                units = [(row_group_id, fragment.metadata.row_group(row_group_id).num_rows, statistics)
+                         for row_group_id, statistics in _row_group_statistics(fragment, dataset.schema,
+                                                                               data_columns, {})]
+
+            scan_ids = []
+
+            for row_group_id, unit_rows, statistics in units:
+                row_groups += 1
+                may_match, must_match = _unit_matches(dnf, statistics, partition_values, unit_rows)
+
+                if not may_match:
+                    continue
+
+                unit_totals = {column: _unit_totals(column, statistics, partition_values, unit_rows)
+                               for column in columns}
+
+                if (filters is None or (exact and must_match)) and \
+                        all(column_totals is not None for column_totals in unit_totals.values()):
+                    num_rows += unit_rows
+
+                    for column, column_totals in unit_totals.items():
+                        totals[column].add(*column_totals)
+                else:
+                    scan_ids.append(row_group_id)
+
+            # the number of row groups of the fragment reads its footer, only asked when some are scanned
+            if not scan_ids:
+                continue
+
+            if None in scan_ids or len(scan_ids) == fragment.num_row_groups:
+                scanned.append(fragment)
+            else:
+                scanned.append(fragment.subset(row_group_ids=scan_ids))
+
+        if scanned and metadata_only:
+            return None
+
+        self._logger.debug(f"Scanning {len(scanned)} files of '{path}', the other of the {row_groups} row groups "
+                           f"were answered from the metadata")
+
+        if scanned:
+            scan_dataset = ds.FileSystemDataset(scanned, dataset.schema, dataset.format, dataset.filesystem)
+            expression = AbstractStorage._filter_expression(filters)
+
+            if not columns:
+                num_rows += scan_dataset.count_rows(filter=expression, **self._scan_arguments(scan_options))
+            else:
+                for batch in scan_dataset.to_batches(columns=columns, filter=expression,
+                                                     **self._scan_arguments(scan_options)):
+                    num_rows += batch.num_rows
+
+                    for column in columns:
+                        totals[column].add_array(batch.column(column))
+
+        return num_rows, {column: totals[column].to_dict() for column in columns}
+
+    def _delta_log_statistics(self, path, version=None) -> dict:
+        """
+        :return: add action of each data file of the delta table keyed by its path, with the row count and the
+            min/max/null count statistics flattened as "num_records", "min.<column>", "max.<column>" and
+            "null_count.<column>"
+        """
+        with self._delta_table(path=path, version=version) as delta_table:
+            actions = delta_table.get_add_actions(flatten=True)
+
+        return {action["path"]: action for action in actions.to_pylist()}
+
+    def read_to_pandas(self,
                        file_format: str,
                        path: str,
                        partitioning: str = "hive",
-                       filters=None) -> DataFrame:
+                       filters=None,
+                       columns=None,
+                       version: int = None,
+                       limit: int = None,
+                       scan_options: ScanOptions = None,
+                       pandas_options: PandasOptions = None) -> DataFrame:
         """
         Read the dataset as pandas dataframe.
 
@@ -441,21 +2277,568 @@ class AbstractStorage(metaclass=ABCMeta):
             The partitioning scheme specified with the ``partitioning()``
             function. A flavor string can be used as shortcut, and with a list of
             field names a DirectionaryPartitioning will be inferred.
-        :param filters: Expression, default None
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
             Scan will return only the rows matching the filter.
             If possible the predicate will be pushed down to exploit the
             partition information or internal metadata found in the data
             source, e.g. Parquet statistics. Otherwise filters the loaded
             RecordBatches before yielding them.
+        :param columns: list of str or dict of str to Expression, default None
+            The columns to read, the remaining columns are neither fetched nor
+            decoded. A list selects columns by name, nested struct fields can
+            be selected with a dotted name, e.g. "address.city". A dict maps
+            the output column names to the expressions computing them.
+            Default None reads all the columns.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param limit: int, default None
+            Maximum number of rows to read, default None reads every row. The files and row groups are then
+            scanned one at a time and the scan stops as soon as enough rows matched the filters.
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :param pandas_options: PandasOptions, default None
+            Conversion of the arrow table to pandas, default None converts with the pyarrow defaults. See
+            PandasOptions.lean() to bound the peak memory to about the size of the data.
         :return:
             dataframe : pandas.Dataframe
         """
-        return self.read_to_arrow_table(
+        dataset = self.dataset(
+            file_format=file_format,
+            path=path,
+            partitioning=partitioning,
+            filters=filters,
+            version=version
+        )
+
+        if pandas_options is not None and pandas_options.categorical_partitions:
+            # the scan yields the partition columns dictionary encoded, they are never expanded
+            dataset = _dictionary_partitions(dataset)
+
+        table = self._scan_table(dataset=dataset, filters=filters, columns=columns, limit=limit,
+                                 scan_options=scan_options)
+
+        if pandas_options is None:
+            return table.to_pandas()
+
+        return table.to_pandas(**pandas_options.to_dict())
+
+    def read_to_pandas_batches(self,
+                               file_format: str,
+                               path: str,
+                               chunk_rows: int = None,
+                               chunk_bytes: int = None,
+                               partitioning: str = "hive",
+                               filters=None,
+                               columns=None,
+                               version: int = None,
+                               limit: int = None,
+                               scan_options: ScanOptions = None,
+                               pandas_options: PandasOptions = None):
+        """
+        Read the dataset as an iterator of pandas dataframes of a stable size, without holding the whole dataset in
+        memory. The next dataframe is converted on a background thread while the caller processes the current one.
+
+        Every dataframe gets the same dtypes: the integer and boolean columns are converted to the pandas nullable
+        dtypes (Int64, boolean...), so a chunk holding nulls does not turn them to float or object, and the
+        categorical partition columns share the categories of every partition value.
+
+        Parameters
+        ----------
+        :param file_format: str
+            Currently "parquet", "deltalake" supported.
+        :param path: str
+            Path pointing to a single file or to the directory of the dataset.
+        :param chunk_rows: int, default None
+            Number of rows of each dataframe, only the last one may be smaller. Exactly one of chunk_rows and
+            chunk_bytes must be given.
+        :param chunk_bytes: int, default None
+            Size in bytes of the arrow data of each dataframe, the dataframes are about this size.
+        :param partitioning: Partitioning, PartitioningFactory, str, list of str default "hive"
+            The partitioning scheme of the dataset.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Only the rows matching the filter are read.
+        :param columns: list of str or dict of str to Expression, default None
+            The columns to read, default None reads all the columns.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param limit: int, default None
+            Maximum number of rows to read, default None reads every row.
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :param pandas_options: PandasOptions, default None
+            Conversion of each chunk to pandas, default None converts with the pyarrow defaults.
+        :return:
+            dataframes : iterator of pandas.DataFrame, closing it stops the read
+        """
+        if (chunk_rows is None) == (chunk_bytes is None):
+            raise ValueError("Exactly one of chunk_rows and chunk_bytes must be given")
+
+        for name, value in [("chunk_rows", chunk_rows), ("chunk_bytes", chunk_bytes)]:
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be greater than 0")
+
+        dataset = self.dataset(
+            file_format=file_format,
+            path=path,
+            partitioning=partitioning,
+            filters=filters,
+            version=version
+        )
+
+        pandas_options = pandas_options or PandasOptions()
+        categories = {}
+
+        if pandas_options.categorical_partitions:
+            for fragment in dataset.get_fragments():
+                for key, value in ds.get_partition_keys(fragment.partition_expression).items():
+                    categories.setdefault(key, set()).add(value)
+
+        record_batches = AbstractStorage._consumer_batches(
+            self._scan_batches(dataset=dataset, filters=filters, columns=columns, limit=limit,
+                               scan_options=scan_options),
+            scan_options
+        )
+        chunks = _coalesce_batches(record_batches, target_bytes=chunk_bytes, min_rows=chunk_rows, max_rows=chunk_rows)
+        dtypes = {column: pd.CategoricalDtype(sorted(values)) for column, values in categories.items()}
+
+        # one dataframe is converted ahead of the caller
+        return PrefetchIterator(_pandas_chunks(chunks, pandas_options, dtypes), max_batches=1)
+
+    def read_to_numpy(self,
+                      file_format: str,
+                      path: str,
+                      columns: list,
+                      dtype=None,
+                      order: str = "C",
+                      partitioning: str = "hive",
+                      filters=None,
+                      version: int = None,
+                      limit: int = None,
+                      scan_options: ScanOptions = None) -> np.ndarray:
+        """
+        Read numeric columns as one contiguous 2-D numpy array, e.g. a feature matrix. When the metadata tells the
+        number of matching rows, like count_rows(), the array is allocated once and every record batch is copied into
+        it straight from the arrow buffers: the data is copied once, instead of once to pandas and again to numpy.
+        Otherwise the dataset is still scanned once, filling arrays of NUMPY_CHUNK_ROWS rows copied together at the end.
+
+        Parameters
+        ----------
+        :param file_format: str
+            Currently "parquet", "deltalake" supported.
+        :param path: str
+            Path pointing to a single file or to the directory of the dataset.
+        :param columns: list of str
+            Names of the integer, floating point or boolean columns, one column of the array each.
+        :param dtype: numpy dtype, default None
+            Type of the array, default None uses the common type of the columns, e.g. float32 for float32 columns.
+            Nulls are read as NaN, an integer dtype raises ValueError on columns holding nulls.
+        :param order: str, default "C"
+            "C" for a row-major array, "F" for a column-major one.
+        :param partitioning: Partitioning, PartitioningFactory, str, list of str default "hive"
+            The partitioning scheme of the dataset.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Only the rows matching the filter are read.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param limit: int, default None
+            Maximum number of rows to read, default None reads every row.
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :return:
+            array : numpy.ndarray of shape (rows, columns)
+        """
+        dataset = self.dataset(
+            file_format=file_format,
+            path=path,
+            partitioning=partitioning,
+            filters=filters,
+            version=version
+        )
+
+        dtype = _matrix_dtype(dataset.schema, columns, dtype)
+
+        if order not in ["C", "F"]:
+            raise ValueError("order must be one of 'C', 'F'")
+
+        aggregate = self._aggregate(file_format=file_format, path=path, columns=[], partitioning=partitioning,
+                                    filters=filters, version=version, scan_options=scan_options, dataset=dataset,
+                                    metadata_only=True)
+        record_batches = self._scan_batches(dataset=dataset, filters=filters, columns=list(columns), limit=limit,
+                                            scan_options=scan_options)
+
+        # the metadata does not tell how many rows match, the chunks of the single scan are copied together
+        if aggregate is None:
+            chunks = list(_matrix_batches(record_batches, NUMPY_CHUNK_ROWS, len(columns), dtype, order))
+
+            if len(chunks) == 1:
+                return chunks[0]
+
+            matrix = np.empty((sum(len(chunk) for chunk in chunks), len(columns)), dtype=dtype, order=order)
+            offset = 0
+
+            for chunk in chunks:
+                matrix[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+
+            return matrix
+
+        num_rows = aggregate[0] if limit is None else min(aggregate[0], limit)
+        matrix = np.empty((num_rows, len(columns)), dtype=dtype, order=order)
+        offset = 0
+
+        for batch in record_batches:
+            if offset + batch.num_rows > num_rows:
+                raise ValueError(f"The dataset '{path}' changed while being read")
+
+            _copy_to_matrix(batch, matrix[offset:offset + batch.num_rows])
+            offset += batch.num_rows
+
+        # fewer rows are only read when files were removed meanwhile
+        return matrix if offset == num_rows else _contiguous(matrix[:offset], order)
+
+    def read_to_numpy_batches(self,
+                              file_format: str,
+                              path: str,
+                              columns: list,
+                              batch_rows: int,
+                              dtype=None,
+                              order: str = "C",
+                              partitioning: str = "hive",
+                              filters=None,
+                              version: int = None,
+                              limit: int = None,
+                              scan_options: ScanOptions = None):
+        """
+        Read numeric columns as an iterator of contiguous 2-D numpy arrays of batch_rows rows, only the last one may
+        be smaller. Each array is allocated once and filled straight from the arrow buffers, see read_to_numpy().
+
+        Parameters
+        ----------
+        :param file_format: str
+            Currently "parquet", "deltalake" supported.
+        :param path: str
+            Path pointing to a single file or to the directory of the dataset.
+        :param columns: list of str
+            Names of the integer, floating point or boolean columns, one column of the arrays each.
+        :param batch_rows: int
+            Number of rows of each array.
+        :param dtype: numpy dtype, default None
+            Type of the arrays, default None uses the common type of the columns.
+        :param order: str, default "C"
+            "C" for row-major arrays, "F" for column-major ones.
+        :param partitioning: Partitioning, PartitioningFactory, str, list of str default "hive"
+            The partitioning scheme of the dataset.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Only the rows matching the filter are read.
+        :param version: int, default None
+            Version of the delta table to read, default None reads the latest version. Only for "deltalake".
+        :param limit: int, default None
+            Maximum number of rows to read, default None reads every row.
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :return:
+            arrays : iterator of numpy.ndarray of shape (batch_rows, columns)
+        """
+        if batch_rows < 1:
+            raise ValueError("batch_rows must be greater than 0")
+
+        if order not in ["C", "F"]:
+            raise ValueError("order must be one of 'C', 'F'")
+
+        dataset = self.dataset(
             file_format=file_format,
             path=path,
             partitioning=partitioning,
-            filters=filters
-        ).to_pandas()
+            filters=filters,
+            version=version
+        )
+
+        dtype = _matrix_dtype(dataset.schema, columns, dtype)
+        record_batches = AbstractStorage._consumer_batches(
+            self._scan_batches(dataset=dataset, filters=filters, columns=list(columns), limit=limit,
+                               scan_options=scan_options),
+            scan_options
+        )
+
+        return _matrix_batches(record_batches, batch_rows, len(columns), dtype, order)
+
+    def read_changes(self,
+                     path: str,
+                     since_version: int,
+                     filters=None,
+                     batch_size: int = 1000,
+                     columns=None,
+                     scan_options: ScanOptions = None):
+        """
+        Read the rows added to a delta table after a version, scanning only the data files added by the later
+        commits. Files rewritten without changing the data (e.g. by OPTIMIZE) are not read again.
+
+        Parameters
+        ----------
+        :param path: str
+            Path pointing to the delta table.
+        :param since_version: int
+            Last version already processed, the rows added by the commits after it are read. -1 reads every row.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Scan will return only the rows matching the filter.
+        :param batch_size: int, default 1000
+            The maximum row count of the record batches.
+        :param columns: list of str or dict of str to Expression, default None
+            The columns to read, default None reads all the columns.
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :return:
+            (record_batches, version) : iterator of RecordBatch and the version of the table read, to be passed
+            as since_version to the next call
+        """
+        with self._delta_table(path=path) as delta_table:
+            version = delta_table.version()
+
+            if since_version > version:
+                raise ValueError(f"since_version {since_version} is greater than the table version {version}")
+
+            dataset = self._delta_dataset(delta_table=delta_table, path=path)
+
+        added_files = self._added_files(path=path, since_version=since_version, version=version)
+        expression = AbstractStorage._filter_expression(filters)
+
+        fragments = [fragment for fragment in dataset.get_fragments(filter=expression)
+                     if fragment.path in added_files]
+
+        self._logger.debug(f"Reading {len(fragments)} of {len(dataset.files)} files added to '{path}' "
+                           f"after version {since_version}")
+
+        dataset = ds.FileSystemDataset(fragments, dataset.schema, dataset.format, dataset.filesystem)
+        record_batches = dataset.to_batches(
+            columns=AbstractStorage._projection(dataset.schema, columns),
+            batch_size=batch_size,
+            filter=expression,
+            **self._scan_arguments(scan_options)
+        )
+
+        return AbstractStorage._consumer_batches(record_batches, scan_options), version
+
+    def _added_files(self, path, since_version, version) -> set:
+        """
+        :return: paths, relative to the table directory, of the data files added by the commits
+            after since_version up to version
+        """
+        filesystem = _as_arrow_filesystem(self._get_filesystem())
+        log_path = f"{self._get_filesystem_base_path(path=path)}/_delta_log"
+        added_files = set()
+
+        for commit_version in range(since_version + 1, version + 1):
+            commit_path = f"{log_path}/{commit_version:020d}.json"
+
+            try:
+                with filesystem.open_input_stream(commit_path) as commit:
+                    actions = commit.read().decode("utf-8").splitlines()
+            except FileNotFoundError:
+                raise ValueError(f"The commit of version {commit_version} is no longer in the log of '{path}'")
+
+            for action in actions:
+                add = json.loads(action).get("add") if action else None
+
+                if add is not None and add.get("dataChange", True):
+                    added_files.add(unquote(add["path"]))
+
+        return added_files
+
+    def read_new_batches(self,
+                         path: str,
+                         state_path: str,
+                         partitioning: str = "hive",
+                         filters=None,
+                         batch_size: int = 1000,
+                         columns=None,
+                         scan_options: ScanOptions = None):
+        """
+        Read the record batches of the parquet files added to a dataset since the previous call. The files consumed,
+        identified by path, size and version (generation, etag or modification time), are kept in a local state
+        file; a file rewritten in place is read again.
+
+        The state file is updated once every batch has been consumed, an interrupted read is repeated by the next
+        call.
+
+        Parameters
+        ----------
+        :param path: str
+            Path pointing to the directory of the parquet dataset.
+        :param state_path: str
+            Local file keeping the files already consumed, created by the first call.
+        :param partitioning: Partitioning, PartitioningFactory, str, list of str default "hive"
+            The partitioning scheme of the dataset.
+        :param filters: Expression, Condition, List[Tuple] or List[List[Tuple]], default None
+            Scan will return only the rows matching the filter.
+        :param batch_size: int, default 1000
+            The maximum row count of the record batches.
+        :param columns: list of str or dict of str to Expression, default None
+            The columns to read, default None reads all the columns.
+        :param scan_options: ScanOptions, default None
+            Readahead, threading and memory pool of the scan, default None uses the defaults of the storage.
+        :return:
+            record_batches : iterator of RecordBatch
+        """
+        consumed_files = _load_consumed_files(state_path)
+        base_dir = self._get_filesystem_base_path(path=path)
+        new_files = {}
+
+        for file_path, info in _list_data_files(_as_fsspec_filesystem(self._get_client()), base_dir):
+            # without a version only the size tells a rewritten file apart
+            version = _object_version(info) or f"size={info['size']}"
+
+            if consumed_files.get(file_path) != version:
+                new_files[file_path] = version
+
+        self._logger.debug(f"Reading {len(new_files)} new files of '{path}'")
+
+        if new_files:
+            dataset = ds.dataset(
+                source=[f"{base_dir}/{file_path}" for file_path in new_files],
+                filesystem=self._get_filesystem(),
+                format=self._get_parquet_file_format(),
+                partitioning=partitioning,
+                partition_base_dir=base_dir
+            )
+
+            yield from AbstractStorage._consumer_batches(dataset.to_batches(
+                columns=AbstractStorage._projection(dataset.schema, columns),
+                batch_size=batch_size,
+                filter=AbstractStorage._filter_expression(filters),
+                **self._scan_arguments(scan_options)
+            ), scan_options)
+
+            consumed_files.update(new_files)
+            _save_consumed_files(state_path, consumed_files)
+
+    def build_index(self,
+                    file_format: str,
+                    path: str,
+                    columns: list,
+                    bloom_filter_columns: list = None,
+                    bloom_filter_fpp: float = 0.01) -> DatasetIndex:
+        """
+        Scan the data files of a dataset once and write a sidecar index next to them, holding for each row group
+        the min/max and null count of the given columns and, optionally, a bloom filter of their values. The reads
+        passing filters drop the files that can not match without opening them, and the writes made through this
+        storage object keep the index up to date. An existing index is replaced.
+
+        Parameters
+        ----------
+        :param file_format: str
+            Currently "parquet", "deltalake" supported.
+        :param path: str
+            Path pointing to the directory of the dataset or to the delta table.
+        :param columns: list of str
+            Columns indexed, stored in the data files (partition columns are pruned from the partition values).
+        :param bloom_filter_columns: list of str, default None
+            Columns, among the indexed ones, also holding a bloom filter, for the equality and In filters on
+            columns not sorted nor clustered. Building them reads the values of the columns.
+        :param bloom_filter_fpp: float, default 0.01
+            False positive probability of the bloom filters.
+        :return:
+            index : DatasetIndex
+        """
+        self._validate_format(file_format=file_format)
+
+        filesystem = _as_arrow_filesystem(self._get_filesystem())
+        base_dir = self._get_filesystem_base_path(path=path)
+        index = None
+
+        for file_path in self._data_file_paths(file_format=file_format, path=path):
+            metadata = pq.read_metadata(f"{base_dir}/{file_path}", filesystem=filesystem)
+
+            if index is None:
+                schema = metadata.schema.to_arrow_schema()
+                missing = [column for column in columns if schema.get_field_index(column) < 0]
+
+                if missing:
+                    raise ValueError(f"The columns {missing} are not stored in the data files of '{path}'")
+
+                index = DatasetIndex(schema=pa.schema([schema.field(column) for column in columns]),
+                                     bloom_filter_columns=bloom_filter_columns, bloom_filter_fpp=bloom_filter_fpp)
+
+            index.add_file(file_path, metadata, AbstractStorage._parquet_file_opener(filesystem, base_dir, file_path,
+                                                                                   metadata))
+
+        if index is None:
+            raise ValueError(f"There are no data files to index in '{path}'")
+
+        index.write(filesystem, f"{base_dir}/{INDEX_FILE}")
+        self._logger.debug(f"Indexed {len(index)} files of '{path}'")
+        self.invalidate(path)
+
+        return index
+
+    def _data_file_paths(self, file_format, path) -> list:
+        """
+        :return: paths of the data files of the dataset, relative to its root
+        """
+        if file_format == "deltalake":
+            with self._delta_table(path=path) as delta_table:
+                return delta_table.files()
+
+        filesystem = _as_fsspec_filesystem(self._get_filesystem())
+        return [file_path for file_path, _ in _list_data_files(filesystem, self._get_filesystem_base_path(path=path))]
+
+    def _read_index(self, path) -> DatasetIndex:
+        """
+        :return: sidecar index of the dataset at path, None when there is none. A missing index is remembered until
+            the path is invalidated, the filtered reads of datasets without index do not look it up every time
+        """
+        key = (AbstractStorage._normalize_path(path), INDEX_FILE)
+
+        if key in self._missing_sidecar_files:
+            return None
+
+        index = DatasetIndex.read(_as_arrow_filesystem(self._get_filesystem()),
+                                  f"{self._get_filesystem_base_path(path=path)}/{INDEX_FILE}")
+
+        if index is None:
+            self._missing_sidecar_files.add(key)
+
+        return index
+
+    def _update_index(self, file_format, path, written_files=None):
+        """
+        Add the data files just written to the sidecar index of the dataset, when it has one. The delta files
+        removed from the table are removed from the index.
+
+        :param written_files: files written to a parquet dataset, as given to the file_visitor of write_dataset
+        """
+        filesystem = _as_arrow_filesystem(self._get_filesystem())
+        base_dir = self._get_filesystem_base_path(path=path)
+        index_path = f"{base_dir}/{INDEX_FILE}"
+        index = self._read_index(path=path)
+
+        if index is None:
+            return
+
+        if file_format == "parquet":
+            added = {_relative_path(written_file.path, base_dir): written_file.metadata
+                     for written_file in written_files}
+        else:
+            files = set(self._data_file_paths(file_format=file_format, path=path))
+
+            for file_path in index.files - files:
+                index.remove_file(file_path)
+
+            added = {file_path: pq.read_metadata(f"{base_dir}/{file_path}", filesystem=filesystem)
+                     for file_path in files - index.files}
+
+        for file_path, metadata in added.items():
+            index.add_file(file_path, metadata, AbstractStorage._parquet_file_opener(filesystem, base_dir, file_path,
+                                                                                   metadata))
+
+        index.write(filesystem, index_path)
+        self._logger.debug(f"Added {len(added)} files to the index of '{path}'")
+
+        # the datasets cached meanwhile hold the previous index
+        self.invalidate(path)
+
+    @staticmethod
+    def _parquet_file_opener(filesystem, base_dir, file_path, metadata):
+        return lambda: pq.ParquetFile(f"{base_dir}/{file_path}", metadata=metadata, filesystem=filesystem)
 
     def write(self, data, file_format, path, basename_template, write_options: WriteOptions):
         """
@@ -492,6 +2875,7 @@ class AbstractStorage(metaclass=ABCMeta):
             pyarr_data = data
 
         filesystem = self._get_filesystem()
+        written_files = []
 
         if file_format == "parquet":
             self._logger.debug(f""" Write to Dataset: 
@@ -512,7 +2896,15 @@ class AbstractStorage(metaclass=ABCMeta):
                 existing_data_behavior=write_options.existing_data_behavior(),
                 file_options=ds.ParquetFileFormat().make_write_options(
                     compression=write_options.compression_codec
-                )
+                ),
+                file_visitor=written_files.append
+            )
+
+            self._write_summary_metadata(
+                filesystem=_as_arrow_filesystem(filesystem),
+                base_dir=self._get_filesystem_base_path(path=path),
+                written_files=written_files,
+                write_options=write_options
             )
         elif file_format == "deltalake":
             write_deltalake(
@@ -526,3 +2918,607 @@ class AbstractStorage(metaclass=ABCMeta):
                 mode=write_options.existing_data_behavior()
             )
 
+        self.invalidate(path)
+        self._update_index(file_format=file_format, path=path, written_files=written_files)
+
+    def _write_summary_metadata(self, filesystem, base_dir, written_files, write_options: ParquetWriteOptions):
+        """
+        Write, merge or remove the summary files of a parquet dataset after writing its data files.
+
+        Appends of new files extend the existing _metadata. When files were overwritten or deleted the summary is
+        rebuilt from the footers of the data files.
+        """
+        metadata_path = f"{base_dir}/{METADATA_FILE}"
+
+        if not write_options.write_metadata:
+            # the data files written would be missing from an existing summary
+            AbstractStorage._delete_summary_metadata(filesystem, base_dir)
+            return
+
+        written = {}
+        for written_file in written_files:
+            file_path = written_file.path[len(base_dir):].lstrip("/")
+            written_file.metadata.set_file_path(file_path)
+            written[file_path] = written_file.metadata
+
+        summary = None
+
+        if filesystem.get_file_info(metadata_path).type == FileType.File:
+            summary = pq.read_metadata(metadata_path, filesystem=filesystem)
+            summary_files = {summary.row_group(i).column(0).file_path for i in range(summary.num_row_groups)}
+
+            if write_options.existing_data_behavior() != "overwrite_or_ignore" or not summary_files.isdisjoint(written):
+                summary = None
+                written = self._read_data_file_metadata(filesystem, base_dir, written)
+
+        try:
+            for file_metadata in written.values():
+                if summary is None:
+                    summary = file_metadata
+                else:
+                    summary.append_row_groups(file_metadata)
+        except RuntimeError as error:
+            # the files do not share the same schema, the reads fall back to discovering the dataset
+            self._logger.warning(f"Removing the summary files of '{base_dir}': {error}")
+            AbstractStorage._delete_summary_metadata(filesystem, base_dir)
+            return
+
+        if summary is None:
+            return
+
+        with filesystem.open_output_stream(metadata_path) as sink:
+            summary.write_metadata_file(sink)
+
+        pq.write_metadata(summary.schema.to_arrow_schema(), f"{base_dir}/{COMMON_METADATA_FILE}",
+                          filesystem=filesystem)
+
+    @staticmethod
+    def _delete_summary_metadata(filesystem, base_dir):
+        for file_name in [METADATA_FILE, COMMON_METADATA_FILE]:
+            if filesystem.get_file_info(f"{base_dir}/{file_name}").type == FileType.File:
+                filesystem.delete_file(f"{base_dir}/{file_name}")
+
+    @staticmethod
+    def _read_data_file_metadata(filesystem, base_dir, written) -> dict:
+        """
+        :return: metadata of every data file of the dataset keyed by its path relative to base_dir, the footers of
+            the files just written are taken from written
+        """
+        metadata = {}
+
+        for file_path, info in _list_data_files(_as_fsspec_filesystem(filesystem), base_dir):
+            if file_path in written:
+                metadata[file_path] = written[file_path]
+            else:
+                metadata[file_path] = pq.read_metadata(info["name"], filesystem=filesystem)
+                metadata[file_path].set_file_path(file_path)
+
+        return metadata
+
+
+class _ColumnTotals:
+    """
+    Minimum, maximum and null count of a column, accumulated over row groups and record batches
+    """
+
+    def __init__(self):
+        self.minimum = None
+        self.maximum = None
+        self.null_count = 0
+
+    def add(self, minimum, maximum, null_count):
+        if minimum is not None and (self.minimum is None or minimum < self.minimum):
+            self.minimum = minimum
+        if maximum is not None and (self.maximum is None or maximum > self.maximum):
+            self.maximum = maximum
+        self.null_count += null_count
+
+    def add_array(self, array: pa.Array):
+        if array.null_count < len(array):
+            min_max = pc.min_max(array)
+            self.add(min_max["min"].as_py(), min_max["max"].as_py(), array.null_count)
+        else:
+            self.add(None, None, array.null_count)
+
+    def to_dict(self) -> dict:
+        return {"min": self.minimum, "max": self.maximum, "null_count": self.null_count}
+
+
+# types whose min/max in the delta log are exact, the writers may truncate the strings and the timestamps
+def _exact_log_statistics(data_type: pa.DataType) -> bool:
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type) or pa.types.is_date(data_type) \
+        or pa.types.is_boolean(data_type) or pa.types.is_decimal(data_type)
+
+
+def _log_units(action, schema: pa.Schema, columns: set):
+    """
+    :return: the delta data file as a single [(None, num_rows, statistics)] unit, None when the add action lacks
+        the row count or exact statistics of one of the columns
+    """
+    if action is None or action.get("num_records") is None:
+        return None
+
+    statistics = {}
+
+    for column in columns:
+        field_index = schema.get_field_index(column)
+        null_count = action.get(f"null_count.{column}")
+
+        if field_index < 0 or null_count is None or not _exact_log_statistics(schema.field(field_index).type):
+            return None
+
+        statistics[column] = (action.get(f"min.{column}"), action.get(f"max.{column}"), null_count)
+
+    return [(None, action["num_records"], statistics)]
+
+
+def _unit_matches(dnf, statistics: dict, partition_values: dict, num_rows: int):
+    """
+    :return: (may_match, must_match), whether some and every row of a file or row group may match the filters
+        according to its partition values and its (min, max, null count) statistics by column
+    """
+    if dnf is None:
+        return True, True
+
+    def literal_matches(literal):
+        if literal._key in partition_values:
+            value = partition_values[literal._key]
+
+            # a null partition, comparisons never hold for null values
+            if value is None:
+                return False, False
+
+            try:
+                matches = literal.matches(value)
+            except TypeError:
+                return True, False
+            return matches, matches
+
+        column_statistics = statistics.get(literal._key)
+
+        if column_statistics is None:
+            return True, False
+
+        minimum, maximum, null_count = column_statistics
+
+        # comparisons never hold for null values
+        if null_count is not None and null_count >= num_rows:
+            return False, False
+
+        return literal.may_match(minimum, maximum), null_count == 0 and literal.must_match(minimum, maximum)
+
+    conjunctions = [[literal_matches(literal) for literal in conjunction] for conjunction in dnf]
+
+    return (any(all(may for may, _ in conjunction) for conjunction in conjunctions),
+            any(all(must for _, must in conjunction) for conjunction in conjunctions))
+
+
+def _unit_totals(column, statistics: dict, partition_values: dict, num_rows: int):
+    """
+    :return: (min, max, null count) of the column in a file or row group, None when the statistics do not tell
+    """
+    if column in partition_values:
+        value = partition_values[column]
+        return (value, value, 0) if value is not None else (None, None, num_rows)
+
+    column_statistics = statistics.get(column)
+
+    if column_statistics is None or column_statistics[2] is None:
+        return None
+
+    minimum, maximum, null_count = column_statistics
+
+    if (minimum is None or maximum is None) and null_count < num_rows:
+        return None
+
+    return column_statistics
+
+
+def _as_dnf(filters) -> list:
+    """
+    :return: List[Tuple] or List[List[Tuple]] filters as List[List[Tuple]]
+    """
+    return filters if len(filters) > 0 and isinstance(filters[0], list) else [filters]
+
+
+_NOT_LOADED = object()
+
+
+class _DatasetState:
+    """
+    Derived from a dataset and kept as long as it is: the row group statistics read from its footers, by file and
+    column, and its sidecar index, loaded by the first filtered read
+    """
+
+    def __init__(self):
+        self.statistics = {}
+        self.index = _NOT_LOADED
+
+
+def _relative_path(path: str, base_dir: str) -> str:
+    """
+    :return: path relative to base_dir, the paths of the delta fragments already are relative to the table
+    """
+    if base_dir is not None and path.startswith(f"{base_dir.rstrip('/')}/"):
+        return path[len(base_dir.rstrip('/')) + 1:]
+
+    return path.lstrip("/")
+
+
+def _limited_batches(dataset: ds.FileSystemDataset, limit: int, columns=None, expression: ds.Expression = None,
+                     batch_size: int = None, scan_arguments: dict = None):
+    """
+    Iterate the record batches of the first limit rows of the dataset matching the expression, in the order of the
+    files of the dataset. The first row group is scanned alone, the rest of the dataset with the fragment and batch
+    readahead of the scan arguments, and the scan is stopped once enough rows were yielded.
+
+    :param columns: list of str or dict of str to Expression, the scanner projection
+    :param scan_arguments: keyword arguments of the pyarrow scanner
+    """
+    if limit < 0:
+        raise ValueError("limit must be greater or equal to 0")
+
+    options = dict(scan_arguments or {})
+
+    if batch_size is not None:
+        options["batch_size"] = batch_size
+
+    return _scan_limited(dataset, limit, columns, expression, options)
+
+
+def _dictionary_partitions(dataset: ds.Dataset) -> ds.Dataset:
+    """
+    :return: the dataset with its partition columns typed as dictionaries, converted to pandas Categorical. The
+        partition columns of the first file are the ones of every file of a hive partitioned dataset or a delta table
+    """
+    fragment = next(dataset.get_fragments(), None)
+
+    if fragment is None or not isinstance(dataset, ds.FileSystemDataset):
+        return dataset
+
+    schema = dataset.schema
+
+    for key in ds.get_partition_keys(fragment.partition_expression):
+        index = schema.get_field_index(key)
+
+        field = schema.field(index) if index >= 0 else None
+
+        if field is not None and not pa.types.is_dictionary(field.type):
+            schema = schema.set(index, field.with_type(pa.dictionary(pa.int32(), field.type)))
+
+    return ds.FileSystemDataset(list(dataset.get_fragments()), schema, dataset.format, dataset.filesystem)
+
+
+_NULLABLE_DTYPES = {
+    pa.int8(): pd.Int8Dtype(),
+    pa.int16(): pd.Int16Dtype(),
+    pa.int32(): pd.Int32Dtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.uint8(): pd.UInt8Dtype(),
+    pa.uint16(): pd.UInt16Dtype(),
+    pa.uint32(): pd.UInt32Dtype(),
+    pa.uint64(): pd.UInt64Dtype(),
+    pa.bool_(): pd.BooleanDtype()
+}
+
+
+def _pandas_chunks(record_batches, pandas_options: PandasOptions, dtypes: dict):
+    """
+    Convert each record batch to a dataframe with the same dtypes
+
+    :param dtypes: pandas dtype of the columns converted after to_pandas(), e.g. the categorical partition columns
+    """
+    arguments = pandas_options.to_dict()
+    types_mapper = arguments.get("types_mapper")
+    arguments["types_mapper"] = lambda data_type: _NULLABLE_DTYPES.get(data_type) or \
+        (types_mapper(data_type) if types_mapper is not None else None)
+
+    for batch in record_batches:
+        table = pa.Table.from_batches([batch])
+        # the table holds the only reference left, self_destruct can release the buffers
+        del batch
+        dataframe = table.to_pandas(**arguments)
+
+        for column, dtype in dtypes.items():
+            if column in dataframe.columns:
+                dataframe[column] = dataframe[column].astype(dtype)
+
+        yield dataframe
+
+
+def _matrix_dtype(schema: pa.Schema, columns: list, dtype=None) -> np.dtype:
+    """
+    :return: dtype of the matrix of the columns, the common type of the columns when dtype is None
+    """
+    if not columns:
+        raise ValueError("At least one column must be given")
+
+    types = []
+
+    for column in columns:
+        if schema.get_field_index(column) < 0:
+            raise ValueError(f"The column '{column}' is not in the dataset")
+
+        data_type = schema.field(column).type
+
+        if pa.types.is_dictionary(data_type):
+            data_type = data_type.value_type
+
+        if not (pa.types.is_integer(data_type) or pa.types.is_floating(data_type) or pa.types.is_boolean(data_type)):
+            raise ValueError(f"The column '{column}' of type {data_type} is not numeric")
+
+        types.append(data_type.to_pandas_dtype())
+
+    return np.dtype(dtype) if dtype is not None else np.result_type(*types)
+
+
+def _copy_to_matrix(batch: pa.RecordBatch, matrix: np.ndarray):
+    """
+    Copy the columns of the batch to the columns of the matrix, reading the numeric columns without nulls in place
+    """
+    for index, array in enumerate(batch.columns):
+        if pa.types.is_dictionary(array.type):
+            array = array.dictionary_decode()
+
+        if array.null_count:
+            if not np.issubdtype(matrix.dtype, np.floating):
+                raise ValueError(f"The column '{batch.schema.names[index]}' holds nulls, they can only be read to a "
+                                 f"floating point dtype")
+
+            array = pc.fill_null(array.cast(pa.from_numpy_dtype(matrix.dtype)), float("nan"))
+
+        # a view of the arrow buffer, except for the bit packed booleans
+        matrix[:, index] = array.to_numpy(zero_copy_only=False)
+
+
+def _matrix_batches(record_batches, batch_rows: int, num_columns: int, dtype: np.dtype, order: str):
+    """
+    Fill arrays of batch_rows rows from the record batches, a record batch spanning two arrays is sliced without
+    copying
+    """
+    matrix = None
+    offset = 0
+
+    for batch in record_batches:
+        start = 0
+
+        while start < batch.num_rows:
+            if matrix is None:
+                matrix = np.empty((batch_rows, num_columns), dtype=dtype, order=order)
+                offset = 0
+
+            num_rows = min(batch_rows - offset, batch.num_rows - start)
+            _copy_to_matrix(batch.slice(start, num_rows), matrix[offset:offset + num_rows])
+            start += num_rows
+            offset += num_rows
+
+            if offset == batch_rows:
+                yield matrix
+                matrix = None
+
+    if matrix is not None:
+        yield _contiguous(matrix[:offset], order)
+
+
+def _contiguous(matrix: np.ndarray, order: str) -> np.ndarray:
+    """
+    :return: the matrix, copied only when its rows were sliced out of a column-major array
+    """
+    return np.ascontiguousarray(matrix) if order == "C" else np.asfortranarray(matrix)
+
+
+def _coalesce_batches(record_batches, target_bytes: int = None, min_rows: int = None, max_rows: int = None):
+    """
+    Resize the record batches to about target_bytes, at least min_rows and at most max_rows rows. Consecutive small
+    batches are concatenated, a batch of the requested size is sliced out of larger ones without copying.
+    """
+    pending = []
+    pending_rows = 0
+    pending_bytes = 0
+
+    def is_full():
+        if max_rows is not None and pending_rows >= max_rows:
+            return True
+
+        return (target_bytes is None or pending_bytes >= target_bytes) and \
+            (min_rows is None or pending_rows >= min_rows)
+
+    def combine():
+        if len(pending) == 1:
+            return pending[0]
+
+        return pa.Table.from_batches(pending).combine_chunks().to_batches()[0]
+
+    for batch in record_batches:
+        if batch.num_rows == 0:
+            continue
+
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        pending_bytes += batch.nbytes
+
+        if not is_full():
+            continue
+
+        batch = combine()
+        rows = batch.num_rows
+
+        if target_bytes is not None:
+            rows = max(1, min_rows or 1, target_bytes * batch.num_rows // max(batch.nbytes, 1))
+
+        if max_rows is not None:
+            rows = min(rows, max_rows)
+
+        offset = 0
+
+        while batch.num_rows - offset >= rows:
+            yield batch.slice(offset, rows)
+            offset += rows
+
+        # the rows left are kept for the next batch
+        pending = [batch.slice(offset)] if offset < batch.num_rows else []
+        pending_rows = batch.num_rows - offset
+        pending_bytes = pending[0].nbytes if pending else 0
+
+    if pending:
+        yield combine()
+
+
+def _scan_limited(dataset: ds.FileSystemDataset, limit: int, columns, expression: ds.Expression, options: dict):
+    remaining = limit
+
+    if remaining == 0:
+        return
+
+    # the partitions not matching the expression are skipped without reading their footers
+    fragments = dataset.get_fragments(filter=expression)
+    first = next(fragments, None)
+
+    if first is None:
+        return
+
+    # the row groups whose statistics do not match the expression are left out
+    row_groups = first.split_by_row_group(filter=expression, schema=dataset.schema)
+    rest = list(fragments)
+
+    if len(row_groups) > 1:
+        rest.insert(0, first.subset(row_group_ids=[row_group.row_groups[0].id for row_group in row_groups[1:]]))
+
+    # a small limit is answered by the first row group alone, the rest is scanned with the readahead of the options
+    scanners = [ds.Scanner.from_fragment(row_group, schema=dataset.schema, columns=columns, filter=expression,
+                                         **options) for row_group in row_groups[:1]]
+
+    if rest:
+        rest_dataset = ds.FileSystemDataset(rest, dataset.schema, dataset.format, dataset.filesystem)
+        scanners.append(rest_dataset.scanner(columns=columns, filter=expression, **options))
+
+    for scanner in scanners:
+        for batch in scanner.to_batches():
+            if batch.num_rows >= remaining:
+                yield batch.slice(0, remaining)
+                return
+
+            remaining -= batch.num_rows
+            yield batch
+
+
+def _read_footers(fragments: list):
+    """
+    Read the footers of the parquet fragments, up to FOOTER_READAHEAD at a time, instead of one after another when
+    their statistics are first accessed. The footers already held by a fragment are not read again.
+    """
+    if len(fragments) < 2:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(fragments), FOOTER_READAHEAD),
+                            thread_name_prefix="cloud_arrow-footers") as executor:
+        # raises the first error, e.g. of a file removed meanwhile
+        list(executor.map(lambda fragment: fragment.ensure_complete_metadata(), fragments))
+
+
+def _row_group_statistics(fragment, schema: pa.Schema, columns: set, statistics: dict) -> list:
+    """
+    Read the min/max and null count statistics of the given columns in each row group of a parquet fragment.
+    Only the column chunks of the requested columns are converted, the results are kept in statistics by file and
+    column.
+
+    :return: list of (row group id, dict of column to (min, max, null count)), columns without statistics are
+        missing
+    """
+    if fragment.num_row_groups == fragment.metadata.num_row_groups:
+        row_group_ids = range(fragment.num_row_groups)
+    else:
+        # a fragment of a summary file or a subset, holding only some of the row groups of the file
+        row_group_ids = [row_group.id for row_group in fragment.row_groups]
+
+    row_groups = [(row_group_id, {}) for row_group_id in row_group_ids]
+
+    for column in columns:
+        key = (fragment.path, column)
+        column_statistics = statistics.get(key)
+
+        if column_statistics is None:
+            column_statistics = statistics[key] = _column_statistics(fragment.metadata, schema, column)
+
+        for row_group_id, row_group in row_groups:
+            if column_statistics[row_group_id] is not None:
+                row_group[column] = column_statistics[row_group_id]
+
+    return row_groups
+
+
+def _column_statistics(metadata: pq.FileMetaData, schema: pa.Schema, column: str) -> list:
+    """
+    :return: (min, max, null count) of the column in each row group of the file, None when missing or for a
+        column not stored in the file (e.g. a partition column). min and max are None when the row group has only
+        null values or does not record them, the null count is None when not recorded
+    """
+    field_index = schema.get_field_index(column)
+    column_index = next((index for index in range(metadata.num_columns)
+                         if metadata.schema.column(index).path == column), None)
+
+    if field_index < 0 or column_index is None:
+        return [None] * metadata.num_row_groups
+
+    column_type = schema.field(field_index).type
+    column_statistics = []
+
+    for row_group_id in range(metadata.num_row_groups):
+        chunk_statistics = metadata.row_group(row_group_id).column(column_index).statistics
+
+        if chunk_statistics is None:
+            column_statistics.append(None)
+            continue
+
+        null_count = chunk_statistics.null_count if chunk_statistics.has_null_count else None
+
+        if chunk_statistics.has_min_max:
+            column_statistics.append((pa.scalar(chunk_statistics.min, type=column_type).as_py(),
+                                      pa.scalar(chunk_statistics.max, type=column_type).as_py(), null_count))
+        else:
+            column_statistics.append((None, None, null_count))
+
+    return column_statistics
+
+
+def _list_data_files(filesystem, base_dir):
+    """
+    :param filesystem: fsspec filesystem
+    :return: iterator of (path relative to base_dir, info) of the data files below base_dir, skipping the files
+        and the directories (e.g. "_temporary", "_delta_log") starting with "_" or "." like the dataset discovery does
+    """
+    for name, info in filesystem.find(base_dir, detail=True).items():
+        relative_path = name[len(base_dir):].lstrip("/")
+
+        if not any(component.startswith(("_", ".")) for component in relative_path.split("/")):
+            yield relative_path, info
+
+
+def _load_consumed_files(state_path) -> dict:
+    try:
+        with open(state_path, "r") as state:
+            return json.load(state)["files"]
+    except FileNotFoundError:
+        return {}
+
+
+def _save_consumed_files(state_path, files: dict):
+    tmp_path = f"{state_path}.{threading.get_ident()}.tmp"
+
+    with open(tmp_path, "w") as state:
+        json.dump({"files": files}, state)
+    os.replace(tmp_path, state_path)
+
+
+def _as_fsspec_filesystem(filesystem):
+    if isinstance(filesystem, FileSystem):
+        return ArrowFSWrapper(filesystem)
+
+    return filesystem
+
+
+def _as_arrow_filesystem(filesystem) -> FileSystem:
+    if isinstance(filesystem, FileSystem):
+        return filesystem
+
+    return PyFileSystem(FSSpecHandler(filesystem))
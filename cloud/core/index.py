@@ -0,0 +1,310 @@
+import json
+import math
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pyarrow.fs import FileType
+
+__all__ = ['DatasetIndex']
+
+# sidecar index of a dataset, in its root directory. The leading "_" keeps it out of the dataset discovery
+INDEX_FILE = "_index"
+
+_INDEX_METADATA_KEY = b"cloud_arrow.index"
+_INDEX_VERSION = 1
+
+_ColumnIndex = namedtuple("_ColumnIndex", ["min", "max", "null_count", "bloom_filter"])
+_RowGroupIndex = namedtuple("_RowGroupIndex", ["id", "num_rows", "columns"])
+
+
+class DatasetIndex:
+    def __init__(self, schema: pa.Schema, bloom_filter_columns: list = None, bloom_filter_fpp: float = 0.01):
+        """
+        Sidecar index of the data files of a parquet dataset or delta table, holding for each row group the
+        min/max and null count of the indexed columns and, optionally, a bloom filter of their values. Reads
+        passing filters drop the files and row groups that can not match before reading any footer.
+
+        Files missing from the index are always read, an index lagging behind the data is never wrong. Files
+        rewritten in place by other writers must be indexed again with build_index().
+
+        :param schema: Fields of the indexed columns
+        :param bloom_filter_columns: Indexed columns also holding a bloom filter of each row group, used to skip
+            row groups by equality and In filters even when the values fall within their min/max
+        :param bloom_filter_fpp: False positive probability of the bloom filters
+        """
+        bloom_filter_columns = list(bloom_filter_columns or [])
+
+        for column in bloom_filter_columns:
+            if schema.get_field_index(column) < 0:
+                raise ValueError(f"The bloom filter column '{column}' is not an indexed column")
+
+        self._schema = schema
+        self._bloom_filter_columns = bloom_filter_columns
+        self._bloom_filter_fpp = bloom_filter_fpp
+        self._files = {}
+
+    @property
+    def columns(self) -> list:
+        return self._schema.names
+
+    @property
+    def bloom_filter_columns(self) -> list:
+        return self._bloom_filter_columns
+
+    @property
+    def files(self) -> set:
+        """
+        :return: paths of the indexed files, relative to the dataset root
+        """
+        return set(self._files)
+
+    def __len__(self):
+        return len(self._files)
+
+    def num_row_groups(self, file_path: str) -> int:
+        return len(self._files[file_path])
+
+    def add_file(self, file_path: str, metadata: pq.FileMetaData, open_file=None):
+        """
+        Index a data file, replacing its previous entry
+
+        :param file_path: Path of the file relative to the dataset root
+        :param metadata: Footer of the file, holding the statistics of its row groups
+        :param open_file: Callable returning the pyarrow.parquet.ParquetFile, called only to read the values of the
+            bloom filter columns
+        """
+        column_indexes = {field.name: _column_index(metadata, field.name) for field in self._schema}
+        bloom_filter_columns = [column for column in self._bloom_filter_columns if column_indexes[column] is not None]
+        parquet_file = open_file() if bloom_filter_columns and open_file is not None else None
+        row_groups = []
+
+        for row_group_id in range(metadata.num_row_groups):
+            row_group = metadata.row_group(row_group_id)
+            columns = {}
+
+            values = None if parquet_file is None else \
+                parquet_file.read_row_group(row_group_id, columns=bloom_filter_columns)
+
+            for field in self._schema:
+                column_index = column_indexes[field.name]
+
+                if column_index is None:
+                    # e.g. a partition column, not stored in the data files
+                    continue
+
+                statistics = row_group.column(column_index).statistics
+                minimum = maximum = null_count = bloom_filter = None
+
+                if statistics is not None:
+                    null_count = statistics.null_count if statistics.has_null_count else None
+
+                    if statistics.has_min_max:
+                        minimum = pa.scalar(statistics.min, type=field.type).as_py()
+                        maximum = pa.scalar(statistics.max, type=field.type).as_py()
+
+                if values is not None and field.name in bloom_filter_columns:
+                    bloom_filter = _BloomFilter.build(_hash_values(values.column(field.name), field.type),
+                                                      self._bloom_filter_fpp)
+
+                columns[field.name] = _ColumnIndex(minimum, maximum, null_count, bloom_filter)
+
+            row_groups.append(_RowGroupIndex(row_group_id, row_group.num_rows, columns))
+
+        self._files[file_path] = row_groups
+
+    def remove_file(self, file_path: str):
+        self._files.pop(file_path, None)
+
+    def prune(self, dnf) -> dict:
+        """
+        :param dnf: Tuple[Tuple[Condition]], the simplified disjunctive normal form of the filters
+        :return: ids of the row groups that may match, keyed by the path of each indexed file
+        """
+        probes = {}
+
+        for conjunction in dnf:
+            for literal in conjunction:
+                if literal._key in self._bloom_filter_columns and literal.probe_values() is not None:
+                    probes[literal] = _probe_hashes(literal.probe_values(),
+                                                    self._schema.field(literal._key).type)
+
+        return {file_path: [row_group.id for row_group in row_groups
+                            if any(all(_may_match(literal, row_group, probes.get(literal)) for literal in conjunction)
+                                   for conjunction in dnf)]
+                for file_path, row_groups in self._files.items()}
+
+    def to_table(self) -> pa.Table:
+        statistics_type = pa.struct([
+            pa.field(field.name, pa.struct([
+                pa.field("min", field.type),
+                pa.field("max", field.type),
+                pa.field("null_count", pa.int64()),
+                pa.field("bloom_filter", pa.binary())
+            ])) for field in self._schema
+        ])
+
+        schema = pa.schema([
+            pa.field("file", pa.string()),
+            pa.field("row_group", pa.int32()),
+            pa.field("num_rows", pa.int64()),
+            pa.field("statistics", statistics_type)
+        ], metadata={_INDEX_METADATA_KEY: json.dumps({
+            "version": _INDEX_VERSION,
+            "bloom_filter_columns": self._bloom_filter_columns,
+            "bloom_filter_fpp": self._bloom_filter_fpp
+        })})
+
+        rows = [{
+            "file": file_path,
+            "row_group": row_group.id,
+            "num_rows": row_group.num_rows,
+            "statistics": {column: {
+                "min": column_index.min,
+                "max": column_index.max,
+                "null_count": column_index.null_count,
+                "bloom_filter": column_index.bloom_filter.to_bytes() if column_index.bloom_filter else None
+            } for column, column_index in row_group.columns.items()}
+        } for file_path, row_groups in self._files.items() for row_group in row_groups]
+
+        return pa.Table.from_pylist(rows, schema=schema)
+
+    @staticmethod
+    def from_table(table: pa.Table):
+        options = json.loads(table.schema.metadata[_INDEX_METADATA_KEY])
+
+        if options["version"] != _INDEX_VERSION:
+            raise ValueError(f"Unsupported index version {options['version']}")
+
+        index = DatasetIndex(
+            schema=pa.schema([pa.field(field.name, field.type.field("min").type)
+                              for field in table.schema.field("statistics").type]),
+            bloom_filter_columns=options["bloom_filter_columns"],
+            bloom_filter_fpp=options["bloom_filter_fpp"]
+        )
+
+        for row in table.to_pylist():
+            columns = {column: _ColumnIndex(
+                statistics["min"],
+                statistics["max"],
+                statistics["null_count"],
+                _BloomFilter.from_bytes(statistics["bloom_filter"]) if statistics["bloom_filter"] else None
+            ) for column, statistics in row["statistics"].items() if statistics is not None}
+
+            index._files.setdefault(row["file"], []).append(_RowGroupIndex(row["row_group"], row["num_rows"], columns))
+
+        return index
+
+    def write(self, filesystem, path: str):
+        """
+        :param filesystem: pyarrow filesystem
+        """
+        pq.write_table(self.to_table(), path, filesystem=filesystem, compression="zstd")
+
+    @staticmethod
+    def read(filesystem, path: str):
+        """
+        :param filesystem: pyarrow filesystem
+        :return: the DatasetIndex stored at path, None when there is none
+        """
+        if filesystem.get_file_info(path).type != FileType.File:
+            return None
+
+        return DatasetIndex.from_table(pq.read_table(path, filesystem=filesystem))
+
+
+def _column_index(metadata: pq.FileMetaData, column: str):
+    """
+    :return: index of the column chunk of the column in the row groups, None when not stored in the file
+    """
+    return next((index for index in range(metadata.num_columns) if metadata.schema.column(index).path == column),
+                None)
+
+
+def _may_match(literal, row_group: _RowGroupIndex, probe) -> bool:
+    column_index = row_group.columns.get(literal._key)
+
+    if column_index is None:
+        return True
+
+    # every value is null, a comparison never holds
+    if column_index.null_count is not None and column_index.null_count >= row_group.num_rows:
+        return False
+
+    if column_index.min is not None and column_index.max is not None:
+        if not literal.may_match(column_index.min, column_index.max):
+            return False
+
+    if probe is not None and column_index.bloom_filter is not None:
+        return column_index.bloom_filter.may_contain_any(probe)
+
+    return True
+
+
+def _probe_hashes(values, value_type: pa.DataType):
+    try:
+        return _hash_values(pa.array(list(values), type=value_type), value_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        # values of another type, the bloom filter can not tell
+        return None
+
+
+def _hash_values(values, value_type: pa.DataType) -> np.ndarray:
+    """
+    :return: 64 bits hashes of the non null values, equal values of the same type always get the same hash
+    """
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+
+    values = pc.drop_null(values.cast(value_type))
+
+    return pd.util.hash_array(values.to_numpy(zero_copy_only=False))
+
+
+class _BloomFilter:
+
+    def __init__(self, bits: np.ndarray, num_hashes: int):
+        self._bits = bits
+        self._num_hashes = num_hashes
+
+    @staticmethod
+    def build(hashes: np.ndarray, fpp: float):
+        hashes = np.unique(hashes)
+        count = max(len(hashes), 1)
+        num_bits = max(64, math.ceil(-count * math.log(fpp) / math.log(2) ** 2 / 8) * 8)
+        num_hashes = max(1, round(num_bits / count * math.log(2)))
+
+        bits = np.zeros(num_bits, dtype=bool)
+        bits[_BloomFilter._positions(hashes, num_bits, num_hashes).ravel()] = True
+
+        return _BloomFilter(bits, num_hashes)
+
+    @staticmethod
+    def from_bytes(data: bytes):
+        return _BloomFilter(np.unpackbits(np.frombuffer(data, dtype=np.uint8, offset=1)).astype(bool), data[0])
+
+    def to_bytes(self) -> bytes:
+        return bytes([self._num_hashes]) + np.packbits(self._bits).tobytes()
+
+    def may_contain_any(self, hashes: np.ndarray) -> bool:
+        if len(hashes) == 0:
+            return False
+
+        positions = _BloomFilter._positions(hashes, len(self._bits), self._num_hashes)
+
+        return bool(self._bits[positions].all(axis=1).any())
+
+    @staticmethod
+    def _positions(hashes: np.ndarray, num_bits: int, num_hashes: int) -> np.ndarray:
+        # double hashing, the i-th position of a value is h1 + i * h2
+        first = hashes & np.uint64(0xFFFFFFFF)
+        second = (hashes >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(num_hashes, dtype=np.uint64)
+
+        return (first[:, None] + steps[None, :] * second[:, None]) % np.uint64(num_bits)
@@ -0,0 +1,289 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fsspec.implementations.arrow import ArrowFSWrapper
+from pyarrow.fs import FileSystem, FSSpecHandler, PyFileSystem
+
+from .blockcache import _RandomAccessFile, _object_version
+
+__all__ = ['MetadataCache']
+
+_PARQUET_MAGIC = b"PAR1"
+
+# the parquet reader fetches this many bytes from the end of the file to read the footer in a single request
+FOOTER_READ_SIZE = 64 * 2 ** 10
+
+
+class MetadataCache:
+    def __init__(self, max_bytes: int = 256 * 2 ** 20, directory: str = None):
+        """
+        Size bounded cache of parquet footers. Share one instance between the storage objects of a process so
+        that a footer fetched by any of them is reused by all the following dataset(), read_batches() and
+        metadata reads. Footers are keyed by the file path, size and version (generation, etag or modification
+        time), a modified file is never served a stale footer.
+
+        The cache keeps the tail of each file as read by the parquet reader (the last 64 KiB, or the footer when
+        larger), so re-opening a file does not request its footer again.
+
+        :param max_bytes: Maximum size in bytes of the cached footers, the least recently used ones are evicted first
+        :param directory: Local directory where the footers are persisted, default None keeps them in memory only.
+            New processes using the same directory start with a warm cache.
+        """
+        self._max_bytes = max_bytes
+        self._directory = directory
+        self._entries = OrderedDict()
+        self._parsed = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "footers": len(self._entries),
+            "bytes": self._size
+        }
+
+    def wrap(self, filesystem) -> FileSystem:
+        """
+        Wrap a filesystem so the footers of the files opened for reading are served through the cache
+
+        :param filesystem: fsspec or pyarrow filesystem
+        :return: pyarrow filesystem
+        """
+        if isinstance(filesystem, FileSystem):
+            filesystem = ArrowFSWrapper(filesystem)
+
+        return PyFileSystem(_MetadataCacheHandler(filesystem, self))
+
+    def metadata(self, filesystem, path: str) -> pq.FileMetaData:
+        """
+        Read the metadata of a parquet file through the cache
+
+        :param filesystem: fsspec filesystem
+        :param path: Path of the parquet file in the filesystem
+        :return: pyarrow.parquet.FileMetaData
+        """
+        info = filesystem.info(path)
+        key = _footer_key(path, info)
+
+        if key is None:
+            return pq.read_metadata(pa.BufferReader(_read_tail(filesystem, path, info["size"])))
+
+        with self._lock:
+            metadata = self._parsed.get(key)
+
+            if metadata is not None and key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return metadata
+
+        tail = self.get(key)
+
+        if tail is None:
+            tail = _read_tail(filesystem, path, info["size"])
+            self.put(key, tail)
+
+        metadata = pq.read_metadata(pa.BufferReader(tail))
+
+        with self._lock:
+            if key in self._entries:
+                self._parsed[key] = metadata
+
+        return metadata
+
+    def get(self, key: str):
+        """
+        :return: tail bytes of the file or None when not cached
+        """
+        with self._lock:
+            tail = self._entries.get(key)
+
+            if tail is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return tail
+
+        tail = self._load(key)
+
+        with self._lock:
+            if tail is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._add(key, tail)
+
+        return tail
+
+    def put(self, key: str, tail: bytes):
+        with self._lock:
+            self._add(key, tail)
+
+        if self._directory is not None:
+            path = os.path.join(self._directory, key)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+
+            with open(tmp_path, "wb") as footer:
+                footer.write(tail)
+            os.replace(tmp_path, path)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _load(self, key: str):
+        if self._directory is None:
+            return None
+
+        try:
+            with open(os.path.join(self._directory, key), "rb") as footer:
+                return footer.read()
+        except FileNotFoundError:
+            return None
+
+    def _add(self, key: str, tail: bytes):
+        previous = self._entries.pop(key, None)
+
+        if previous is not None:
+            self._size -= len(previous)
+            self._parsed.pop(key, None)
+
+        self._entries[key] = tail
+        self._size += len(tail)
+
+        while self._size > self._max_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        tail = self._entries.pop(key, None)
+        self._parsed.pop(key, None)
+
+        if tail is not None:
+            self._size -= len(tail)
+
+        if self._directory is not None:
+            try:
+                os.remove(os.path.join(self._directory, key))
+            except FileNotFoundError:
+                pass
+
+
+def _footer_key(path: str, info: dict):
+    version = _object_version(info)
+
+    if version is None:
+        return None
+
+    return hashlib.sha256(f"{path}\0{version}".encode()).hexdigest()
+
+
+def _footer_length(tail: bytes):
+    """
+    :return: length of the serialized footer (metadata, length and magic), None when tail is not a parquet tail
+    """
+    if len(tail) < 8 or tail[-4:] != _PARQUET_MAGIC:
+        return None
+
+    return int.from_bytes(tail[-8:-4], "little") + 8
+
+
+def _read_tail(filesystem, path: str, size: int) -> bytes:
+    tail = filesystem.cat_file(path, start=max(0, size - FOOTER_READ_SIZE), end=size)
+    footer_length = _footer_length(tail)
+
+    if footer_length is None:
+        raise ValueError(f"{path} is not a parquet file")
+
+    if footer_length > len(tail):
+        tail = filesystem.cat_file(path, start=size - footer_length, end=size)
+
+    return tail
+
+
+class _MetadataCacheHandler(FSSpecHandler):
+
+    def __init__(self, fs, cache: MetadataCache):
+        super().__init__(fs)
+        self._cache = cache
+
+    def __eq__(self, other):
+        if isinstance(other, _MetadataCacheHandler):
+            return self.fs == other.fs and self._cache is other._cache
+        return NotImplemented
+
+    def __ne__(self, other):
+        return not self == other
+
+    def get_type_name(self):
+        return f"metadatacache+{super().get_type_name()}"
+
+    def open_input_file(self, path):
+        info = self.fs.info(path)
+
+        if info["type"] != "file":
+            raise FileNotFoundError(path)
+
+        key = _footer_key(path, info)
+
+        if key is None:
+            return pa.PythonFile(self.fs.open(path, mode="rb"), mode="r")
+
+        return pa.PythonFile(_MetadataCachedFile(self.fs, self._cache, path, key, info["size"]), mode="r")
+
+
+class _MetadataCachedFile(_RandomAccessFile):
+
+    def __init__(self, fs, cache: MetadataCache, path: str, key: str, size: int):
+        super().__init__(size)
+        self._fs = fs
+        self._cache = cache
+        self._path = path
+        self._key = key
+        self._file = None
+        self._tail = cache.get(key)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+    def _read_range(self, start: int, end: int) -> bytes:
+        tail_start = self._size - len(self._tail) if self._tail is not None else self._size
+
+        if start >= tail_start:
+            return self._tail[start - tail_start:end - tail_start]
+
+        if self._file is None:
+            self._file = self._fs.open(self._path, mode="rb")
+
+        self._file.seek(start)
+        data = self._file.read(end - start)
+
+        # the read of the footer done by the parquet reader, keep it for the next opening of the file
+        if end == self._size and self._tail is None:
+            footer_length = _footer_length(data)
+
+            if footer_length is not None and footer_length <= len(data):
+                self._tail = data
+                self._cache.put(self._key, data)
+
+        return data
@@ -0,0 +1,165 @@
+import threading
+from collections import deque
+
+__all__ = ['PrefetchIterator']
+
+_DONE = object()
+
+
+class PrefetchIterator:
+    def __init__(self, source, max_batches: int = None, max_bytes: int = None):
+        """
+        Iterator reading the record batches (or dataframes) of source ahead of the consumer on a background thread,
+        so the reads of the storage overlap with the work done on each batch. The batches read ahead wait in a queue bounded by
+        count and by size, a batch larger than max_bytes is still queued alone.
+
+        Closing the iterator, or dropping it, stops the background read. An error raised by source is raised by
+        the next call to next() once the batches read before it are consumed.
+
+        :param source: Iterator of RecordBatch or pandas DataFrame
+        :param max_batches: Maximum number of batches read ahead, default None is not bounded by count
+        :param max_bytes: Maximum size in bytes of the batches read ahead, default None is not bounded by size
+        """
+        if max_batches is None and max_bytes is None:
+            raise ValueError("At least one of max_batches and max_bytes must be given")
+
+        if max_batches is not None and max_batches < 1:
+            raise ValueError("max_batches must be greater than 0")
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+
+        # the thread only holds the queue, the iterator is closed when the consumer drops it
+        self._queue = _PrefetchQueue(max_batches, max_bytes)
+        self._thread = threading.Thread(target=_prefetch, args=(iter(source), self._queue),
+                                        name="cloud_arrow-prefetch", daemon=True)
+        self._thread.start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        batch = self._queue.get()
+
+        if batch is _DONE:
+            raise StopIteration
+
+        return batch
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        # not set when the arguments were rejected
+        queue = getattr(self, "_queue", None)
+
+        if queue is not None:
+            queue.cancel()
+
+    def close(self):
+        """
+        Stop the background read and wait for it to end, the batches read ahead are discarded
+        """
+        self._queue.cancel()
+
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+
+class _PrefetchQueue:
+
+    def __init__(self, max_batches: int, max_bytes: int):
+        self._max_batches = max_batches
+        self._max_bytes = max_bytes
+        self._batches = deque()
+        self._bytes = 0
+        self._error = None
+        self._done = False
+        self._cancelled = False
+        self._condition = threading.Condition()
+
+    def put(self, batch) -> bool:
+        """
+        Wait for room in the queue and add the batch
+
+        :return: False when the consumer cancelled the read
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._cancelled or self._has_room(_nbytes(batch)))
+
+            if self._cancelled:
+                return False
+
+            self._batches.append(batch)
+            self._bytes += _nbytes(batch)
+            self._condition.notify_all()
+
+            return True
+
+    def finish(self, error: BaseException = None):
+        with self._condition:
+            self._done = True
+            self._error = error
+            self._condition.notify_all()
+
+    def get(self):
+        """
+        :return: the next batch, _DONE once the source is exhausted
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._batches or self._done or self._cancelled)
+
+            if self._batches:
+                batch = self._batches.popleft()
+                self._bytes -= _nbytes(batch)
+                self._condition.notify_all()
+                return batch
+
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+
+            return _DONE
+
+    def cancel(self):
+        with self._condition:
+            self._cancelled = True
+            self._batches.clear()
+            self._bytes = 0
+            self._condition.notify_all()
+
+    def _has_room(self, nbytes: int) -> bool:
+        if not self._batches:
+            return True
+
+        if self._max_batches is not None and len(self._batches) >= self._max_batches:
+            return False
+
+        return self._max_bytes is None or self._bytes + nbytes <= self._max_bytes
+
+
+def _nbytes(item) -> int:
+    nbytes = getattr(item, "nbytes", None)
+
+    # dataframes report the size of their columns with memory_usage()
+    return int(item.memory_usage(index=False).sum()) if nbytes is None else nbytes
+
+
+def _prefetch(source, queue: _PrefetchQueue):
+    try:
+        for batch in source:
+            if not queue.put(batch):
+                break
+    except BaseException as error:
+        queue.finish(error)
+    else:
+        queue.finish()
+    finally:
+        # stops the scan of a generator source, e.g. one reading row groups one at a time
+        close = getattr(source, "close", None)
+
+        if close is not None:
+            close()
@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from deltalake import DeltaTable
+
+from .cache import _overlaps
+
+__all__ = ['SnapshotCache']
+
+
+class SnapshotCache:
+    def __init__(self, max_entries: int = 32, max_staleness: float = 0):
+        """
+        Cache of opened delta tables (snapshots of the transaction log) keyed by table URI. A cached table is
+        brought up to date with update_incremental(), reading only the commits made since it was loaded, instead
+        of replaying the log from the last checkpoint. Tables pinned to a version never change and are not
+        refreshed.
+
+        :param max_entries: Maximum number of tables kept, the least recently used one is evicted first
+        :param max_staleness: Seconds a table is used without checking for new commits. Default 0 checks on every
+            read, None never checks, leaving the refresh to invalidate()
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than 0")
+
+        self._max_entries = max_entries
+        self._max_staleness = max_staleness
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @property
+    def max_staleness(self) -> float:
+        return self._max_staleness
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "tables": len(self._entries)
+        }
+
+    @contextmanager
+    def snapshot(self, table_uri: str, version: int = None, storage_options: dict = None):
+        """
+        Get the table at table_uri, opening it or refreshing it when needed. The table is locked while the context
+        is active, so it is not refreshed while being read.
+
+        :param table_uri: URI of the delta table
+        :param version: Version the table is pinned to, default None uses the latest version
+        :param storage_options: Options used to open the table
+        :return: context manager yielding the DeltaTable
+        """
+        key = (table_uri, version)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                entry = _Snapshot()
+                self._entries[key] = entry
+
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+        with entry.lock:
+            if entry.table is None:
+                entry.table = DeltaTable(table_uri=table_uri, version=version, storage_options=storage_options)
+                entry.refreshed_at = time.monotonic()
+            elif version is None and self._is_stale(entry):
+                entry.table.update_incremental()
+                entry.refreshed_at = time.monotonic()
+                self.refreshes += 1
+
+            yield entry.table
+
+    def invalidate(self, table_uri: str = None):
+        """
+        Remove the cached tables located at, above or below the given URI
+
+        :param table_uri: URI of the delta table, default None removes every entry
+        """
+        with self._lock:
+            if table_uri is None:
+                self._entries.clear()
+                return
+
+            for key in [key for key in self._entries if _overlaps(key[0], table_uri)]:
+                del self._entries[key]
+
+    def _is_stale(self, entry) -> bool:
+        if self._max_staleness is None:
+            return False
+
+        return time.monotonic() - entry.refreshed_at >= self._max_staleness
+
+
+class _Snapshot:
+
+    def __init__(self):
+        self.table = None
+        self.refreshed_at = None
+        self.lock = threading.Lock()
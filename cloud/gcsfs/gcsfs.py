@@ -4,7 +4,7 @@ from typing import Any
 
 from gcsfs import GCSFileSystem
 
-from ..core import AbstractStorage
+from ..core import AbstractStorage, BlockCache, DatasetCache, MetadataCache, ScanOptions, SnapshotCache
 
 
 class GCSFSStorage(AbstractStorage, metaclass=ABCMeta):
@@ -14,7 +14,11 @@ class GCSFSStorage(AbstractStorage, metaclass=ABCMeta):
                  access: str,
                  token: str,
                  bucket: str,
-                 default_location: str):
+                 default_location: str,
+                 dataset_cache: DatasetCache = None,
+                 block_cache: BlockCache = None,
+                 metadata_cache: MetadataCache = None,
+                 snapshot_cache: SnapshotCache = None):
 
         """
         :param project:
@@ -22,9 +26,14 @@ class GCSFSStorage(AbstractStorage, metaclass=ABCMeta):
         :param token:
         :param bucket:
         :param default_location:
+        :param dataset_cache: Cache for the discovered datasets, default None
+        :param block_cache: Local cache for the blocks read from the storage, default None
+        :param metadata_cache: Cache for the parquet footers, default None
+        :param snapshot_cache: Cache for the opened delta tables, default None
         """
 
-        super().__init__()
+        super().__init__(dataset_cache=dataset_cache, block_cache=block_cache, metadata_cache=metadata_cache,
+                         snapshot_cache=snapshot_cache)
         self._logger = logging.getLogger('cloud_arrow.gcsfsObjectStorage')
 
         self._project = project
@@ -33,14 +42,34 @@ class GCSFSStorage(AbstractStorage, metaclass=ABCMeta):
         self._bucket = bucket
         self._default_location = default_location
 
-    def _get_filesystem(self) -> Any:
+    def _create_filesystem(self) -> Any:
+        # skip the fsspec instance cache, the client lifetime is owned by the storage object
         return GCSFileSystem(
             project=self._project,
             access=self._access,
             token=self._token,
-            default_location=self._default_location
+            default_location=self._default_location,
+            skip_instance_cache=True
         )
 
+    def _close_filesystem(self, filesystem):
+        GCSFileSystem.close_session(filesystem.loop, filesystem._session)
+
+    def refresh_credentials(self, token: str = None):
+        """
+        Discard the cached filesystem client, the next read or write authenticates again
+
+        :param token: New authentication method or credentials filename path, default None keeps the current one
+        """
+        if token is not None:
+            self._token = token
+
+        super().refresh_credentials()
+
+    def _get_scan_options(self) -> ScanOptions:
+        # footers and column chunks are fetched with separate requests, reading more files at once hides their latency
+        return ScanOptions(fragment_readahead=8)
+
     def _get_filesystem_base_path(self, path):
         return f"{self._bucket}/{AbstractStorage._normalize_path(path)}"
 
@@ -4,20 +4,28 @@ from typing import Any
 
 from pyarrow.fs import LocalFileSystem
 
-from ..core import AbstractStorage
+from ..core import AbstractStorage, BlockCache, DatasetCache, MetadataCache, SnapshotCache
 
 
 class LocalFileSystemStorage(AbstractStorage, metaclass=ABCMeta):
 
-    def __init__(self):
+    def __init__(self,
+                 dataset_cache: DatasetCache = None,
+                 block_cache: BlockCache = None,
+                 metadata_cache: MetadataCache = None,
+                 snapshot_cache: SnapshotCache = None):
 
         """
-
+        :param dataset_cache: Cache for the discovered datasets, default None
+        :param block_cache: Local cache for the blocks read from the storage, default None
+        :param metadata_cache: Cache for the parquet footers, default None
+        :param snapshot_cache: Cache for the opened delta tables, default None
         """
-        super().__init__()
+        super().__init__(dataset_cache=dataset_cache, block_cache=block_cache, metadata_cache=metadata_cache,
+                         snapshot_cache=snapshot_cache)
         self._logger = logging.getLogger('cloud_arrow.localFileSystemReader')
 
-    def _get_filesystem(self) -> Any:
+    def _create_filesystem(self) -> Any:
         return LocalFileSystem()
 
     def _get_filesystem_base_path(self, path):
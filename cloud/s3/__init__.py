@@ -0,0 +1 @@
+from .s3 import S3Storage
@@ -0,0 +1,278 @@
+import asyncio
+import logging
+from abc import ABCMeta
+from collections import deque
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+from fsspec.asyn import sync
+from s3fs import S3FileSystem
+from s3fs.core import S3File, _inner_fetch
+
+from ..core import AbstractStorage, BlockCache, DatasetCache, MetadataCache, ScanOptions, SnapshotCache
+
+# S3 rejects multipart uploads with parts smaller than 5 MiB (except the last one)
+MIN_PART_SIZE = 5 * 2 ** 20
+
+# ranged reads are only split in concurrent GET requests of at least this size, the latency of each request
+# outweighs the transfer of smaller ranges
+MIN_RANGE_PART_SIZE = 4 * 2 ** 20
+
+
+class S3Storage(AbstractStorage, metaclass=ABCMeta):
+
+    def __init__(self,
+                 access_key: str,
+                 secret_key: str,
+                 bucket: str,
+                 region: str = None,
+                 endpoint_url: str = None,
+                 part_size: int = 50 * 2 ** 20,
+                 max_concurrency: int = 8,
+                 range_size: int = 32 * 2 ** 20,
+                 dataset_cache: DatasetCache = None,
+                 block_cache: BlockCache = None,
+                 metadata_cache: MetadataCache = None,
+                 snapshot_cache: SnapshotCache = None):
+
+        """
+        :param access_key: AWS access key id
+        :param secret_key: AWS secret access key
+        :param bucket: Name of the bucket that hold the data
+        :param region: AWS region of the bucket, default None uses the AWS default region
+        :param endpoint_url: URL of an S3 compatible service (e.g. MinIO), default None uses AWS S3
+        :param part_size: Size in bytes of each part of the multipart uploads, default 50 MiB
+        :param max_concurrency: Maximum number of requests in flight for each object: parts of a multipart upload
+            uploaded concurrently, and ranged GET requests a coalesced read of range_size bytes is split in, default 8.
+            A file being written holds up to max_concurrency * part_size bytes in memory
+        :param range_size: Maximum size in bytes of the coalesced ranged GET requests issued when reading
+            parquet column chunks, default 32 MiB
+        :param dataset_cache: Cache for the discovered datasets, default None
+        :param block_cache: Local cache for the blocks read from the storage, default None
+        :param metadata_cache: Cache for the parquet footers, default None
+        :param snapshot_cache: Cache for the opened delta tables, default None
+        """
+
+        super().__init__(dataset_cache=dataset_cache, block_cache=block_cache, metadata_cache=metadata_cache,
+                         snapshot_cache=snapshot_cache)
+        self._logger = logging.getLogger('cloud_arrow.s3ObjectStorage')
+
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0")
+
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._bucket = bucket
+        self._region = region
+        self._endpoint_url = endpoint_url
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._range_size = range_size
+
+    def _create_filesystem(self) -> Any:
+        # default_block_size is the multipart part size of the written objects. Reads skip the fsspec block
+        # cache, the parquet reader already requests the exact (coalesced) byte ranges it needs
+        return _S3FileSystem(
+            key=self._access_key,
+            secret=self._secret_key,
+            endpoint_url=self._endpoint_url,
+            client_kwargs={} if self._region is None else {"region_name": self._region},
+            default_block_size=self._part_size,
+            default_cache_type="none",
+            max_concurrency=self._max_concurrency,
+            skip_instance_cache=True
+        )
+
+    def _close_filesystem(self, filesystem):
+        # the client is only created by the first request
+        if filesystem._s3 is None:
+            return
+
+        S3FileSystem.close_session(filesystem.loop, filesystem._s3)
+
+    def refresh_credentials(self, access_key: str = None, secret_key: str = None):
+        """
+        Discard the cached filesystem client, the next read or write authenticates again
+
+        :param access_key: New AWS access key id, default None keeps the current one
+        :param secret_key: New AWS secret access key, default None keeps the current one
+        """
+        if access_key is not None:
+            self._access_key = access_key
+
+        if secret_key is not None:
+            self._secret_key = secret_key
+
+        super().refresh_credentials()
+
+    def _get_parquet_file_format(self):
+        # pre-buffer the column chunks of each row group, nearby ranges are merged into ranged GET requests of
+        # up to range_size bytes issued on the arrow io thread pool
+        return ds.ParquetFileFormat(
+            default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+                pre_buffer=True,
+                cache_options=pa.CacheOptions(
+                    hole_size_limit=2 ** 20,
+                    range_size_limit=self._range_size,
+                    lazy=True
+                )
+            )
+        )
+
+    def _get_scan_options(self) -> ScanOptions:
+        # the pre-buffered ranged GETs of 8 files are kept in flight instead of 4
+        return ScanOptions(fragment_readahead=8)
+
+    def _get_filesystem_base_path(self, path):
+        return f"{self._bucket}/{AbstractStorage._normalize_path(path)}"
+
+    def _get_deltalake_storage_options(self):
+        """
+            For delta-io documentation see: https://delta-io.github.io/delta-rs/python/usage.html#querying-delta-tables
+            For AWS Options see: https://docs.rs/object_store/latest/object_store/aws/enum.AmazonS3ConfigKey.html
+        """
+        storage_options = {
+            "AWS_ACCESS_KEY_ID": f"{self._access_key}",
+            "AWS_SECRET_ACCESS_KEY": f"{self._secret_key}",
+            # no locking provider is configured, concurrent writers to the same table are not safe
+            "AWS_S3_ALLOW_UNSAFE_RENAME": "true"
+        }
+
+        if self._region is not None:
+            storage_options["AWS_REGION"] = f"{self._region}"
+
+        if self._endpoint_url is not None:
+            storage_options["AWS_ENDPOINT_URL"] = f"{self._endpoint_url}"
+            storage_options["AWS_ALLOW_HTTP"] = str(self._endpoint_url.startswith("http://")).lower()
+
+        return storage_options
+
+    def _get_deltalake_url(self, path) -> str:
+        return f"s3://{self._bucket}/{AbstractStorage._normalize_path(path)}"
+
+
+class _S3FileSystem(S3FileSystem):
+    """
+    S3FileSystem opening _S3File, the files it opens keep up to max_concurrency requests in flight
+    """
+
+    def _open(self, path, mode="rb", block_size=None, acl=False, version_id=None, fill_cache=None, cache_type=None,
+              autocommit=True, size=None, requester_pays=None, cache_options=None, **kwargs):
+        if not self.version_aware and version_id:
+            raise ValueError("version_id cannot be specified if the filesystem is not version aware")
+
+        s3_additional_kwargs = self.s3_additional_kwargs.copy()
+        s3_additional_kwargs.update(kwargs)
+
+        return _S3File(
+            self,
+            path,
+            mode,
+            block_size=self.default_block_size if block_size is None else block_size,
+            acl=acl or self.s3_additional_kwargs.get("ACL", False) or self.s3_additional_kwargs.get("acl", False),
+            version_id=version_id,
+            fill_cache=self.default_fill_cache if fill_cache is None else fill_cache,
+            s3_additional_kwargs=s3_additional_kwargs,
+            cache_type=self.default_cache_type if cache_type is None else cache_type,
+            autocommit=autocommit,
+            requester_pays=bool(self.req_kw) if requester_pays is None else requester_pays,
+            cache_options=cache_options,
+            size=size
+        )
+
+
+class _S3File(S3File):
+    """
+    S3File uploading the parts of a multipart upload in the background, up to max_concurrency at a time, while the
+    writer fills the next part, and reading large ranges with concurrent ranged GET requests
+    """
+
+    def __init__(self, *args, **kwargs):
+        # (part number, future) of the parts being uploaded, in part number order
+        self._pending = deque()
+        super().__init__(*args, **kwargs)
+
+    def _upload_chunk(self, final=False):
+        if self.autocommit and not self.append_block and final and self.tell() < self.blocksize:
+            # a small file, written with a single PUT by commit()
+            data1 = False
+        else:
+            self.buffer.seek(0)
+            (data0, data1) = (None, self.buffer.read(self.blocksize))
+
+        # the buffer is split in parts as S3File does, a short last part is merged into the previous one
+        while data1:
+            (data0, data1) = (data1, self.buffer.read(self.blocksize))
+
+            if 0 < len(data1) < self.blocksize:
+                remainder = data0 + data1
+
+                if len(remainder) <= self.part_max:
+                    (data0, data1) = (remainder, None)
+                else:
+                    (data0, data1) = (remainder[:len(remainder) // 2], remainder[len(remainder) // 2:])
+
+            self._submit_part(data0)
+
+        if self.autocommit and final:
+            self.commit()
+
+        return not final
+
+    def _submit_part(self, data: bytes):
+        while len(self._pending) >= self.fs.max_concurrency:
+            self._complete_part()
+
+        part = len(self.parts) + len(self._pending) + 1
+        future = asyncio.run_coroutine_threadsafe(
+            self.fs._call_s3("upload_part", self.s3_additional_kwargs, Bucket=self.bucket, Key=self.key,
+                             PartNumber=part, UploadId=self.mpu["UploadId"], Body=data),
+            self.fs.loop
+        )
+        self._pending.append((part, future))
+
+    def _complete_part(self):
+        part, future = self._pending.popleft()
+        out = future.result()
+
+        part_header = {"PartNumber": part, "ETag": out["ETag"]}
+
+        if "ChecksumSHA256" in out:
+            part_header["ChecksumSHA256"] = out["ChecksumSHA256"]
+
+        self.parts.append(part_header)
+
+    def commit(self):
+        while self._pending:
+            self._complete_part()
+
+        super().commit()
+
+    def discard(self):
+        # the parts in flight must end before the upload is aborted, their errors do not matter anymore
+        while self._pending:
+            self._pending.popleft()[1].exception()
+
+        super().discard()
+
+    def _fetch_range(self, start, end):
+        size = end - start
+        num_ranges = min(self.fs.max_concurrency, size // MIN_RANGE_PART_SIZE)
+
+        if num_ranges <= 1:
+            return super()._fetch_range(start, end)
+
+        step = -(-size // num_ranges)
+        ranges = [(offset, min(offset + step, end)) for offset in range(start, end, step)]
+
+        return b"".join(sync(self.fs.loop, _fetch_ranges, self.fs, self.bucket, self.key, self.version_id, ranges,
+                             self.req_kw))
+
+
+async def _fetch_ranges(fs, bucket, key, version_id, ranges, req_kw) -> list:
+    return await asyncio.gather(*[_inner_fetch(fs, bucket, key, version_id, start, end, req_kw)
+                                  for start, end in ranges])
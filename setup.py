@@ -16,13 +16,15 @@ setup(
               'cloud_arrow.core',
               'cloud_arrow.adls',
               'cloud_arrow.gcsfs',
-              'cloud_arrow.local'
+              'cloud_arrow.local',
+              'cloud_arrow.s3'
     ],
     package_dir={
         'cloud_arrow': 'cloud',
         'cloud_arrow.core': 'cloud/core',
         'cloud_arrow.adls': 'cloud/adls',
         'cloud_arrow.gcsfs': 'cloud/gcsfs',
-        'cloud_arrow.local': 'cloud/local'
+        'cloud_arrow.local': 'cloud/local',
+        'cloud_arrow.s3': 'cloud/s3'
     }
 )
\ No newline at end of file
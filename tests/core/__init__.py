@@ -1,3 +1,5 @@
 from .base_alds_test import ADLSTestBase
 from .base_local_test import LocalFilesystemTestBase
 from .base_test import TestBase
+from .counting_filesystem import CountingLocalFileSystem, CountingLocalFileSystemStorage
+from .base_s3_test import S3TestBase
@@ -0,0 +1,123 @@
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+
+import boto3
+
+from cloud.s3 import S3Storage
+from tests.core.base_test import TestBase
+
+
+class S3TestBase(TestBase):
+    """
+    Runs the tests against a local moto S3 server. The server runs in its own process, the deltalake
+    client holds the GIL while waiting for responses, so an in-process server would deadlock.
+    """
+
+    _access_key = "testing"
+    _secret_key = "testing"
+    _region = "us-east-1"
+    _bucket = "cloud-arrow"
+    _server = None
+    _endpoint_url = None
+    _s3_object_storage = None
+    _filesystem = None
+    _base_path = None
+    _test_table = None
+    _fixed_table = None
+
+    @classmethod
+    def setUpClass(cls):
+        port = cls._free_port()
+        cls._server = subprocess.Popen([sys.executable, "-m", "moto.server", "-H", "127.0.0.1", "-p", str(port)],
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        cls._endpoint_url = f"http://127.0.0.1:{port}"
+        cls._wait_for_server(port)
+
+        boto3.client("s3", endpoint_url=cls._endpoint_url, region_name=cls._region,
+                     aws_access_key_id=cls._access_key,
+                     aws_secret_access_key=cls._secret_key).create_bucket(Bucket=cls._bucket)
+
+        # Create the writer object
+        cls._s3_object_storage = cls.make_storage()
+        cls._filesystem = cls._s3_object_storage._get_filesystem()
+
+        cls._base_path = "write/diabetes"
+        cls._test_table = cls.make_mock_diabetes_arrow_table(random=True)
+        cls._fixed_table = cls.make_mock_diabetes_arrow_table(random=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._s3_object_storage.close()
+        cls._server.terminate()
+        cls._server.wait()
+
+    @classmethod
+    def make_storage(cls, **kwargs) -> S3Storage:
+        return S3Storage(
+            access_key=cls._access_key,
+            secret_key=cls._secret_key,
+            bucket=cls._bucket,
+            region=cls._region,
+            endpoint_url=cls._endpoint_url,
+            **kwargs
+        )
+
+    @classmethod
+    def count_requests(cls, filesystem) -> Counter:
+        """
+        :return: Counter of the S3 operations sent through the filesystem, updated as requests are made
+        """
+        requests = Counter()
+
+        def count(model, **kwargs):
+            requests[model.name] += 1
+
+        filesystem.connect()
+        filesystem.s3.meta.events.register("before-call.s3", count)
+        return requests
+
+    @classmethod
+    def count_concurrent_requests(cls, filesystem, latency: float = 0) -> Counter:
+        """
+        :param latency: Seconds each request waits before being sent, the local server answers faster than the
+            requests are issued, a latency makes the concurrent requests overlap as on a remote store
+        :return: Counter of the maximum number of requests of each S3 operation in flight at the same time
+        """
+        in_flight = Counter()
+        maximum = Counter()
+
+        async def before(model, **kwargs):
+            in_flight[model.name] += 1
+            maximum[model.name] = max(maximum[model.name], in_flight[model.name])
+            await asyncio.sleep(latency)
+
+        def after(model, **kwargs):
+            in_flight[model.name] -= 1
+
+        filesystem.connect()
+        filesystem.s3.meta.events.register("before-call.s3", before)
+        filesystem.s3.meta.events.register("after-call.s3", after)
+        return maximum
+
+    @staticmethod
+    def _free_port() -> int:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    @staticmethod
+    def _wait_for_server(port, timeout=30):
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
@@ -0,0 +1,63 @@
+import os
+import threading
+from collections import Counter
+
+from fsspec.implementations.local import LocalFileOpener, LocalFileSystem
+
+from cloud.local import LocalFileSystemStorage
+
+
+class CountingLocalFileOpener(LocalFileOpener):
+
+    def read(self, *args, **kwargs):
+        data = super().read(*args, **kwargs)
+        self.fs.read_requests += 1
+        self.fs.bytes_read += len(data)
+        return data
+
+
+class CountingLocalFileSystem(LocalFileSystem):
+    """
+    fsspec local filesystem recording the directory listings, the metadata requests by file name, the files opened
+    by each thread, and the bytes read through it
+    """
+    cachable = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.list_requests = 0
+        self.info_requests = Counter()
+        self.files_opened = 0
+        self.files_opened_by_thread = Counter()
+        self.read_requests = 0
+        self.bytes_read = 0
+
+    def ls(self, path, detail=False, **kwargs):
+        self.list_requests += 1
+        return super().ls(path, detail=detail, **kwargs)
+
+    def info(self, path, **kwargs):
+        self.info_requests[os.path.basename(path)] += 1
+        return super().info(path, **kwargs)
+
+    def _open(self, path, mode="rb", block_size=None, **kwargs):
+        path = self._strip_protocol(path)
+        if self.auto_mkdir and "w" in mode:
+            self.makedirs(self._parent(path), exist_ok=True)
+        if "r" in mode:
+            self.files_opened += 1
+            self.files_opened_by_thread[threading.current_thread().name] += 1
+        return CountingLocalFileOpener(path, mode, fs=self, **kwargs)
+
+
+class CountingLocalFileSystemStorage(LocalFileSystemStorage):
+
+    def _create_filesystem(self):
+        return CountingLocalFileSystem()
+
+    def _get_filesystem_base_path(self, path):
+        # fsspec lists local files with absolute paths
+        return os.path.abspath(super()._get_filesystem_base_path(path))
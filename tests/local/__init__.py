@@ -2,3 +2,27 @@ from .test_local_dataset import TestLocalFilesystemDataset
 from .test_local_read_batches import TestLocalFilesystemReadBatches
 from .test_local_read_to_pandas import TestLocalFilesystemReadToPandas
 from .test_local_write import TestLocalFilesystemWrite
+from .test_local_filesystem import TestLocalFilesystemClient
+from .test_local_dataset_cache import TestLocalFilesystemDatasetCache
+from .test_local_read_columns import TestLocalFilesystemReadColumns
+from .test_local_block_cache import TestLocalFilesystemBlockCache
+from .test_local_metadata_cache import TestLocalFilesystemMetadataCache
+from .test_local_summary_metadata import TestLocalFilesystemSummaryMetadata
+from .test_local_delta_file_skipping import TestLocalFilesystemDeltaFileSkipping
+from .test_local_snapshot_cache import TestLocalFilesystemSnapshotCache
+from .test_local_read_changes import TestLocalFilesystemReadChanges
+from .test_local_read_new_batches import TestLocalFilesystemReadNewBatches
+from .test_local_conditions import TestLocalFilesystemConditions
+from .test_local_in_condition import TestLocalFilesystemInCondition
+from .test_local_filter_simplifier import TestLocalFilesystemFilterSimplifier
+from .test_local_lookup import TestLocalFilesystemLookup
+from .test_local_sidecar_index import TestLocalFilesystemSidecarIndex
+from .test_local_metadata_aggregates import TestLocalFilesystemMetadataAggregates
+from .test_local_limit import TestLocalFilesystemLimit
+from .test_local_sample import TestLocalFilesystemSample
+from .test_local_scan_options import TestLocalFilesystemScanOptions
+from .test_local_prefetch import TestLocalFilesystemPrefetch
+from .test_local_batch_coalescing import TestLocalFilesystemBatchCoalescing
+from .test_local_pandas_options import TestLocalFilesystemPandasOptions
+from .test_local_pandas_batches import TestLocalFilesystemPandasBatches
+from .test_local_numpy import TestLocalFilesystemNumpy
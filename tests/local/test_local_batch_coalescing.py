@@ -0,0 +1,66 @@
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from cloud.core import PrefetchIterator, ScanOptions
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemBatchCoalescing(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 50000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows)),
+            "label": pa.array([f"label-{i % 100:03d}" for i in range(num_rows)]),
+            "part": pa.array([i // 12500 for i in range(num_rows)])
+        })
+
+        # small row groups of 100 rows
+        cls._parquet_path = f"{cls._base_path}/parquet/batch_coalescing"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["part"],
+                         partitioning_flavor="hive", min_rows_per_group=100, max_rows_per_group=100,
+                         existing_data_behavior="delete_matching")
+
+    def _read(self, scan_options, **kwargs):
+        storage = CountingLocalFileSystemStorage()
+
+        return list(storage.read_batches(file_format="parquet", path=self._parquet_path, batch_size=100000,
+                                         scan_options=scan_options, **kwargs))
+
+    def test_localfilesystem_coalesce_target_batch_bytes(self):
+        target = 128 * 2 ** 10
+        batches = self._read(ScanOptions(target_batch_bytes=target, use_threads=False))
+
+        self.assertGreater(len(self._read(ScanOptions(use_threads=False))), 400, "Should be greater")
+        self.assertLess(len(batches), 20, "Should be less")
+        self.assertTrue(all(target / 2 <= batch.nbytes <= target for batch in batches[:-1]), "Should be true")
+        self.assertEqual(pa.Table.from_batches(batches).column("id").to_pylist(), list(range(50000)), "Should match")
+
+    def test_localfilesystem_coalesce_slices_large_batches(self):
+        storage = CountingLocalFileSystemStorage()
+        batches = list(storage.read_batches(file_format="parquet", path=self._parquet_path,
+                                            batch_size=100, scan_options=ScanOptions(target_batch_bytes=2 ** 10)))
+
+        self.assertTrue(all(batch.nbytes <= 2 ** 10 for batch in batches), "Should be true")
+        self.assertEqual(sum(batch.num_rows for batch in batches), 50000, "Should match")
+
+    def test_localfilesystem_coalesce_min_batch_rows(self):
+        batches = self._read(ScanOptions(min_batch_rows=3000, prefetch_batches=2), filters=[("part", "=", 1)])
+
+        self.assertTrue(all(batch.num_rows >= 3000 for batch in batches[:-1]), "Should be true")
+        self.assertEqual(sorted(value for batch in batches for value in batch.column("id").to_pylist()),
+                         list(range(12500, 25000)), "Should match")
+
+    def test_localfilesystem_coalesce_with_limit_and_prefetch(self):
+        storage = CountingLocalFileSystemStorage()
+        batches = storage.read_batches(file_format="parquet", path=self._parquet_path, limit=1234,
+                                       scan_options=ScanOptions(min_batch_rows=500, prefetch_batches=2))
+
+        self.assertIsInstance(batches, PrefetchIterator, "Should be a PrefetchIterator")
+        self.assertEqual([batch.num_rows for batch in batches], [500, 500, 234], "Should match")
+
+        with self.assertRaises(ValueError):
+            ScanOptions(target_batch_bytes=0)
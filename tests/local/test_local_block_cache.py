@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+import deltalake as dlt
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from cloud.core import BlockCache
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemBlockCache(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/static/part", create_parents=True)
+        cls._filesystem.mkdir(f"{cls._base_path}/deltalake/static/part", create_parents=True)
+
+        pq.write_to_dataset(cls._fixed_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error', partition_cols=["Pregnancies"],
+                            root_path=f"{cls._base_path}/parquet/static/part")
+        dlt.write_deltalake(
+            table_or_uri=f"{cls._base_path}/deltalake/static/part",
+            data=cls._fixed_table, mode="error", partition_by=["Pregnancies"],
+            storage_options=cls._local_filesystem_storage._get_deltalake_storage_options(),
+            file_options=ds.ParquetFileFormat().make_write_options(compression='none'))
+
+    def setUp(self):
+        self._cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._cache_dir)
+
+    def make_storage(self, max_bytes=2 ** 30, block_size=2 ** 16):
+        storage = CountingLocalFileSystemStorage(block_cache=BlockCache(self._cache_dir, max_bytes=max_bytes,
+                                                                        block_size=block_size))
+        return storage, storage._get_filesystem().handler.fs
+
+    def test_localfilesystem_block_cache_second_scan_served_from_cache(self):
+        storage, filesystem = self.make_storage()
+
+        for file_format in ["parquet", "deltalake"]:
+            path = f"{self._base_path}/{file_format}/static/part"
+
+            filesystem.reset_counters()
+            first = storage.read_to_arrow_table(file_format=file_format, path=path)
+            self.assertGreater(filesystem.bytes_read, 0)
+
+            misses = storage.block_cache.misses
+            filesystem.reset_counters()
+            second = storage.read_to_arrow_table(file_format=file_format, path=path)
+
+            self.assertEqual(filesystem.bytes_read, 0, "Should match")
+            self.assertEqual(storage.block_cache.misses, misses, "Should match")
+            self.assertEqual(first.num_rows, second.num_rows, "Should match")
+            self.assertEqual(second.num_rows, self._fixed_table.num_rows, "Should match")
+
+        self.assertGreater(storage.block_cache.stats()["hits"], 0)
+
+    def test_localfilesystem_block_cache_warm_start(self):
+        storage, _ = self.make_storage()
+        storage.read_to_arrow_table(file_format="parquet", path=f"{self._base_path}/parquet/static/part")
+
+        storage, filesystem = self.make_storage()
+        storage.read_to_arrow_table(file_format="parquet", path=f"{self._base_path}/parquet/static/part")
+
+        self.assertEqual(filesystem.bytes_read, 0, "Should match")
+
+    def test_localfilesystem_block_cache_never_serves_stale_blocks(self):
+        path = f"{self._base_path}/parquet/block_cache_stale"
+        self._filesystem.mkdir(path, create_parents=True)
+        pq.write_table(self._fixed_table, f"{path}/data.parquet")
+
+        storage, filesystem = self.make_storage()
+        storage.read_to_arrow_table(file_format="parquet", path=path)
+
+        pq.write_table(self._fixed_table.slice(0, 100), f"{path}/data.parquet")
+        os.utime(f"{path}/data.parquet", ns=(0, 1))
+
+        filesystem.reset_counters()
+        table = storage.read_to_arrow_table(file_format="parquet", path=path)
+
+        self.assertEqual(table.num_rows, 100, "Should match")
+        self.assertGreater(filesystem.bytes_read, 0)
+
+    def test_localfilesystem_block_cache_lru_eviction(self):
+        storage, _ = self.make_storage(max_bytes=2 ** 17, block_size=2 ** 14)
+        storage.read_to_arrow_table(file_format="parquet", path=f"{self._base_path}/parquet/static/part")
+
+        self.assertLessEqual(storage.block_cache.size, 2 ** 17)
+        self.assertGreater(storage.block_cache.evictions, 0)
+
+    def test_localfilesystem_block_cache_shared_directory(self):
+        in_flight = os.path.join(self._cache_dir, "ab", "ab01.123.456.tmp")
+        stale = os.path.join(self._cache_dir, "cd", "cd01.123.456.tmp")
+
+        for path in [in_flight, stale]:
+            os.makedirs(os.path.dirname(path))
+            with open(path, "wb") as block:
+                block.write(b"block")
+        os.utime(stale, (0, 0))
+
+        # only the temporary files left by crashed processes are removed
+        cache = BlockCache(self._cache_dir, max_bytes=2 ** 20, block_size=2 ** 10)
+        self.assertTrue(os.path.exists(in_flight), "Should be true")
+        self.assertFalse(os.path.exists(stale), "Should be false")
+        self.assertEqual(cache.size, 0, "Should match")
+
+        # another process removed the temporary file of the block, it is not cached
+        with mock.patch("cloud.core.blockcache.os.replace", side_effect=FileNotFoundError):
+            cache.put("ef01", b"block")
+        self.assertIsNone(cache.get("ef01"))
@@ -0,0 +1,78 @@
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from cloud.core import And, Or, Not, ConditionFactory, MetadataCache
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+def condition(name, key, value_1, value_2=None):
+    return ConditionFactory.get_condition(name, key, value_1, value_2)
+
+
+class TestLocalFilesystemConditions(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/conditions", create_parents=True)
+        pq.write_to_dataset(cls._fixed_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error', partition_cols=["Pregnancies"],
+                            root_path=f"{cls._base_path}/parquet/conditions")
+
+    def test_conditions_to_dnf(self):
+        a, b, c = condition("eq", "a", 1), condition("gt", "b", 2), condition("lt", "c", 3)
+
+        self.assertEqual(And(b, Or(a, c)).gen_filters(),
+                         [[("b", ">", 2), ("a", "==", 1)], [("b", ">", 2), ("c", "<", 3)]], "Should match")
+        self.assertEqual((a | b) & (a | c), Or(a, b) & Or(a, c), "Should match")
+
+    def test_conditions_not_pushed_to_literals(self):
+        a, b = condition("eq", "a", 1), condition("btw", "b", 2, 5)
+
+        self.assertEqual(Not(And(a, b)).gen_filters(),
+                         [[("a", "!=", 1)], [("b", "<", 2)], [("b", ">", 5)]], "Should match")
+        self.assertEqual((~~a).gen_filters(), [[("a", "==", 1)]], "Should match")
+        self.assertEqual(Not(condition("lte", "a", 1)).gen_filters(), [[("a", ">", 1)]], "Should match")
+
+    def test_conditions_simplified(self):
+        a, b = condition("eq", "a", 1), condition("gt", "b", 2)
+
+        # duplicated literals and conjunctions, absorption
+        self.assertEqual(And(a, a, b).gen_filters(), [[("a", "==", 1), ("b", ">", 2)]], "Should match")
+        self.assertEqual(Or(a, And(a, b), a).gen_filters(), [[("a", "==", 1)]], "Should match")
+        # literals implied or contradicted by an equality on the same field
+        self.assertEqual(And(a, condition("lt", "a", 5)).gen_filters(), [[("a", "==", 1)]], "Should match")
+        self.assertEqual(Or(And(a, condition("eq", "a", 2)), b).gen_filters(), [[("b", ">", 2)]], "Should match")
+        self.assertEqual(And(a, Not(a)).gen_filters(), [], "Should match")
+
+    def test_conditions_expression_and_tuples_agree(self):
+        table = self._fixed_table
+        filters = Or(And(condition("btw", "Pregnancies", 2, 4), Not(condition("eq", "Outcome", 1))),
+                     condition("gte", "Age", 60))
+
+        by_expression = table.filter(filters.gen_expression())
+        by_tuples = table.filter(pq.filters_to_expression(filters.gen_filters()))
+        expected = table.filter(((pc.field("Pregnancies") >= 2) & (pc.field("Pregnancies") <= 4)
+                                 & (pc.field("Outcome") != 1)) | (pc.field("Age") >= 60))
+
+        self.assertEqual(by_expression.num_rows, expected.num_rows, "Should match")
+        self.assertEqual(by_tuples.num_rows, expected.num_rows, "Should match")
+
+    def test_localfilesystem_read_with_conditions_prunes_partitions(self):
+        path = f"{self._base_path}/parquet/conditions"
+        storage = CountingLocalFileSystemStorage(metadata_cache=MetadataCache())
+        filesystem = storage._get_filesystem().handler.fs
+        filters = Or(condition("eq", "Pregnancies", 1), condition("eq", "Pregnancies", 3)) & condition("gt", "Age", 30)
+
+        storage.dataset(file_format="parquet", path=path)
+        filesystem.reset_counters()
+        table = storage.read_to_arrow_table(file_format="parquet", path=path, filters=filters)
+
+        expected = self._fixed_table.filter(pc.field("Pregnancies").isin([1, 3]) & (pc.field("Age") > 30))
+        self.assertEqual(table.num_rows, expected.num_rows, "Should match")
+        # only the files of the two matching partitions are opened
+        self.assertLessEqual(filesystem.files_opened, 2)
+        self.assertEqual(storage.read_to_arrow_table(file_format="parquet", path=path,
+                                                     filters=filters.gen_filters()).num_rows,
+                         expected.num_rows, "Should match")
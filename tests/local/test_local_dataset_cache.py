@@ -0,0 +1,71 @@
+import time
+
+import pyarrow.parquet as pq
+
+from cloud.core import DatasetCache, ParquetWriteOptions
+from cloud.local import LocalFileSystemStorage
+from tests.core import LocalFilesystemTestBase
+
+
+class TestLocalFilesystemDatasetCache(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/part", create_parents=True)
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/nopart", create_parents=True)
+        pq.write_to_dataset(cls._test_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error', partition_cols=["Pregnancies"],
+                            root_path=f"{cls._base_path}/parquet/part")
+        pq.write_to_dataset(cls._test_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error',
+                            root_path=f"{cls._base_path}/parquet/nopart")
+
+    def test_localfilesystem_dataset_cache_hit(self):
+        storage = LocalFileSystemStorage(dataset_cache=DatasetCache())
+
+        first = storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part")
+        second = storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part/")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part",
+                                                partitioning=None))
+
+    def test_localfilesystem_dataset_cache_invalidate(self):
+        storage = LocalFileSystemStorage(dataset_cache=DatasetCache())
+
+        first = storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part")
+        storage.invalidate(f"{self._base_path}/parquet/part/Pregnancies=1")
+
+        self.assertIsNot(first, storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part"))
+
+    def test_localfilesystem_dataset_cache_ttl_and_lru(self):
+        storage = LocalFileSystemStorage(dataset_cache=DatasetCache(max_entries=1, ttl=0.2))
+
+        first = storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part")
+        storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/nopart")
+
+        self.assertEqual(len(storage.dataset_cache), 1, "Should match")
+        self.assertIsNot(first, storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part"))
+
+        cached = storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part")
+        time.sleep(0.3)
+
+        self.assertIsNot(cached, storage.dataset(file_format="parquet", path=f"{self._base_path}/parquet/part"))
+
+    def test_localfilesystem_dataset_cache_invalidated_by_write(self):
+        storage = LocalFileSystemStorage(dataset_cache=DatasetCache())
+        path = f"{self._base_path}/parquet/cache_write"
+
+        storage.write(data=self._test_table, file_format="parquet", path=path, basename_template="first-{i}.parquet",
+                      write_options=ParquetWriteOptions(partitions=[], compression_codec="None",
+                                                        existing_data_behavior="overwrite_or_ignore"))
+        self.assertEqual(storage.dataset(file_format="parquet", path=path).count_rows(),
+                         self._test_table.num_rows, "Should match")
+
+        storage.write(data=self._test_table, file_format="parquet", path=path, basename_template="second-{i}.parquet",
+                      write_options=ParquetWriteOptions(partitions=[], compression_codec="None",
+                                                        existing_data_behavior="overwrite_or_ignore"))
+        self.assertEqual(storage.dataset(file_format="parquet", path=path).count_rows(),
+                         2 * self._test_table.num_rows, "Should match")
@@ -0,0 +1,86 @@
+import deltalake as dlt
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from cloud.core import DatasetCache, ConditionFactory
+from cloud.local import LocalFileSystemStorage
+from tests.core import LocalFilesystemTestBase
+
+
+class TestLocalFilesystemDeltaFileSkipping(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        # four commits of rows sorted by age, each data file covers a narrow age range
+        cls._sorted_table = cls._fixed_table.sort_by("Age")
+        cls._delta_path = f"{cls._base_path}/deltalake/file_skipping"
+        rows = cls._sorted_table.num_rows // 4 + 1
+
+        for index in range(4):
+            dlt.write_deltalake(
+                table_or_uri=cls._delta_path,
+                data=cls._sorted_table.slice(index * rows, rows), mode="append", partition_by=["Outcome"],
+                storage_options=cls._local_filesystem_storage._get_deltalake_storage_options())
+
+    def files_skipped(self, storage, filters):
+        total = len(storage.dataset(file_format="deltalake", path=self._delta_path).files)
+        return total - len(storage.dataset(file_format="deltalake", path=self._delta_path, filters=filters).files)
+
+    def test_localfilesystem_delta_file_skipping_statistics(self):
+        storage = LocalFileSystemStorage()
+        filters = ds.field("Age") >= 60
+
+        skipped = self.files_skipped(storage, filters)
+        table = storage.read_to_arrow_table(file_format="deltalake", path=self._delta_path, filters=filters)
+
+        self.assertGreater(skipped, 0, f"Files skipped by the statistics: {skipped}")
+        self.assertEqual(table.num_rows, self._sorted_table.filter(pc.field("Age") >= 60).num_rows, "Should match")
+
+    def test_localfilesystem_delta_file_skipping_partition_filters(self):
+        storage = LocalFileSystemStorage()
+        filters = [("Outcome", "==", 1)]
+
+        skipped = self.files_skipped(storage, filters)
+        table = storage.read_to_arrow_table(file_format="deltalake", path=self._delta_path, filters=filters)
+
+        self.assertGreater(skipped, 0, f"Files skipped by the partition filters: {skipped}")
+        self.assertEqual(table.num_rows, self._sorted_table.filter(pc.field("Outcome") == 1).num_rows,
+                         "Should match")
+
+    def test_localfilesystem_delta_file_skipping_disjunction(self):
+        storage = LocalFileSystemStorage()
+        filters = [[("Age", "<", 25)], [("Age", ">", 70)]]
+        expected = self._sorted_table.filter((pc.field("Age") < 25) | (pc.field("Age") > 70)).num_rows
+
+        self.assertGreater(self.files_skipped(storage, filters), 0)
+        self.assertEqual(storage.read_to_arrow_table(file_format="deltalake", path=self._delta_path,
+                                                     filters=filters).num_rows, expected, "Should match")
+
+    def test_localfilesystem_delta_file_skipping_with_dataset_cache(self):
+        storage = LocalFileSystemStorage(dataset_cache=DatasetCache())
+        filters = [("Outcome", "==", 0), ("Age", ">=", 60)]
+        expected = self._sorted_table.filter((pc.field("Outcome") == 0) & (pc.field("Age") >= 60)).num_rows
+
+        self.assertGreater(self.files_skipped(storage, filters), 0)
+        self.assertEqual(storage.read_to_arrow_table(file_format="deltalake", path=self._delta_path,
+                                                     filters=filters).num_rows, expected, "Should match")
+        self.assertEqual(len(storage.dataset_cache), 1, "Should match")
+
+    def test_localfilesystem_delta_file_skipping_bool_partition(self):
+        # delta writes the boolean partition values as "true" and "false"
+        path = f"{self._base_path}/deltalake/file_skipping_bool"
+        dlt.write_deltalake(table_or_uri=path, data=pa.table({"id": [1, 2, 3], "flag": [True, False, True]}),
+                            mode="overwrite", partition_by=["flag"])
+
+        for storage in [LocalFileSystemStorage(), LocalFileSystemStorage(dataset_cache=DatasetCache())]:
+            for filters in [[("flag", "==", True)], [("flag", "in", [True])],
+                            ConditionFactory.get_condition("eq", "flag", True, None),
+                            ConditionFactory.get_condition("in", "flag", [True], None)]:
+                table = storage.read_to_arrow_table(file_format="deltalake", path=path, filters=filters)
+
+                self.assertEqual(sorted(table.column("id").to_pylist()), [1, 3], "Should match")
+                self.assertEqual(storage.count_rows(file_format="deltalake", path=path, filters=filters), 2,
+                                 "Should match")
@@ -0,0 +1,69 @@
+import threading
+
+import pyarrow.parquet as pq
+
+from cloud.local import LocalFileSystemStorage
+from tests.core import LocalFilesystemTestBase
+
+
+class CountingLocalFileSystemStorage(LocalFileSystemStorage):
+
+    def __init__(self):
+        super().__init__()
+        self.created = 0
+        self.closed = 0
+
+    def _create_filesystem(self):
+        self.created += 1
+        return super()._create_filesystem()
+
+    def _close_filesystem(self, filesystem):
+        self.closed += 1
+
+
+class TestLocalFilesystemClient(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/nopart", create_parents=True)
+        pq.write_to_dataset(cls._test_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error',
+                            root_path=f"{cls._base_path}/parquet/nopart")
+
+    def test_localfilesystem_client_reused_between_reads(self):
+        storage = CountingLocalFileSystemStorage()
+
+        for _ in range(10):
+            storage.read_to_arrow_table(file_format="parquet", path=f"{self._base_path}/parquet/nopart")
+
+        self.assertEqual(storage.created, 1, "Should match")
+
+    def test_localfilesystem_client_created_once_between_threads(self):
+        storage = CountingLocalFileSystemStorage()
+        threads = [threading.Thread(target=storage._get_filesystem) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(storage.created, 1, "Should match")
+
+    def test_localfilesystem_client_close_and_context_manager(self):
+        with CountingLocalFileSystemStorage() as storage:
+            table = storage.read_to_arrow_table(file_format="parquet", path=f"{self._base_path}/parquet/nopart")
+
+        self.assertEqual(table.num_rows, self._test_table.num_rows, "Should match")
+        self.assertEqual(storage.closed, 1, "Should match")
+        self.assertIsNone(storage._filesystem)
+
+    def test_localfilesystem_client_refresh_credentials(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+        storage.refresh_credentials()
+
+        self.assertIsNot(storage._get_filesystem(), filesystem)
+        self.assertEqual(storage.created, 2, "Should match")
+        self.assertEqual(storage.closed, 1, "Should match")
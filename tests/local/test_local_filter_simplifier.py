@@ -0,0 +1,100 @@
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from cloud.core import And, ConditionFactory, DatasetCache, In, Not, Or
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+def condition(name, key, value_1, value_2=None):
+    return ConditionFactory.get_condition(name, key, value_1, value_2)
+
+
+class TestLocalFilesystemFilterSimplifier(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/simplifier", create_parents=True)
+        pq.write_to_dataset(cls._fixed_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error', partition_cols=["Pregnancies"],
+                            root_path=f"{cls._base_path}/parquet/simplifier")
+
+    def test_filter_simplifier_folds_overlapping_ranges(self):
+        filters = And(condition("gte", "a", 5), condition("btw", "a", 3, 10), condition("lt", "a", 8))
+
+        self.assertEqual(filters.gen_filters(), [[("a", ">=", 5), ("a", "<", 8)]], "Should match")
+        self.assertEqual(And(condition("gte", "a", 5), condition("lte", "a", 8)).gen_filters(),
+                         [[("a", ">=", 5), ("a", "<=", 8)]], "Should match")
+        self.assertEqual(And(condition("gt", "a", 5), condition("gt", "a", 5), condition("gte", "a", 5)).gen_filters(),
+                         [[("a", ">", 5)]], "Should match")
+        self.assertEqual(And(condition("btw", "a", 1, 5), condition("btw", "a", 5, 9)).gen_filters(),
+                         [[("a", "==", 5)]], "Should match")
+
+    def test_filter_simplifier_restricts_values(self):
+        self.assertEqual(And(In("a", [1, 4, 7, 12]), condition("btw", "a", 3, 10)).gen_filters(),
+                         [[("a", "in", [4, 7])]], "Should match")
+        self.assertEqual(And(In("a", [1, 4]), In("a", [4, 7])).gen_filters(), [[("a", "==", 4)]], "Should match")
+        # exclusions out of the interval are implied by it
+        self.assertEqual(And(condition("gt", "a", 5), condition("neq", "a", 2)).gen_filters(),
+                         [[("a", ">", 5)]], "Should match")
+        self.assertEqual(And(condition("gt", "a", 5), condition("neq", "a", 7)).gen_filters(),
+                         [[("a", ">", 5), ("a", "!=", 7)]], "Should match")
+
+    def test_filter_simplifier_detects_contradictions(self):
+        self.assertTrue(And(condition("gt", "a", 5), condition("lt", "a", 3)).never_matches())
+        self.assertTrue(And(condition("gt", "a", 5), condition("lte", "a", 5)).never_matches())
+        self.assertTrue(And(condition("btw", "a", 1, 3), Not(condition("btw", "a", 0, 4))).never_matches())
+        self.assertFalse(Or(And(condition("gt", "a", 5), condition("lt", "a", 3)),
+                            condition("eq", "b", 1)).never_matches())
+
+    def test_filter_simplifier_keeps_incomparable_values(self):
+        filters = And(condition("gt", "a", 5), condition("lt", "a", "x"))
+
+        self.assertEqual(filters.gen_filters(), [[("a", ">", 5), ("a", "<", "x")]], "Should match")
+
+    def test_filter_simplifier_caches_compiled_expressions(self):
+        build = lambda: Or(And(condition("gte", "Age", 30), condition("lt", "Age", 50)), condition("eq", "Outcome", 1))
+
+        self.assertIs(build().gen_expression(), build().gen_expression())
+        self.assertIs(build().dnf(), build().dnf())
+        self.assertNotEqual(condition("eq", "a", 1), condition("eq", "a", 1.0))
+        # the elements of the values are told apart by their types too
+        self.assertNotEqual(In("a", [1]), In("a", [1.0]))
+        self.assertNotEqual(In("a", [1]), In("a", [True]))
+        self.assertIsNot(In("a", [1]).gen_expression(), In("a", [1.0]).gen_expression())
+
+    def test_filter_simplifier_unhashable_values(self):
+        unhashable = condition("eq", "a", [1, 2])
+
+        self.assertEqual(And(unhashable, unhashable, condition("gt", "b", 2)).gen_filters(),
+                         [[("a", "==", [1, 2]), ("b", ">", 2)]], "Should match")
+        self.assertEqual(Or(unhashable, unhashable).gen_filters(), [[("a", "==", [1, 2])]], "Should match")
+
+    def test_localfilesystem_filter_simplifier_contradiction_reads_no_file(self):
+        path = f"{self._base_path}/parquet/simplifier"
+        storage = CountingLocalFileSystemStorage(dataset_cache=DatasetCache())
+        filters = And(condition("gt", "Age", 50), condition("btw", "Age", 20, 40))
+
+        # the schema is discovered once, the contradictory scan itself does no I/O
+        storage.dataset(file_format="parquet", path=path)
+        filesystem = storage._get_filesystem()
+        filesystem.reset_counters()
+
+        self.assertEqual(len(storage.dataset(file_format="parquet", path=path, filters=filters).files), 0,
+                         "Should match")
+        self.assertEqual(storage.read_to_arrow_table(file_format="parquet", path=path, filters=filters).num_rows, 0,
+                         "Should match")
+        self.assertEqual(filesystem.files_opened, 0, "Should match")
+
+    def test_localfilesystem_filter_simplifier_same_rows(self):
+        path = f"{self._base_path}/parquet/simplifier"
+        storage = CountingLocalFileSystemStorage()
+        filters = And(condition("gte", "Age", 25), condition("btw", "Age", 20, 60), condition("lt", "Age", 40),
+                      Or(condition("eq", "Pregnancies", 1), condition("gt", "Pregnancies", 5)))
+
+        table = storage.read_to_arrow_table(file_format="parquet", path=path, filters=filters)
+        expected = self._fixed_table.filter((pc.field("Age") >= 25) & (pc.field("Age") < 40)
+                                            & ((pc.field("Pregnancies") == 1) | (pc.field("Pregnancies") > 5)))
+
+        self.assertEqual(table.num_rows, expected.num_rows, "Should match")
@@ -0,0 +1,89 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from cloud.core import ConditionFactory, In, NotIn, Or
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemInCondition(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        # ids sorted within each partition, 10 row groups of 1000 ids per file
+        cls._ids_table = pa.table({"id": pa.array(range(40000)), "part": pa.array([i // 10000 for i in range(40000)])})
+        cls._ids_path = f"{cls._base_path}/parquet/in_condition"
+        ds.write_dataset(cls._ids_table, cls._ids_path, format="parquet", partitioning=["part"],
+                         partitioning_flavor="hive", min_rows_per_group=1000, max_rows_per_group=1000)
+
+    def test_in_condition_sorted_and_deduplicated(self):
+        condition = ConditionFactory.get_condition("in", "id", [5, 3, 5, 1], None)
+
+        self.assertEqual(condition.values, (1, 3, 5), "Should match")
+        self.assertEqual(condition.gen_filters(), [[("id", "in", [1, 3, 5])]], "Should match")
+        self.assertEqual((~condition).gen_filters(), [[("id", "not in", [1, 3, 5])]], "Should match")
+        self.assertTrue(condition.may_match(2, 4))
+        self.assertFalse(condition.may_match(6, 10))
+
+    def test_in_condition_simplified_with_equality(self):
+        eq = ConditionFactory.get_condition("eq", "id", 3, None)
+
+        self.assertEqual((eq & In("id", [1, 3])).gen_filters(), [[("id", "==", 3)]], "Should match")
+        self.assertEqual((eq & In("id", [1, 2])).gen_filters(), [], "Should match")
+        self.assertEqual((eq & NotIn("id", [3])).gen_filters(), [], "Should match")
+
+    def test_in_condition_not_in_skips_nulls(self):
+        table = pa.table({"id": pa.array([1, 2, None])})
+
+        self.assertEqual(table.filter(NotIn("id", [1]).gen_expression()).num_rows, 1, "Should match")
+
+    def test_localfilesystem_in_condition_prunes_partitions_and_row_groups(self):
+        storage = CountingLocalFileSystemStorage()
+        ids = [15, 999, 1003, 20500, 20501, 39999, 50000]
+        condition = In("id", ids)
+
+        dataset = storage.dataset(file_format="parquet", path=self._ids_path, filters=condition)
+        table = storage.read_to_arrow_table(file_format="parquet", path=self._ids_path, filters=condition)
+
+        # 4 of the 40 row groups hold the values, the ones in between are skipped by the sorted values
+        self.assertEqual(sum(fragment.num_row_groups for fragment in dataset.get_fragments()), 4, "Should match")
+        self.assertEqual(sorted(table.column("id").to_pylist()), ids[:-1], "Should match")
+
+    def test_localfilesystem_in_condition_reads_footers_concurrently(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+
+        dataset = storage.dataset(file_format="parquet", path=self._ids_path, filters=In("id", [15, 20500, 39999]))
+
+        files_opened = filesystem.files_opened
+        footer_threads = [name for name in filesystem.files_opened_by_thread if name.startswith("cloud_arrow-footers")]
+
+        # one footer read of each of the 4 files on the footer threads, kept by the fragments
+        self.assertEqual(sum(filesystem.files_opened_by_thread[name] for name in footer_threads), 4, "Should match")
+        self.assertEqual(sum(fragment.num_row_groups for fragment in dataset.get_fragments()), 3, "Should match")
+        self.assertEqual(filesystem.files_opened, files_opened, "Should match")
+
+    def test_localfilesystem_in_condition_matches_chained_eq(self):
+        storage = CountingLocalFileSystemStorage()
+        ids = list(range(100, 30000, 997))
+        chained = Or(*[ConditionFactory.get_condition("eq", "id", value, None) for value in ids])
+
+        by_in = storage.read_to_arrow_table(file_format="parquet", path=self._ids_path, filters=In("id", ids))
+        by_eq = storage.read_to_arrow_table(file_format="parquet", path=self._ids_path, filters=chained)
+        by_tuples = storage.read_to_arrow_table(file_format="parquet", path=self._ids_path,
+                                                filters=[[("id", "in", ids)]])
+
+        self.assertEqual(by_in.num_rows, len(ids), "Should match")
+        self.assertEqual(by_eq.num_rows, len(ids), "Should match")
+        self.assertEqual(by_tuples.num_rows, len(ids), "Should match")
+
+    def test_localfilesystem_in_condition_on_partition_column(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.read_to_arrow_table(file_format="parquet", path=self._ids_path,
+                                            filters=In("part", [1, 3]) & In("id", [10, 10001, 30002]))
+
+        self.assertEqual(sorted(table.column("id").to_pylist()), [10001, 30002], "Should match")
+        self.assertEqual(self._ids_table.filter(pc.field("part").isin([1, 3])).num_rows, 20000, "Should match")
@@ -0,0 +1,96 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from deltalake import write_deltalake
+
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemLimit(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 200000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows)),
+            "value": pa.array([float(i % 1000) for i in range(num_rows)]),
+            "part": pa.array([i // 50000 for i in range(num_rows)])
+        })
+
+        # 4 files of 5 row groups of 10000 rows
+        cls._parquet_path = f"{cls._base_path}/parquet/limit"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["part"],
+                         partitioning_flavor="hive", min_rows_per_group=10000, max_rows_per_group=10000,
+                         existing_data_behavior="delete_matching")
+
+        cls._delta_path = f"{cls._base_path}/deltalake/limit"
+        write_deltalake(cls._delta_path, cls._table, partition_by=["part"], min_rows_per_group=10000,
+                        max_rows_per_group=10000, mode="overwrite")
+
+    def test_localfilesystem_limit_reads_first_row_groups(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+
+        storage.read_to_arrow_table(file_format="parquet", path=self._parquet_path)
+        full_bytes = filesystem.bytes_read
+        filesystem.reset_counters()
+
+        dataframe = storage.read_to_pandas(file_format="parquet", path=self._parquet_path, limit=10)
+
+        self.assertEqual(dataframe["id"].tolist(), list(range(10)), "Should match")
+        self.assertEqual(dataframe["part"].tolist(), [0] * 10, "Should match")
+        self.assertLess(filesystem.bytes_read, full_bytes / 2, "Should be less")
+
+    def test_localfilesystem_limit_after_filters(self):
+        storage = CountingLocalFileSystemStorage()
+        expression = (pc.field("id") > 120005) & (pc.field("value") < 20)
+
+        table = storage.read_to_arrow_table(file_format="parquet", path=self._parquet_path, filters=expression,
+                                            columns=["id", "part"], limit=30)
+        expected = self._table.filter(expression).select(["id", "part"]).slice(0, 30)
+
+        self.assertEqual(table.to_pydict(), expected.to_pydict(), "Should match")
+
+    def test_localfilesystem_limit_deltalake(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.read_to_arrow_table(file_format="deltalake", path=self._delta_path,
+                                            filters=[("part", "=", 2)], limit=25000)
+
+        self.assertEqual(table.num_rows, 25000, "Should match")
+        self.assertEqual(pc.unique(table.column("part")).to_pylist(), [2], "Should match")
+
+    def test_localfilesystem_limit_spanning_files(self):
+        storage = CountingLocalFileSystemStorage()
+
+        # the first row group is scanned alone, the rest of the files with readahead and in the same order
+        table = storage.read_to_arrow_table(file_format="parquet", path=self._parquet_path, columns=["id"],
+                                            filters=[("value", "<", 500)], limit=60000)
+        expected = self._table.filter(pc.field("value") < 500).select(["id"]).slice(0, 60000)
+
+        self.assertEqual(table.to_pydict(), expected.to_pydict(), "Should match")
+
+    def test_localfilesystem_limit_read_batches(self):
+        storage = CountingLocalFileSystemStorage()
+
+        batches = list(storage.read_batches(file_format="parquet", path=self._parquet_path, batch_size=1000,
+                                            limit=12345))
+
+        self.assertEqual(sum(batch.num_rows for batch in batches), 12345, "Should match")
+        self.assertTrue(all(batch.num_rows <= 1000 for batch in batches), "Should be true")
+
+    def test_localfilesystem_limit_larger_than_dataset(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.read_to_arrow_table(file_format="parquet", path=self._parquet_path,
+                                            filters=[("id", ">=", 199990)], limit=100)
+        empty = storage.read_to_arrow_table(file_format="parquet", path=self._parquet_path, columns=["id"], limit=0)
+
+        self.assertEqual(table.column("id").to_pylist(), list(range(199990, 200000)), "Should match")
+        self.assertEqual(empty.num_rows, 0, "Should match")
+        self.assertEqual(empty.schema.names, ["id"], "Should match")
+
+        with self.assertRaises(ValueError):
+            storage.read_batches(file_format="parquet", path=self._parquet_path, limit=-1)
@@ -0,0 +1,90 @@
+import pyarrow as pa
+import pyarrow.dataset as ds
+from deltalake import write_deltalake
+
+from cloud.core import DatasetCache
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemLookup(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        # ids sorted within each partition, 10 row groups of 1000 ids per file
+        cls._ids_table = pa.table({"id": pa.array(range(40000)), "part": pa.array([i // 10000 for i in range(40000)]),
+                                   "value": pa.array([f"value-{i}" for i in range(40000)])})
+        cls._ids_path = f"{cls._base_path}/parquet/lookup"
+        ds.write_dataset(cls._ids_table, cls._ids_path, format="parquet", partitioning=["part"],
+                         partitioning_flavor="hive", min_rows_per_group=1000, max_rows_per_group=1000)
+
+        cls._delta_ids_path = f"{cls._base_path}/deltalake/lookup"
+        write_deltalake(cls._delta_ids_path, cls._ids_table, partition_by=["part"], max_rows_per_group=1000,
+                        min_rows_per_group=1000)
+
+    def test_localfilesystem_lookup_returns_matching_rows(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.lookup(file_format="parquet", path=self._ids_path, key_column="id",
+                               keys=[20500, 15, 39999, 15, 50000])
+
+        self.assertEqual(sorted(table.column("id").to_pylist()), [15, 20500, 39999], "Should match")
+        self.assertEqual(set(table.column_names), {"id", "part", "value"}, "Should match")
+
+    def test_localfilesystem_lookup_reads_candidate_row_groups(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+
+        storage.read_to_arrow_table(file_format="parquet", path=self._ids_path,
+                                    filters=ds.field("id").isin([1500, 27000]))
+        scan_bytes = filesystem.bytes_read
+        filesystem.reset_counters()
+
+        table = storage.lookup(file_format="parquet", path=self._ids_path, key_column="id", keys=[1500, 27000],
+                               columns=["value"])
+
+        self.assertEqual(sorted(table.column("value").to_pylist()), ["value-1500", "value-27000"], "Should match")
+        # the footers are read, then 2 of the 40 row groups instead of every row group of the 4 files
+        self.assertLess(filesystem.bytes_read, scan_bytes / 2, "Should be less")
+
+    def test_localfilesystem_lookup_missing_keys(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.lookup(file_format="parquet", path=self._ids_path, key_column="id", keys=[-1, 40000],
+                               columns=["id"])
+        empty = storage.lookup(file_format="parquet", path=self._ids_path, key_column="id", keys=[])
+
+        self.assertEqual(table.num_rows, 0, "Should match")
+        self.assertEqual(table.column_names, ["id"], "Should match")
+        self.assertEqual(empty.num_rows, 0, "Should match")
+
+    def test_localfilesystem_lookup_reuses_row_group_statistics(self):
+        storage = CountingLocalFileSystemStorage(dataset_cache=DatasetCache())
+        filesystem = storage._get_filesystem()
+
+        storage.lookup(file_format="parquet", path=self._ids_path, key_column="id", keys=[5])
+        filesystem.reset_counters()
+        table = storage.lookup(file_format="parquet", path=self._ids_path, key_column="id", keys=[5, 25005])
+
+        self.assertEqual(sorted(table.column("id").to_pylist()), [5, 25005], "Should match")
+        # the footers are not read again, only the two candidate row groups
+        self.assertEqual(filesystem.files_opened, 2, "Should match")
+
+    def test_localfilesystem_lookup_on_partition_column(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.lookup(file_format="parquet", path=self._ids_path, key_column="part", keys=[2],
+                               columns=["id"])
+
+        self.assertEqual(table.num_rows, 10000, "Should match")
+
+    def test_localfilesystem_lookup_deltalake(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.lookup(file_format="deltalake", path=self._delta_ids_path, key_column="id",
+                               keys=[7, 12345, 31000], columns=["id", "value"])
+
+        self.assertEqual(sorted(table.column("id").to_pylist()), [7, 12345, 31000], "Should match")
+        self.assertEqual(sorted(table.column("value").to_pylist()), ["value-12345", "value-31000", "value-7"],
+                         "Should match")
@@ -0,0 +1,155 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from deltalake import write_deltalake
+
+from cloud.core import ConditionFactory, MetadataCache
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemMetadataAggregates(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 200000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows)),
+            "value": pa.array([float(i % 1000) + 1 if i % 9 else None for i in range(num_rows)]),
+            "label": pa.array([f"label-{i % 50:03d}" for i in range(num_rows)]),
+            "part": pa.array([i // 50000 for i in range(num_rows)])
+        })
+
+        # 4 files of 5 row groups of 10000 rows
+        cls._parquet_path = f"{cls._base_path}/parquet/metadata_aggregates"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["part"],
+                         partitioning_flavor="hive", min_rows_per_group=10000, max_rows_per_group=10000,
+                         existing_data_behavior="delete_matching")
+
+        cls._delta_path = f"{cls._base_path}/deltalake/metadata_aggregates"
+        write_deltalake(cls._delta_path, cls._table, partition_by=["part"], min_rows_per_group=10000,
+                        max_rows_per_group=10000, mode="overwrite")
+
+    def _expected_stats(self, columns, expression=None):
+        table = self._table if expression is None else self._table.filter(expression)
+        stats = {}
+
+        for column in columns:
+            min_max = pc.min_max(table.column(column))
+            stats[column] = {"min": min_max["min"].as_py(), "max": min_max["max"].as_py(),
+                             "null_count": table.column(column).null_count}
+
+        return stats
+
+    def test_localfilesystem_count_rows_from_footers(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+
+        self.assertEqual(storage.count_rows(file_format="parquet", path=self._parquet_path), 200000, "Should match")
+        # only the footers are read, a single request per file
+        self.assertEqual(filesystem.read_requests, filesystem.files_opened, "Should match")
+
+        filesystem.reset_counters()
+        count = storage.count_rows(file_format="parquet", path=self._parquet_path,
+                                   filters=[("part", "in", [1, 2]), ("id", ">=", 60000)])
+        self.assertEqual(count, 90000, "Should match")
+        self.assertEqual(filesystem.read_requests, filesystem.files_opened, "Should match")
+
+    def test_localfilesystem_count_rows_reads_footers_concurrently(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+
+        count = storage.count_rows(file_format="parquet", path=self._parquet_path,
+                                   filters=[("part", "!=", 0), ("id", ">=", 60000)])
+        footer_threads = [name for name in filesystem.files_opened_by_thread if name.startswith("cloud_arrow-footers")]
+
+        # the footers of the 3 files left by the partitions are read on the footer threads
+        self.assertEqual(count, 140000, "Should match")
+        self.assertEqual(sum(filesystem.files_opened_by_thread[name] for name in footer_threads), 3, "Should match")
+        self.assertEqual(filesystem.read_requests, filesystem.files_opened, "Should match")
+
+    def test_localfilesystem_count_rows_scans_partial_row_groups(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+        expression = (pc.field("id") >= 25000) & (pc.field("id") < 26000)
+
+        count = storage.count_rows(file_format="parquet", path=self._parquet_path,
+                                   filters=[("id", ">=", 25000), ("id", "<", 26000)])
+        metadata_bytes = filesystem.bytes_read
+        filesystem.reset_counters()
+        by_expression = storage.count_rows(file_format="parquet", path=self._parquet_path, filters=expression)
+
+        self.assertEqual(count, 1000, "Should match")
+        self.assertEqual(by_expression, 1000, "Should match")
+        self.assertLessEqual(metadata_bytes, filesystem.bytes_read, "Should be less or equal")
+
+    def test_localfilesystem_count_rows_null_and_not_in_filters(self):
+        storage = CountingLocalFileSystemStorage()
+
+        by_condition = storage.count_rows(file_format="parquet", path=self._parquet_path,
+                                          filters=ConditionFactory.get_condition("gte", "value", 1, None))
+        by_not_in = storage.count_rows(file_format="parquet", path=self._parquet_path,
+                                       filters=[("label", "not in", ["label-001"])])
+
+        self.assertEqual(by_condition, self._table.filter(pc.field("value") >= 1).num_rows, "Should match")
+        self.assertEqual(by_not_in, self._table.filter(~pc.field("label").isin(["label-001"])).num_rows,
+                         "Should match")
+
+    def test_localfilesystem_count_rows_null_partition(self):
+        storage = CountingLocalFileSystemStorage()
+        table = pa.table({"id": pa.array(range(9)), "p": pa.array(["a", "a", "a", None, None, None, "b", "b", "b"])})
+        path = f"{self._base_path}/parquet/metadata_aggregates_null_partition"
+        # the null partition is written as __HIVE_DEFAULT_PARTITION__
+        ds.write_dataset(table, path, format="parquet", partitioning=["p"], partitioning_flavor="hive",
+                         existing_data_behavior="delete_matching")
+
+        # comparisons never hold for null values, the "not in" tuples keep them like pyarrow does
+        for filters, expected in [([("p", "!=", "a")], 3), ([("p", "not in", ["a"])], 6),
+                                  (ConditionFactory.get_condition("neq", "p", "a", None), 3),
+                                  (ConditionFactory.get_condition("not_in", "p", ["a"], None), 3)]:
+            count = storage.count_rows(file_format="parquet", path=path, filters=filters)
+            table = storage.read_to_arrow_table(file_format="parquet", path=path, filters=filters)
+
+            self.assertEqual(count, expected, "Should match")
+            self.assertEqual(count, table.num_rows, "Should match")
+
+    def test_localfilesystem_column_stats_from_footers(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+        columns = ["id", "value", "label", "part"]
+
+        stats = storage.column_stats(file_format="parquet", path=self._parquet_path, columns=columns)
+
+        self.assertEqual(stats, self._expected_stats(columns), "Should match")
+        self.assertEqual(filesystem.read_requests, filesystem.files_opened, "Should match")
+
+    def test_localfilesystem_column_stats_filtered(self):
+        storage = CountingLocalFileSystemStorage()
+        filters = [("id", ">=", 25000), ("id", "<", 25100)]
+
+        stats = storage.column_stats(file_format="parquet", path=self._parquet_path, columns=["id", "value"],
+                                     filters=filters)
+
+        self.assertEqual(stats, self._expected_stats(["id", "value"], (pc.field("id") >= 25000)
+                                                     & (pc.field("id") < 25100)), "Should match")
+
+        with self.assertRaises(ValueError):
+            storage.column_stats(file_format="parquet", path=self._parquet_path, columns=["missing"])
+
+    def test_localfilesystem_aggregates_deltalake_log(self):
+        # the metadata cache wraps the counting filesystem, showing the files read
+        storage = CountingLocalFileSystemStorage(metadata_cache=MetadataCache())
+        filesystem = storage._get_filesystem().handler.fs
+
+        count = storage.count_rows(file_format="deltalake", path=self._delta_path, filters=[("id", "<", 100000)])
+        stats = storage.column_stats(file_format="deltalake", path=self._delta_path, columns=["id", "value", "part"])
+
+        self.assertEqual(count, 100000, "Should match")
+        self.assertEqual(stats, self._expected_stats(["id", "value", "part"]), "Should match")
+        # answered from the delta log, no data file is opened
+        self.assertEqual(filesystem.files_opened, 0, "Should match")
+
+        # the string statistics of the log may be truncated, the footers are read instead
+        stats = storage.column_stats(file_format="deltalake", path=self._delta_path, columns=["label"])
+        self.assertEqual(stats, self._expected_stats(["label"]), "Should match")
@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+
+import pyarrow.parquet as pq
+
+from cloud.core import MetadataCache
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemMetadataCache(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/static/part", create_parents=True)
+        pq.write_to_dataset(cls._fixed_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error', partition_cols=["Pregnancies"],
+                            root_path=f"{cls._base_path}/parquet/static/part")
+
+    def setUp(self):
+        self._cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._cache_dir)
+
+    @staticmethod
+    def make_storage(metadata_cache):
+        storage = CountingLocalFileSystemStorage(metadata_cache=metadata_cache)
+        return storage, storage._get_filesystem().handler.fs
+
+    def test_localfilesystem_metadata_cache_shared_between_storages(self):
+        path = f"{self._base_path}/parquet/static/part"
+        metadata_cache = MetadataCache()
+
+        storage, filesystem = self.make_storage(metadata_cache)
+        first = storage.read_to_arrow_table(file_format="parquet", path=path)
+        cold_requests = filesystem.read_requests
+
+        storage, filesystem = self.make_storage(metadata_cache)
+        second = storage.read_to_arrow_table(file_format="parquet", path=path)
+
+        self.assertLess(filesystem.read_requests, cold_requests)
+        self.assertGreater(metadata_cache.hits, 0)
+        self.assertEqual(first.num_rows, second.num_rows, "Should match")
+        self.assertEqual(second.num_rows, self._fixed_table.num_rows, "Should match")
+
+    def test_localfilesystem_metadata_cache_warm_start(self):
+        path = f"{self._base_path}/parquet/static/part"
+
+        storage, _ = self.make_storage(MetadataCache(directory=self._cache_dir))
+        storage.read_to_arrow_table(file_format="parquet", path=path)
+
+        metadata_cache = MetadataCache(directory=self._cache_dir)
+        storage, _ = self.make_storage(metadata_cache)
+        storage.read_to_arrow_table(file_format="parquet", path=path)
+
+        self.assertEqual(metadata_cache.misses, 0, "Should match")
+        self.assertGreater(metadata_cache.hits, 0)
+
+    def test_localfilesystem_metadata_cache_read_metadata(self):
+        path = f"{self._base_path}/parquet/read_metadata"
+        self._filesystem.mkdir(path, create_parents=True)
+        pq.write_table(self._fixed_table, f"{path}/data.parquet")
+
+        storage, filesystem = self.make_storage(MetadataCache())
+        metadata = storage.read_metadata(f"{path}/data.parquet")
+
+        filesystem.reset_counters()
+        cached = storage.read_metadata(f"{path}/data.parquet")
+
+        self.assertEqual(metadata.num_rows, self._fixed_table.num_rows, "Should match")
+        self.assertEqual(cached.num_rows, self._fixed_table.num_rows, "Should match")
+        self.assertEqual(filesystem.bytes_read, 0, "Should match")
+
+    def test_localfilesystem_metadata_cache_never_serves_stale_footers(self):
+        path = f"{self._base_path}/parquet/metadata_cache_stale"
+        self._filesystem.mkdir(path, create_parents=True)
+        pq.write_table(self._fixed_table, f"{path}/data.parquet")
+
+        storage, _ = self.make_storage(MetadataCache())
+        storage.read_metadata(f"{path}/data.parquet")
+
+        pq.write_table(self._fixed_table.slice(0, 100), f"{path}/data.parquet")
+        os.utime(f"{path}/data.parquet", ns=(0, 1))
+
+        self.assertEqual(storage.read_metadata(f"{path}/data.parquet").num_rows, 100, "Should match")
+        self.assertEqual(storage.read_to_arrow_table(file_format="parquet", path=path).num_rows, 100, "Should match")
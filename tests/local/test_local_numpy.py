@@ -0,0 +1,131 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
+from deltalake import write_deltalake
+
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemNumpy(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 20000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows), type=pa.int64()),
+            "x": pa.array([i / 4 for i in range(num_rows)], type=pa.float32()),
+            "y": pa.array([float(i % 7) for i in range(num_rows)], type=pa.float64()),
+            "z": pa.array([i % 3 if i % 1000 else None for i in range(num_rows)], type=pa.int32()),
+            "flag": pa.array([i % 2 == 0 for i in range(num_rows)]),
+            "label": pa.array([f"label-{i % 100:03d}" for i in range(num_rows)]),
+            "country": pa.array([["ES", "UY", "US", "DE"][i // 5000] for i in range(num_rows)])
+        })
+
+        cls._parquet_path = f"{cls._base_path}/parquet/numpy"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["country"],
+                         partitioning_flavor="hive", max_rows_per_group=1000, existing_data_behavior="delete_matching")
+
+        cls._delta_path = f"{cls._base_path}/deltalake/numpy"
+        write_deltalake(cls._delta_path, cls._table, partition_by=["country"], min_rows_per_group=1000,
+                        max_rows_per_group=1000, mode="overwrite")
+
+    def _expected(self, columns, mask=None):
+        table = self._table if mask is None else self._table.filter(pa.array(mask))
+        return np.column_stack([table.column(column).to_numpy(zero_copy_only=False) for column in columns])
+
+    @staticmethod
+    def _sorted(matrix):
+        return matrix[np.argsort(matrix[:, 0], kind="stable")]
+
+    def test_localfilesystem_numpy_matrix(self):
+        storage = CountingLocalFileSystemStorage()
+
+        for order, flag in [("C", "C_CONTIGUOUS"), ("F", "F_CONTIGUOUS")]:
+            matrix = storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=["id", "x", "y"],
+                                           order=order)
+
+            self.assertEqual(matrix.shape, (20000, 3), "Should match")
+            self.assertEqual(matrix.dtype, np.float64, "Should match")
+            self.assertTrue(matrix.flags[flag], "Should be true")
+            np.testing.assert_array_equal(self._sorted(matrix), self._expected(["id", "x", "y"]))
+
+    def test_localfilesystem_numpy_dtype(self):
+        storage = CountingLocalFileSystemStorage()
+
+        matrix = storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=["x"])
+        self.assertEqual(matrix.dtype, np.float32, "Should match")
+
+        matrix = storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=["id", "flag"],
+                                       dtype=np.int32)
+        self.assertEqual(matrix.dtype, np.int32, "Should match")
+        np.testing.assert_array_equal(self._sorted(matrix), self._expected(["id", "flag"]).astype(np.int32))
+
+    def test_localfilesystem_numpy_filters_limit(self):
+        storage = CountingLocalFileSystemStorage()
+
+        matrix = storage.read_to_numpy(file_format="deltalake", path=self._delta_path, columns=["id", "y"],
+                                       filters=[("country", "=", "US"), ("y", ">", 3)])
+        mask = [country == "US" and y > 3 for country, y in zip(self._table.column("country").to_pylist(),
+                                                                 self._table.column("y").to_pylist())]
+        np.testing.assert_array_equal(self._sorted(matrix), self._expected(["id", "y"], mask))
+
+        matrix = storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=["id", "x"],
+                                       limit=2500)
+        self.assertEqual(matrix.shape, (2500, 2), "Should match")
+        self.assertTrue(matrix.flags["C_CONTIGUOUS"], "Should be true")
+
+    def test_localfilesystem_numpy_scans_once(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+        # the statistics of every row group hold values on both sides of the filter
+        filters = [("y", ">", 3)]
+
+        matrix = storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=["id", "y"],
+                                       filters=filters, order="F")
+        read_requests = filesystem.read_requests
+        filesystem.reset_counters()
+        storage.read_to_arrow_table(file_format="parquet", path=self._parquet_path, columns=["id", "y"],
+                                    filters=filters)
+
+        self.assertEqual(read_requests, filesystem.read_requests, "Should match")
+        self.assertTrue(matrix.flags["F_CONTIGUOUS"], "Should be true")
+        np.testing.assert_array_equal(self._sorted(matrix),
+                                      self._expected(["id", "y"], [y > 3 for y in self._table.column("y").to_pylist()]))
+
+    def test_localfilesystem_numpy_nulls(self):
+        storage = CountingLocalFileSystemStorage()
+
+        matrix = storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=["id", "z"],
+                                       dtype=np.float64)
+        self.assertEqual(int(np.isnan(matrix[:, 1]).sum()), 20, "Should match")
+
+        # the common type of integer columns is an integer type
+        with self.assertRaises(ValueError):
+            storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=["id", "z"])
+
+    def test_localfilesystem_numpy_invalid_columns(self):
+        storage = CountingLocalFileSystemStorage()
+
+        for columns in [[], ["label"], ["missing"]]:
+            with self.assertRaises(ValueError):
+                storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=columns)
+
+        with self.assertRaises(ValueError):
+            storage.read_to_numpy(file_format="parquet", path=self._parquet_path, columns=["id"], order="K")
+
+    def test_localfilesystem_numpy_batches(self):
+        storage = CountingLocalFileSystemStorage()
+
+        for order, flag in [("C", "C_CONTIGUOUS"), ("F", "F_CONTIGUOUS")]:
+            matrices = list(storage.read_to_numpy_batches(file_format="deltalake", path=self._delta_path,
+                                                          columns=["id", "x", "y"], batch_rows=3000, order=order))
+
+            self.assertEqual([len(matrix) for matrix in matrices], [3000] * 6 + [2000], "Should match")
+            self.assertTrue(all(matrix.flags[flag] for matrix in matrices), "Should be true")
+            np.testing.assert_array_equal(self._sorted(np.concatenate(matrices)), self._expected(["id", "x", "y"]))
+
+        with self.assertRaises(ValueError):
+            storage.read_to_numpy_batches(file_format="parquet", path=self._parquet_path, columns=["id"],
+                                          batch_rows=0)
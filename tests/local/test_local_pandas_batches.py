@@ -0,0 +1,76 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from deltalake import write_deltalake
+
+from cloud.core import PandasOptions, PrefetchIterator
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemPandasBatches(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 20000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows)),
+            # nulls only in the last rows, the first chunks hold none
+            "score": pa.array([i % 50 if i < 18000 else None for i in range(num_rows)]),
+            "label": pa.array([f"label-{i % 100:03d}" for i in range(num_rows)]),
+            "country": pa.array([["ES", "UY", "US", "DE"][i // 5000] for i in range(num_rows)])
+        })
+
+        cls._parquet_path = f"{cls._base_path}/parquet/pandas_batches"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["country"],
+                         partitioning_flavor="hive", max_rows_per_group=1000, existing_data_behavior="delete_matching")
+
+        cls._delta_path = f"{cls._base_path}/deltalake/pandas_batches"
+        write_deltalake(cls._delta_path, cls._table, partition_by=["country"], min_rows_per_group=1000,
+                        max_rows_per_group=1000, mode="overwrite")
+
+    def test_localfilesystem_pandas_batches_chunk_rows(self):
+        storage = CountingLocalFileSystemStorage()
+
+        dataframes = list(storage.read_to_pandas_batches(file_format="parquet", path=self._parquet_path,
+                                                         chunk_rows=3000, pandas_options=PandasOptions.lean()))
+
+        self.assertEqual([len(dataframe) for dataframe in dataframes], [3000] * 6 + [2000], "Should match")
+        self.assertEqual(len({str(dataframe.dtypes.to_dict()) for dataframe in dataframes}), 1, "Should match")
+        self.assertEqual(dataframes[0]["score"].dtype, pd.Int64Dtype(), "Should match")
+        self.assertEqual(list(dataframes[0]["country"].cat.categories), ["DE", "ES", "US", "UY"], "Should match")
+
+        dataframe = pd.concat(dataframes).sort_values("id")
+        self.assertEqual(dataframe["id"].tolist(), list(range(20000)), "Should match")
+        self.assertEqual(int(dataframe["score"].isna().sum()), 2000, "Should match")
+
+    def test_localfilesystem_pandas_batches_chunk_bytes(self):
+        storage = CountingLocalFileSystemStorage()
+
+        dataframes = list(storage.read_to_pandas_batches(file_format="deltalake", path=self._delta_path,
+                                                         chunk_bytes=64 * 2 ** 10, columns=["id", "score"],
+                                                         filters=[("country", "in", ["ES", "DE"])]))
+
+        self.assertGreater(len(dataframes), 2, "Should be greater")
+        self.assertTrue(all(abs(len(dataframe) - len(dataframes[0])) < len(dataframes[0]) / 10
+                            for dataframe in dataframes[:-1]), "Should be true")
+        self.assertEqual(sorted(id_ for dataframe in dataframes for id_ in dataframe["id"]),
+                         list(range(0, 5000)) + list(range(15000, 20000)), "Should match")
+
+    def test_localfilesystem_pandas_batches_close(self):
+        storage = CountingLocalFileSystemStorage()
+
+        dataframes = storage.read_to_pandas_batches(file_format="parquet", path=self._parquet_path, chunk_rows=100,
+                                                    limit=1000)
+
+        self.assertIsInstance(dataframes, PrefetchIterator, "Should be a PrefetchIterator")
+
+        with dataframes:
+            self.assertEqual(len(next(dataframes)), 100, "Should match")
+
+        with self.assertRaises(ValueError):
+            storage.read_to_pandas_batches(file_format="parquet", path=self._parquet_path)
+
+        with self.assertRaises(ValueError):
+            storage.read_to_pandas_batches(file_format="parquet", path=self._parquet_path, chunk_rows=0)
@@ -0,0 +1,83 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from deltalake import write_deltalake
+
+from cloud.core import PandasOptions
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemPandasOptions(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 20000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows)),
+            "label": pa.array([f"label-{i % 100:03d}" if i % 7 else None for i in range(num_rows)]),
+            "country": pa.array([["ES", "UY", "US", "DE"][i % 4] for i in range(num_rows)])
+        })
+
+        cls._parquet_path = f"{cls._base_path}/parquet/pandas_options"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["country"],
+                         partitioning_flavor="hive", existing_data_behavior="delete_matching")
+
+        cls._delta_path = f"{cls._base_path}/deltalake/pandas_options"
+        write_deltalake(cls._delta_path, cls._table, partition_by=["country"], mode="overwrite")
+
+    def _assert_same_rows(self, dataframe, expected):
+        dataframe = dataframe.astype({"label": object, "country": object}).replace({pd.NA: None})
+        expected = expected.replace({float("nan"): None})
+
+        self.assertEqual(dataframe.sort_values("id").to_dict("records"),
+                         expected.sort_values("id").to_dict("records"), "Should match")
+
+    def test_localfilesystem_pandas_lean(self):
+        storage = CountingLocalFileSystemStorage()
+
+        for file_format, path in [("parquet", self._parquet_path), ("deltalake", self._delta_path)]:
+            dataframe = storage.read_to_pandas(file_format=file_format, path=path,
+                                               pandas_options=PandasOptions.lean())
+
+            self.assertEqual(dataframe["label"].dtype, pd.ArrowDtype(pa.string()), "Should match")
+            self.assertIsInstance(dataframe["country"].dtype, pd.CategoricalDtype, "Should be a CategoricalDtype")
+            self.assertEqual(sorted(dataframe["country"].cat.categories), ["DE", "ES", "US", "UY"], "Should match")
+            self._assert_same_rows(dataframe, self._table.to_pandas())
+
+    def test_localfilesystem_pandas_options(self):
+        storage = CountingLocalFileSystemStorage()
+
+        dataframe = storage.read_to_pandas(file_format="parquet", path=self._parquet_path, columns=["id", "label"],
+                                           filters=[("country", "=", "UY")], limit=100,
+                                           pandas_options=PandasOptions(self_destruct=True))
+        default = storage.read_to_pandas(file_format="parquet", path=self._parquet_path, columns=["id", "label"],
+                                         filters=[("country", "=", "UY")], limit=100)
+
+        self.assertEqual(dataframe["label"].dtype, object, "Should match")
+        self.assertTrue(dataframe.equals(default), "Should be true")
+
+    def test_localfilesystem_pandas_categorical_partitions_filtered(self):
+        storage = CountingLocalFileSystemStorage()
+        expected = self._table.to_pandas()
+
+        for file_format, path in [("parquet", self._parquet_path), ("deltalake", self._delta_path)]:
+            # the partition columns are scanned as dictionaries, filtering and limiting them still work
+            dataframe = storage.read_to_pandas(file_format=file_format, path=path,
+                                               filters=[("country", "in", ["ES", "US"])],
+                                               pandas_options=PandasOptions(categorical_partitions=True))
+            limited = storage.read_to_pandas(file_format=file_format, path=path, filters=[("country", "=", "UY")],
+                                             limit=10, pandas_options=PandasOptions(categorical_partitions=True))
+
+            self.assertIsInstance(dataframe["country"].dtype, pd.CategoricalDtype, "Should be a CategoricalDtype")
+            self.assertEqual(sorted(dataframe["country"].cat.categories), ["ES", "US"], "Should match")
+            self._assert_same_rows(dataframe, expected[expected["country"].isin(["ES", "US"])])
+            self.assertEqual(limited["country"].astype(object).tolist(), ["UY"] * 10, "Should match")
+
+    def test_localfilesystem_pandas_options_arguments(self):
+        self.assertEqual(PandasOptions().to_dict(), {}, "Should match")
+        self.assertEqual(PandasOptions(self_destruct=True).to_dict(), {"self_destruct": True, "split_blocks": True},
+                         "Should match")
+        self.assertEqual(set(PandasOptions.lean().to_dict()), {"self_destruct", "split_blocks", "types_mapper"},
+                         "Should match")
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from cloud.core import PrefetchIterator, ScanOptions
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemPrefetch(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 100000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows)),
+            "part": pa.array([i // 25000 for i in range(num_rows)])
+        })
+
+        cls._parquet_path = f"{cls._base_path}/parquet/prefetch"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["part"],
+                         partitioning_flavor="hive", max_rows_per_group=10000,
+                         existing_data_behavior="delete_matching")
+
+    @staticmethod
+    def _batches(count, produced, closed=None):
+        try:
+            for index in range(count):
+                produced.append(index)
+                yield pa.record_batch([pa.array([index] * 1000)], names=["value"])
+        finally:
+            if closed is not None:
+                closed.set()
+
+    @staticmethod
+    def _wait_for(predicate, timeout=5):
+        deadline = time.monotonic() + timeout
+
+        while not predicate() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_localfilesystem_prefetch_reads_ahead(self):
+        produced = []
+        batches = PrefetchIterator(self._batches(20, produced), max_batches=3)
+
+        self.assertEqual(next(batches).column(0)[0].as_py(), 0, "Should match")
+        # 3 batches wait in the queue and a fourth one waits for room
+        self._wait_for(lambda: len(produced) == 5)
+        time.sleep(0.05)
+        self.assertEqual(len(produced), 5, "Should match")
+
+        self.assertEqual([batch.column(0)[0].as_py() for batch in batches], list(range(1, 20)), "Should match")
+
+    def test_localfilesystem_prefetch_bytes(self):
+        produced = []
+        nbytes = pa.array([0] * 1000).nbytes
+        batches = PrefetchIterator(self._batches(20, produced), max_bytes=2 * nbytes)
+
+        self._wait_for(lambda: len(produced) == 3)
+        time.sleep(0.05)
+        self.assertEqual(len(produced), 3, "Should match")
+        self.assertEqual(len(list(batches)), 20, "Should match")
+
+    def test_localfilesystem_prefetch_close(self):
+        produced = []
+        closed = threading.Event()
+
+        with PrefetchIterator(self._batches(1000, produced, closed), max_batches=2) as batches:
+            next(batches)
+
+        self.assertTrue(closed.is_set(), "Should be true")
+        self.assertLess(len(produced), 10, "Should be less")
+
+    def test_localfilesystem_prefetch_error(self):
+        def failing():
+            yield pa.record_batch([pa.array([1])], names=["value"])
+            raise OSError("connection reset")
+
+        batches = PrefetchIterator(failing(), max_batches=4)
+
+        self.assertEqual(next(batches).num_rows, 1, "Should match")
+
+        with self.assertRaises(OSError):
+            next(batches)
+
+        with self.assertRaises(ValueError):
+            PrefetchIterator(failing())
+
+    def test_localfilesystem_read_batches_prefetch(self):
+        storage = CountingLocalFileSystemStorage()
+        scan_options = ScanOptions(prefetch_batches=4, prefetch_bytes=2 ** 20)
+
+        batches = storage.read_batches(file_format="parquet", path=self._parquet_path, batch_size=5000,
+                                       filters=[("part", ">=", 2)], scan_options=scan_options)
+        limited = storage.read_batches(file_format="parquet", path=self._parquet_path, batch_size=5000, limit=7000,
+                                       scan_options=scan_options)
+
+        self.assertIsInstance(batches, PrefetchIterator, "Should be a PrefetchIterator")
+        self.assertEqual(sorted(value for batch in batches for value in batch.column("id").to_pylist()),
+                         list(range(50000, 100000)), "Should match")
+        self.assertEqual(sum(batch.num_rows for batch in limited), 7000, "Should match")
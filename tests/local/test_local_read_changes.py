@@ -0,0 +1,86 @@
+import deltalake as dlt
+import pyarrow.dataset as ds
+
+from cloud.core import MetadataCache
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemReadChanges(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+    def make_table(self, name, commits):
+        path = f"{self._base_path}/deltalake/{name}"
+
+        for _ in range(commits):
+            self.append(path)
+
+        return path
+
+    def append(self, path, data=None):
+        dlt.write_deltalake(table_or_uri=path, data=self._fixed_table if data is None else data, mode="append",
+                            partition_by=["Outcome"],
+                            storage_options=self._local_filesystem_storage._get_deltalake_storage_options())
+
+    @staticmethod
+    def read_changes(storage, path, since_version, **kwargs):
+        record_batches, version = storage.read_changes(path=path, since_version=since_version, **kwargs)
+        return list(record_batches), version
+
+    def test_localfilesystem_read_changes_since_version(self):
+        path = self.make_table("changes_since_version", commits=3)
+        storage = CountingLocalFileSystemStorage()
+
+        record_batches, version = self.read_changes(storage, path, since_version=1)
+
+        self.assertEqual(version, 2, "Should match")
+        self.assertEqual(sum(batch.num_rows for batch in record_batches), self._fixed_table.num_rows, "Should match")
+
+    def test_localfilesystem_read_changes_high_water_mark(self):
+        path = self.make_table("changes_high_water_mark", commits=1)
+        storage = CountingLocalFileSystemStorage()
+
+        record_batches, version = self.read_changes(storage, path, since_version=-1)
+        self.assertEqual(sum(batch.num_rows for batch in record_batches), self._fixed_table.num_rows, "Should match")
+
+        record_batches, version = self.read_changes(storage, path, since_version=version)
+        self.assertEqual(len(record_batches), 0, "Should match")
+
+        self.append(path, data=self._fixed_table.slice(0, 10))
+        record_batches, version = self.read_changes(storage, path, since_version=version)
+
+        self.assertEqual(sum(batch.num_rows for batch in record_batches), 10, "Should match")
+        self.assertEqual(version, 1, "Should match")
+
+    def test_localfilesystem_read_changes_opens_only_added_files(self):
+        path = self.make_table("changes_added_files", commits=4)
+        # the metadata cache reads the data files through the counting filesystem
+        storage = CountingLocalFileSystemStorage(metadata_cache=MetadataCache())
+        filesystem = storage._get_filesystem().handler.fs
+
+        record_batches, _ = storage.read_changes(path=path, since_version=2)
+        filesystem.reset_counters()
+        rows = sum(batch.num_rows for batch in record_batches)
+
+        data_files = len(dlt.DeltaTable(path).files())
+        self.assertEqual(rows, self._fixed_table.num_rows, "Should match")
+        self.assertLessEqual(filesystem.files_opened, data_files // 4)
+
+    def test_localfilesystem_read_changes_filters_and_columns(self):
+        path = self.make_table("changes_filters", commits=2)
+        storage = CountingLocalFileSystemStorage()
+
+        record_batches, _ = self.read_changes(storage, path, since_version=0, filters=ds.field("Outcome") == 1,
+                                              columns=["Age"])
+
+        self.assertEqual(record_batches[0].schema.names, ["Age"], "Should match")
+        self.assertEqual(sum(batch.num_rows for batch in record_batches),
+                         self._fixed_table.filter(ds.field("Outcome") == 1).num_rows, "Should match")
+
+    def test_localfilesystem_read_changes_invalid_version(self):
+        path = self.make_table("changes_invalid_version", commits=1)
+
+        with self.assertRaises(ValueError):
+            CountingLocalFileSystemStorage().read_changes(path=path, since_version=5)
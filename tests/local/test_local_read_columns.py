@@ -0,0 +1,95 @@
+import deltalake as dlt
+import numpy
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemReadColumns(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/static/nopart", create_parents=True)
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/wide", create_parents=True)
+        cls._filesystem.mkdir(f"{cls._base_path}/parquet/nested", create_parents=True)
+        cls._filesystem.mkdir(f"{cls._base_path}/deltalake/static/part", create_parents=True)
+
+        pq.write_to_dataset(cls._fixed_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error',
+                            root_path=f"{cls._base_path}/parquet/static/nopart")
+        pq.write_to_dataset(pa.table({f"feature_{i}": numpy.random.uniform(size=20000) for i in range(20)}),
+                            filesystem=cls._filesystem, compression='none', existing_data_behavior='error',
+                            root_path=f"{cls._base_path}/parquet/wide")
+        pq.write_to_dataset(pa.table({"id": [1, 2, 3],
+                                      "address": [{"city": "Montevideo", "zip": 11000},
+                                                  {"city": "Madrid", "zip": 28001},
+                                                  {"city": "Lima", "zip": 15001}]}),
+                            filesystem=cls._filesystem, existing_data_behavior='error',
+                            root_path=f"{cls._base_path}/parquet/nested")
+        dlt.write_deltalake(
+            table_or_uri=f"{cls._base_path}/deltalake/static/part",
+            data=cls._fixed_table, mode="error", partition_by=["Pregnancies"],
+            storage_options=cls._local_filesystem_storage._get_deltalake_storage_options(),
+            file_options=ds.ParquetFileFormat().make_write_options(compression='none'))
+
+        cls._counting_storage = CountingLocalFileSystemStorage()
+
+    def test_localfilesystem_read_columns_parquet_reads_less_bytes(self):
+        filesystem = self._counting_storage._get_filesystem()
+
+        filesystem.reset_counters()
+        full = self._counting_storage.read_to_arrow_table(file_format="parquet",
+                                                          path=f"{self._base_path}/parquet/wide")
+        full_bytes = filesystem.bytes_read
+
+        filesystem.reset_counters()
+        projected = self._counting_storage.read_to_arrow_table(file_format="parquet",
+                                                               path=f"{self._base_path}/parquet/wide",
+                                                               columns=["feature_0", "feature_1"])
+        projected_bytes = filesystem.bytes_read
+
+        self.assertEqual(projected.column_names, ["feature_0", "feature_1"], "Should match")
+        self.assertEqual(projected.num_rows, full.num_rows, "Should match")
+        self.assertLess(projected_bytes, full_bytes / 5)
+
+    def test_localfilesystem_read_columns_parquet_batches_filters(self):
+        batches = self._local_filesystem_storage.read_batches(
+            file_format="parquet",
+            path=f"{self._base_path}/parquet/static/nopart",
+            filters=(ds.field("Pregnancies") == 0),
+            columns=["Age", "Outcome"],
+            batch_size=40
+        )
+
+        count = 0
+
+        for batch in batches:
+            self.assertEqual(batch.schema.names, ["Age", "Outcome"], "Should match")
+            count += batch.num_rows
+
+        self.assertEqual(count, 111, "Should match")
+
+    def test_localfilesystem_read_columns_parquet_nested(self):
+        table = self._local_filesystem_storage.read_to_arrow_table(
+            file_format="parquet",
+            path=f"{self._base_path}/parquet/nested",
+            columns=["id", "address.city"]
+        )
+
+        self.assertEqual(table.column_names, ["id", "address.city"], "Should match")
+        self.assertEqual(sorted(table.column("address.city").to_pylist()), ["Lima", "Madrid", "Montevideo"])
+
+    def test_localfilesystem_read_columns_deltalake_expressions(self):
+        df = self._local_filesystem_storage.read_to_pandas(
+            file_format="deltalake",
+            path=f"{self._base_path}/deltalake/static/part",
+            filters=(ds.field("Pregnancies") == 0),
+            columns={"Pregnancies": ds.field("Pregnancies"), "AgeInMonths": ds.field("Age") * 12}
+        )
+
+        self.assertEqual(list(df.columns), ["Pregnancies", "AgeInMonths"], "Should match")
+        self.assertEqual(len(df), 111, "Should match")
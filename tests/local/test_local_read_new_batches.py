@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from cloud.local import LocalFileSystemStorage
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemReadNewBatches(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+    def setUp(self):
+        self._state_dir = tempfile.mkdtemp()
+        self._state_path = os.path.join(self._state_dir, "state.json")
+
+    def tearDown(self):
+        shutil.rmtree(self._state_dir)
+
+    def make_dataset(self, name):
+        path = f"{self._base_path}/parquet/{name}"
+        self._filesystem.mkdir(path, create_parents=True)
+        return path
+
+    def read_new_rows(self, storage, path, **kwargs):
+        return sum(batch.num_rows for batch in storage.read_new_batches(path=path, state_path=self._state_path,
+                                                                         **kwargs))
+
+    def test_localfilesystem_read_new_batches_only_new_files(self):
+        path = self.make_dataset("incremental_new_files")
+        storage = LocalFileSystemStorage()
+
+        pq.write_table(self._fixed_table, f"{path}/part-0.parquet")
+        self.assertEqual(self.read_new_rows(storage, path), self._fixed_table.num_rows, "Should match")
+        self.assertEqual(self.read_new_rows(storage, path), 0, "Should match")
+
+        pq.write_table(self._fixed_table.slice(0, 10), f"{path}/part-1.parquet")
+        self.assertEqual(self.read_new_rows(storage, path), 10, "Should match")
+        self.assertEqual(self.read_new_rows(storage, path), 0, "Should match")
+
+    def test_localfilesystem_read_new_batches_rewritten_file(self):
+        path = self.make_dataset("incremental_rewritten")
+        storage = LocalFileSystemStorage()
+
+        pq.write_table(self._fixed_table, f"{path}/part-0.parquet")
+        self.read_new_rows(storage, path)
+
+        pq.write_table(self._fixed_table.slice(0, 10), f"{path}/part-0.parquet")
+        os.utime(f"{path}/part-0.parquet", ns=(0, 1))
+
+        self.assertEqual(self.read_new_rows(storage, path), 10, "Should match")
+
+    def test_localfilesystem_read_new_batches_interrupted_read_repeated(self):
+        path = self.make_dataset("incremental_interrupted")
+        storage = LocalFileSystemStorage()
+
+        pq.write_table(self._fixed_table, f"{path}/part-0.parquet")
+        record_batches = storage.read_new_batches(path=path, state_path=self._state_path, batch_size=10)
+        next(record_batches)
+        record_batches.close()
+
+        self.assertEqual(self.read_new_rows(storage, path), self._fixed_table.num_rows, "Should match")
+
+    def test_localfilesystem_read_new_batches_skips_hidden_directories(self):
+        path = self.make_dataset("incremental_hidden_directories")
+        storage = LocalFileSystemStorage()
+
+        pq.write_table(self._fixed_table, f"{path}/part-0.parquet")
+
+        # the files of unfinished writes and hidden directories are not data files
+        for directory in ["_temporary", ".hidden"]:
+            os.makedirs(f"{path}/{directory}/0", exist_ok=True)
+            pq.write_table(self._fixed_table.slice(0, 10), f"{path}/{directory}/0/part.parquet")
+
+        self.assertEqual(self.read_new_rows(storage, path), self._fixed_table.num_rows, "Should match")
+        self.assertEqual(self.read_new_rows(storage, path), 0, "Should match")
+
+    def test_localfilesystem_read_new_batches_partitioned(self):
+        path = self.make_dataset("incremental_partitioned")
+        storage = CountingLocalFileSystemStorage()
+
+        pq.write_to_dataset(self._fixed_table, root_path=path, partition_cols=["Outcome"],
+                            basename_template="first-{i}.parquet")
+        self.read_new_rows(storage, path)
+        pq.write_to_dataset(self._fixed_table, root_path=path, partition_cols=["Outcome"],
+                            basename_template="second-{i}.parquet")
+
+        filesystem = storage._get_filesystem()
+        filesystem.reset_counters()
+        rows = self.read_new_rows(storage, path, filters=ds.field("Outcome") == 1, columns=["Outcome", "Age"])
+
+        self.assertEqual(rows, self._fixed_table.filter(ds.field("Outcome") == 1).num_rows, "Should match")
+        # the schema is inferred from one of the new files, the filter prunes the other new partition
+        self.assertLessEqual(filesystem.files_opened, 2)
@@ -0,0 +1,97 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from deltalake import write_deltalake
+
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemSample(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 200000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows)),
+            "value": pa.array([i % 1000 for i in range(num_rows)]),
+            "part": pa.array([i // 50000 for i in range(num_rows)])
+        })
+
+        # 4 files of 5 row groups of 10000 rows
+        cls._parquet_path = f"{cls._base_path}/parquet/sample"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["part"],
+                         partitioning_flavor="hive", min_rows_per_group=10000, max_rows_per_group=10000,
+                         existing_data_behavior="delete_matching")
+
+        cls._delta_path = f"{cls._base_path}/deltalake/sample"
+        write_deltalake(cls._delta_path, cls._table, partition_by=["part"], min_rows_per_group=10000,
+                        max_rows_per_group=10000, mode="overwrite")
+
+    def test_localfilesystem_sample_reads_drawn_row_groups(self):
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+
+        storage.read_to_arrow_table(file_format="parquet", path=self._parquet_path)
+        full_bytes = filesystem.bytes_read
+        filesystem.reset_counters()
+
+        table = storage.read_sample(file_format="parquet", path=self._parquet_path, n_rows=1000, seed=7)
+
+        self.assertEqual(table.num_rows, 1000, "Should match")
+        self.assertEqual(len(pc.unique(table.column("id"))), 1000, "Should match")
+        self.assertLess(filesystem.bytes_read, full_bytes / 2, "Should be less")
+
+    def test_localfilesystem_sample_seed(self):
+        storage = CountingLocalFileSystemStorage()
+
+        first = storage.read_sample(file_format="parquet", path=self._parquet_path, fraction=0.1, seed=11)
+        second = storage.read_sample(file_format="parquet", path=self._parquet_path, fraction=0.1, seed=11)
+        other = storage.read_sample(file_format="parquet", path=self._parquet_path, fraction=0.1, seed=12)
+
+        self.assertEqual(first.num_rows, 20000, "Should match")
+        self.assertTrue(first.equals(second), "Should be true")
+        self.assertFalse(first.equals(other), "Should be false")
+
+    def test_localfilesystem_sample_filters(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.read_sample(file_format="parquet", path=self._parquet_path, n_rows=500, seed=3,
+                                    filters=[("value", "<", 100), ("part", ">=", 2)])
+        fewer = storage.read_sample(file_format="parquet", path=self._parquet_path, n_rows=5000, seed=3,
+                                    filters=[("value", "<", 10)])
+
+        self.assertEqual(table.num_rows, 500, "Should match")
+        self.assertTrue(pc.all(pc.less(table.column("value"), 100)).as_py(), "Should be true")
+        self.assertTrue(pc.all(pc.greater_equal(table.column("part"), 2)).as_py(), "Should be true")
+        # only 2000 rows match
+        self.assertEqual(fewer.num_rows, 2000, "Should match")
+
+    def test_localfilesystem_sample_deltalake(self):
+        storage = CountingLocalFileSystemStorage()
+
+        table = storage.read_sample(file_format="deltalake", path=self._delta_path, n_rows=100, seed=5,
+                                    filters=[("part", "=", 1)], columns=["id", "part"])
+
+        self.assertEqual(table.num_rows, 100, "Should match")
+        self.assertEqual(table.schema.names, ["id", "part"], "Should match")
+        self.assertEqual(pc.unique(table.column("part")).to_pylist(), [1], "Should match")
+
+    def test_localfilesystem_sample_arguments(self):
+        storage = CountingLocalFileSystemStorage()
+
+        empty = storage.read_sample(file_format="parquet", path=self._parquet_path, n_rows=10,
+                                    filters=[("id", "<", 0)], columns=["id"])
+
+        self.assertEqual(empty.num_rows, 0, "Should match")
+        self.assertEqual(empty.schema.names, ["id"], "Should match")
+
+        with self.assertRaises(ValueError):
+            storage.read_sample(file_format="parquet", path=self._parquet_path)
+
+        with self.assertRaises(ValueError):
+            storage.read_sample(file_format="parquet", path=self._parquet_path, fraction=0.1, n_rows=10)
+
+        with self.assertRaises(ValueError):
+            storage.read_sample(file_format="parquet", path=self._parquet_path, fraction=1.5)
@@ -0,0 +1,69 @@
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from cloud.core import ScanOptions
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemScanOptions(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        num_rows = 100000
+        cls._table = pa.table({
+            "id": pa.array(range(num_rows)),
+            "value": pa.array([float(i % 1000) for i in range(num_rows)]),
+            "part": pa.array([i // 25000 for i in range(num_rows)])
+        })
+
+        cls._parquet_path = f"{cls._base_path}/parquet/scan_options"
+        ds.write_dataset(cls._table, cls._parquet_path, format="parquet", partitioning=["part"],
+                         partitioning_flavor="hive", max_rows_per_group=10000,
+                         existing_data_behavior="delete_matching")
+
+        # the pool must outlive the buffers allocated from it
+        cls._memory_pool = pa.proxy_memory_pool(pa.default_memory_pool())
+
+    def test_localfilesystem_scan_options_memory_pool(self):
+        storage = CountingLocalFileSystemStorage()
+        scan_options = ScanOptions(batch_readahead=1, fragment_readahead=1, use_threads=False,
+                                   memory_pool=self._memory_pool)
+
+        table = storage.read_to_arrow_table(file_format="parquet", path=self._parquet_path,
+                                            scan_options=scan_options)
+
+        self.assertEqual(table.sort_by("id").column("id").to_pylist(), list(range(100000)), "Should match")
+        self.assertGreater(self._memory_pool.bytes_allocated(), 0, "Should be greater")
+
+    def test_localfilesystem_scan_options_read_methods(self):
+        storage = CountingLocalFileSystemStorage()
+        scan_options = ScanOptions(batch_readahead=2, fragment_readahead=2, use_threads=False)
+
+        batches = list(storage.read_batches(file_format="parquet", path=self._parquet_path, batch_size=5000,
+                                            scan_options=scan_options))
+        dataframe = storage.read_to_pandas(file_format="parquet", path=self._parquet_path, limit=10,
+                                           scan_options=scan_options)
+        lookup = storage.lookup(file_format="parquet", path=self._parquet_path, key_column="id", keys=[7, 70000],
+                                scan_options=scan_options)
+        count = storage.count_rows(file_format="parquet", path=self._parquet_path,
+                                   filters=[("value", "<", 10)], scan_options=scan_options)
+
+        self.assertEqual(sum(batch.num_rows for batch in batches), 100000, "Should match")
+        self.assertTrue(all(batch.num_rows <= 5000 for batch in batches), "Should be true")
+        self.assertEqual(len(dataframe), 10, "Should match")
+        self.assertEqual(sorted(lookup.column("id").to_pylist()), [7, 70000], "Should match")
+        self.assertEqual(count, 1000, "Should match")
+
+    def test_localfilesystem_scan_options_defaults(self):
+        storage = CountingLocalFileSystemStorage()
+
+        self.assertEqual(storage._scan_arguments(), {}, "Should match")
+        self.assertEqual(storage._scan_arguments(ScanOptions(fragment_readahead=16)), {"fragment_readahead": 16},
+                         "Should match")
+        self.assertEqual(ScanOptions(batch_readahead=0, use_threads=False).to_dict(),
+                         {"batch_readahead": 0, "use_threads": False}, "Should match")
+
+        with self.assertRaises(ValueError):
+            ScanOptions(fragment_readahead=-1)
@@ -0,0 +1,187 @@
+import random
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+from deltalake import write_deltalake
+
+from cloud.core import ConditionFactory, DatasetCache, DatasetIndex, DeltaLakeWriteOptions, In, ParquetWriteOptions
+from cloud.core.core import _as_arrow_filesystem
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+def condition(name, key, value_1, value_2=None):
+    return ConditionFactory.get_condition(name, key, value_1, value_2)
+
+
+class TestLocalFilesystemSidecarIndex(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+        # ids sorted, keys shuffled, 5 row groups of 1000 rows per file and 2 files per partition
+        keys = list(range(40000))
+        random.Random(7).shuffle(keys)
+        cls._table = pa.table({
+            "id": pa.array(range(40000)),
+            "key": pa.array(keys),
+            "label": pa.array([f"label-{i % 37}" if i % 5 else None for i in range(40000)]),
+            "part": pa.array([i // 10000 for i in range(40000)])
+        })
+
+    def _write_parquet(self, name):
+        path = f"{self._base_path}/parquet/sidecar_index/{name}"
+        ds.write_dataset(self._table, path, format="parquet", partitioning=["part"], partitioning_flavor="hive",
+                         min_rows_per_group=1000, max_rows_per_group=1000, max_rows_per_file=5000,
+                         existing_data_behavior="delete_matching")
+        return path
+
+    @staticmethod
+    def _files_opened(storage, path, filters):
+        filesystem = storage._get_filesystem()
+        filesystem.reset_counters()
+        table = storage.read_to_arrow_table(file_format="parquet", path=path, filters=filters)
+        return table, filesystem.files_opened
+
+    def test_localfilesystem_sidecar_index_build(self):
+        path = self._write_parquet("build")
+        storage = CountingLocalFileSystemStorage()
+
+        index = storage.build_index(file_format="parquet", path=path, columns=["id", "key"],
+                                    bloom_filter_columns=["key"])
+        stored = DatasetIndex.read(_as_arrow_filesystem(storage._get_filesystem()), f"{path}/_index")
+
+        self.assertEqual(len(index), 8, "Should match")
+        self.assertEqual(stored.files, index.files, "Should match")
+        self.assertEqual(stored.columns, ["id", "key"], "Should match")
+        self.assertEqual(stored.bloom_filter_columns, ["key"], "Should match")
+        self.assertEqual(sum(stored.num_row_groups(file_path) for file_path in stored.files), 40, "Should match")
+
+    def test_localfilesystem_sidecar_index_skips_files(self):
+        path = self._write_parquet("skip")
+        storage = CountingLocalFileSystemStorage(dataset_cache=DatasetCache())
+        filters = condition("btw", "id", 12100, 12200)
+
+        storage.dataset(file_format="parquet", path=path)
+        expected, opened_without_index = self._files_opened(storage, path, filters)
+        storage.build_index(file_format="parquet", path=path, columns=["id"])
+        storage.dataset(file_format="parquet", path=path)
+        table, opened_with_index = self._files_opened(storage, path, filters)
+
+        self.assertEqual(table.num_rows, 101, "Should match")
+        self.assertEqual(sorted(table.column("id").to_pylist()), sorted(expected.column("id").to_pylist()),
+                         "Should match")
+        # the index is read, then the footer and the row group of the single candidate file. Without index
+        # every footer is read
+        self.assertLessEqual(opened_with_index, 4, "Should be less or equal")
+        self.assertGreaterEqual(opened_without_index, 8, "Should be greater or equal")
+
+    def test_localfilesystem_sidecar_index_bloom_filter(self):
+        path = self._write_parquet("bloom")
+        storage = CountingLocalFileSystemStorage(dataset_cache=DatasetCache())
+        keys = self._table.column("key").to_pylist()
+
+        storage.build_index(file_format="parquet", path=path, columns=["key"], bloom_filter_columns=["key"])
+        storage.dataset(file_format="parquet", path=path)
+
+        # the keys are shuffled, the min/max of every row group encloses them
+        table, opened = self._files_opened(storage, path, condition("eq", "key", keys[777]))
+        self.assertEqual(table.column("id").to_pylist(), [777], "Should match")
+        self.assertLess(opened, 8, "Should be less")
+
+        table, _ = self._files_opened(storage, path, In("key", [keys[5], keys[25000], -1]))
+        self.assertEqual(sorted(table.column("id").to_pylist()), [5, 25000], "Should match")
+
+        table, _ = self._files_opened(storage, path, condition("eq", "key", 10 ** 9))
+        self.assertEqual(table.num_rows, 0, "Should match")
+
+    def test_localfilesystem_sidecar_index_null_counts_and_tuples(self):
+        path = self._write_parquet("tuples")
+        storage = CountingLocalFileSystemStorage()
+        storage.build_index(file_format="parquet", path=path, columns=["id", "label"])
+
+        by_tuples = storage.read_to_arrow_table(file_format="parquet", path=path,
+                                                filters=[[("id", ">=", 39990)], [("label", "==", "label-3")]])
+        not_in = storage.read_to_arrow_table(file_format="parquet", path=path, filters=[("label", "not in", ["label-1"])])
+
+        self.assertEqual(by_tuples.num_rows, self._table.filter((ds.field("id") >= 39990)
+                                                                | (ds.field("label") == "label-3")).num_rows,
+                         "Should match")
+        # the "not in" tuples keep the null labels
+        self.assertEqual(not_in.num_rows, self._table.filter(~ds.field("label").isin(["label-1"])).num_rows,
+                         "Should match")
+
+    def test_localfilesystem_sidecar_index_updated_by_write(self):
+        path = self._write_parquet("write")
+        storage = CountingLocalFileSystemStorage(dataset_cache=DatasetCache())
+        storage.build_index(file_format="parquet", path=path, columns=["id", "key"], bloom_filter_columns=["key"])
+
+        appended = pa.table({"id": pa.array(range(40000, 41000)), "key": pa.array(range(40000, 41000)),
+                             "label": pa.array(["appended"] * 1000), "part": pa.array([9] * 1000)})
+        storage.write(appended, file_format="parquet", path=path, basename_template="appended-{i}.parquet",
+                      write_options=ParquetWriteOptions(compression_codec="snappy", partitions=["part"],
+                                                        existing_data_behavior="overwrite_or_ignore"))
+
+        index = DatasetIndex.read(_as_arrow_filesystem(storage._get_filesystem()), f"{path}/_index")
+        table = storage.read_to_arrow_table(file_format="parquet", path=path, filters=condition("eq", "key", 40500))
+
+        # write() partitions by directory, without the hive "part=" prefix
+        self.assertIn("9/appended-0.parquet", index.files)
+        self.assertEqual(len(index), 9, "Should match")
+        self.assertEqual(table.column("id").to_pylist(), [40500], "Should match")
+
+    def test_localfilesystem_sidecar_index_missing_looked_up_once(self):
+        path = self._write_parquet("missing")
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+
+        self._files_opened(storage, path, condition("eq", "id", 7))
+        self.assertEqual(filesystem.info_requests["_index"], 1, "Should match")
+
+        # the missing index is not looked up again
+        _, without_index = self._files_opened(storage, path, condition("eq", "id", 7))
+        self.assertEqual(filesystem.info_requests["_index"], 0, "Should match")
+
+        # an index built by another storage object is used once the path is invalidated
+        CountingLocalFileSystemStorage().build_index(file_format="parquet", path=path, columns=["id"])
+        _, files_opened = self._files_opened(storage, path, condition("eq", "id", 7))
+        self.assertEqual(files_opened, without_index, "Should match")
+
+        storage.invalidate(path)
+        table, files_opened = self._files_opened(storage, path, condition("eq", "id", 7))
+
+        self.assertEqual(table.column("id").to_pylist(), [7], "Should match")
+        self.assertLess(files_opened, without_index)
+
+    def test_localfilesystem_sidecar_index_deltalake(self):
+        path = f"{self._base_path}/deltalake/sidecar_index"
+        write_deltalake(path, self._table.select(["id", "key", "part"]), partition_by=["part"],
+                        min_rows_per_group=1000, max_rows_per_group=1000, mode="overwrite")
+        storage = CountingLocalFileSystemStorage()
+        write_options = DeltaLakeWriteOptions(partitions=["part"], compression_codec="snappy",
+                                              existing_data_behavior="append")
+
+        index = storage.build_index(file_format="deltalake", path=path, columns=["id"])
+        storage.write(pa.table({"id": pa.array([50000]), "key": pa.array([50000]), "part": pa.array([9])}),
+                      file_format="deltalake", path=path, basename_template=None, write_options=write_options)
+        updated = DatasetIndex.read(_as_arrow_filesystem(storage._get_filesystem()), f"{path}/_index")
+        table = storage.read_to_arrow_table(file_format="deltalake", path=path,
+                                            filters=condition("gt", "id", 39998))
+
+        self.assertEqual(len(index), 4, "Should match")
+        self.assertEqual(len(updated), 5, "Should match")
+        self.assertEqual(sorted(table.column("id").to_pylist()), [39999, 50000], "Should match")
+
+        with self.assertRaises(ValueError):
+            storage.build_index(file_format="deltalake", path=path, columns=["part"])
+
+    def test_condition_from_filters(self):
+        filters = ConditionFactory.from_filters([[("a", ">=", 1), ("a", "<", 5)], [("b", "in", [1, 2])]])
+
+        self.assertEqual(filters.gen_filters(), [[("a", ">=", 1), ("a", "<", 5)], [("b", "in", [1, 2])]],
+                         "Should match")
+        self.assertEqual(ConditionFactory.from_filters([("a", "==", 1)]).gen_filters(), [[("a", "==", 1)]],
+                         "Should match")
+
+        with self.assertRaises(ValueError):
+            ConditionFactory.from_filters([("a", "like", 1)])
@@ -0,0 +1,72 @@
+import deltalake as dlt
+
+from cloud.core import SnapshotCache
+from cloud.local import LocalFileSystemStorage
+from tests.core import LocalFilesystemTestBase
+
+
+class TestLocalFilesystemSnapshotCache(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+
+    def make_table(self, name):
+        path = f"{self._base_path}/deltalake/{name}"
+        self.append(path)
+        return path
+
+    def append(self, path):
+        dlt.write_deltalake(table_or_uri=path, data=self._fixed_table, mode="append",
+                            storage_options=self._local_filesystem_storage._get_deltalake_storage_options())
+
+    def num_rows(self, storage, path, version=None):
+        return storage.read_to_arrow_table(file_format="deltalake", path=path, version=version).num_rows
+
+    def test_localfilesystem_snapshot_cache_reused(self):
+        path = self.make_table("snapshot_reused")
+        storage = LocalFileSystemStorage(snapshot_cache=SnapshotCache())
+
+        self.assertEqual(self.num_rows(storage, path), self._fixed_table.num_rows, "Should match")
+        self.assertEqual(self.num_rows(storage, f"{path}/"), self._fixed_table.num_rows, "Should match")
+
+        self.assertEqual(storage.snapshot_cache.misses, 1, "Should match")
+        self.assertEqual(storage.snapshot_cache.hits, 1, "Should match")
+
+    def test_localfilesystem_snapshot_cache_refreshed_incrementally(self):
+        path = self.make_table("snapshot_refreshed")
+        storage = LocalFileSystemStorage(snapshot_cache=SnapshotCache())
+
+        self.num_rows(storage, path)
+        self.append(path)
+
+        self.assertEqual(self.num_rows(storage, path), 2 * self._fixed_table.num_rows, "Should match")
+        self.assertEqual(storage.snapshot_cache.refreshes, 1, "Should match")
+        self.assertEqual(storage.snapshot_cache.misses, 1, "Should match")
+
+    def test_localfilesystem_snapshot_cache_staleness_bound(self):
+        path = self.make_table("snapshot_stale")
+        storage = LocalFileSystemStorage(snapshot_cache=SnapshotCache(max_staleness=None))
+
+        self.num_rows(storage, path)
+        self.append(path)
+        self.assertEqual(self.num_rows(storage, path), self._fixed_table.num_rows, "Should match")
+
+        storage.invalidate(path)
+        self.assertEqual(self.num_rows(storage, path), 2 * self._fixed_table.num_rows, "Should match")
+
+    def test_localfilesystem_snapshot_cache_pinned_version(self):
+        path = self.make_table("snapshot_pinned")
+        self.append(path)
+        storage = LocalFileSystemStorage(snapshot_cache=SnapshotCache())
+
+        self.assertEqual(self.num_rows(storage, path, version=0), self._fixed_table.num_rows, "Should match")
+        self.assertEqual(self.num_rows(storage, path), 2 * self._fixed_table.num_rows, "Should match")
+        self.append(path)
+        self.assertEqual(self.num_rows(storage, path, version=0), self._fixed_table.num_rows, "Should match")
+        self.assertEqual(storage.snapshot_cache.refreshes, 0, "Should match")
+        self.assertEqual(len(storage.snapshot_cache), 2, "Should match")
+
+    def test_localfilesystem_version_only_for_deltalake(self):
+        with self.assertRaises(ValueError):
+            self._local_filesystem_storage.dataset(file_format="parquet", path=self._base_path, version=0)
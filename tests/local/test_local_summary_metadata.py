@@ -0,0 +1,111 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cloud.core import ParquetWriteOptions
+from tests.core import LocalFilesystemTestBase, CountingLocalFileSystemStorage
+
+
+class TestLocalFilesystemSummaryMetadata(LocalFilesystemTestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        LocalFilesystemTestBase.setUpClass()
+        cls._storage = CountingLocalFileSystemStorage()
+
+    def write(self, path, basename_template="part-{i}.parquet", existing_data_behavior="overwrite_or_ignore",
+              write_metadata=True, partitions=None, data=None):
+        self._storage.write(data=self._fixed_table if data is None else data,
+                            file_format="parquet",
+                            path=path,
+                            basename_template=basename_template,
+                            write_options=ParquetWriteOptions(partitions=partitions or [],
+                                                              compression_codec="snappy",
+                                                              existing_data_behavior=existing_data_behavior,
+                                                              write_metadata=write_metadata))
+
+    def test_localfilesystem_summary_metadata_written(self):
+        path = f"{self._base_path}/parquet/summary_written"
+        self.write(path, partitions=["Pregnancies"])
+
+        metadata = pq.read_metadata(f"{path}/_metadata")
+        common_metadata = pq.read_schema(f"{path}/_common_metadata")
+
+        self.assertEqual(metadata.num_rows, self._fixed_table.num_rows, "Should match")
+        self.assertNotIn("Pregnancies", common_metadata.names)
+        self.assertEqual(self._storage.dataset(file_format="parquet", path=path,
+                                               partitioning=["Pregnancies"]).count_rows(),
+                         self._fixed_table.num_rows, "Should match")
+
+    def test_localfilesystem_summary_metadata_skips_listing_and_footers(self):
+        path = f"{self._base_path}/parquet/summary_read"
+        self.write(path, partitions=["Pregnancies"])
+
+        filesystem = self._storage._get_filesystem()
+        filesystem.reset_counters()
+        dataset = self._storage.dataset(file_format="parquet", path=path, partitioning=["Pregnancies"])
+
+        self.assertEqual(filesystem.list_requests, 0, "Should match")
+        self.assertEqual(filesystem.files_opened, 1, "Should match")
+        self.assertGreater(len(dataset.files), 1)
+        self.assertIn("Pregnancies", dataset.schema.names)
+        self.assertEqual(dataset.to_table().num_rows, self._fixed_table.num_rows, "Should match")
+
+    def test_localfilesystem_summary_metadata_missing_probed_once(self):
+        path = f"{self._base_path}/parquet/summary_missing"
+        self.write(path, write_metadata=False)
+
+        storage = CountingLocalFileSystemStorage()
+        filesystem = storage._get_filesystem()
+
+        for _ in range(3):
+            storage.dataset(file_format="parquet", path=path)
+
+        self.assertEqual(filesystem.info_requests["_metadata"], 1, "Should match")
+
+        # a summary written by another storage object is used once the path is invalidated
+        self.write(path)
+        storage.invalidate(path)
+        filesystem.reset_counters()
+        storage.dataset(file_format="parquet", path=path)
+
+        self.assertEqual(filesystem.info_requests["_metadata"], 1, "Should match")
+        self.assertEqual(filesystem.list_requests, 0, "Should match")
+
+    def test_localfilesystem_summary_metadata_merged_on_append(self):
+        path = f"{self._base_path}/parquet/summary_append"
+        self.write(path, basename_template="first-{i}.parquet")
+        self.write(path, basename_template="second-{i}.parquet")
+
+        self.assertEqual(pq.read_metadata(f"{path}/_metadata").num_rows, 2 * self._fixed_table.num_rows,
+                         "Should match")
+        self.assertEqual(self._storage.read_to_arrow_table(file_format="parquet", path=path).num_rows,
+                         2 * self._fixed_table.num_rows, "Should match")
+
+    def test_localfilesystem_summary_metadata_rebuilt_on_overwrite(self):
+        path = f"{self._base_path}/parquet/summary_overwrite"
+        self.write(path, basename_template="first-{i}.parquet")
+        self.write(path, basename_template="second-{i}.parquet")
+        self.write(path, basename_template="first-{i}.parquet", data=self._fixed_table.slice(0, 10))
+
+        self.assertEqual(pq.read_metadata(f"{path}/_metadata").num_rows, self._fixed_table.num_rows + 10,
+                         "Should match")
+        self.assertEqual(self._storage.read_to_arrow_table(file_format="parquet", path=path).num_rows,
+                         self._fixed_table.num_rows + 10, "Should match")
+
+    def test_localfilesystem_summary_metadata_removed_when_not_written(self):
+        path = f"{self._base_path}/parquet/summary_removed"
+        self.write(path, basename_template="first-{i}.parquet")
+        self.write(path, basename_template="second-{i}.parquet", write_metadata=False)
+
+        self.assertFalse(self._filesystem.exists(f"{path}/_metadata"))
+        self.assertFalse(self._filesystem.exists(f"{path}/_common_metadata"))
+        self.assertEqual(self._storage.read_to_arrow_table(file_format="parquet", path=path).num_rows,
+                         2 * self._fixed_table.num_rows, "Should match")
+
+    def test_localfilesystem_summary_metadata_removed_on_schema_change(self):
+        path = f"{self._base_path}/parquet/summary_schema_change"
+        self.write(path, basename_template="first-{i}.parquet")
+        self.write(path, basename_template="second-{i}.parquet",
+                   data=pa.table({"other": pa.array(range(10))}))
+
+        self.assertFalse(self._filesystem.exists(f"{path}/_metadata"))
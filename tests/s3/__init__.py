@@ -0,0 +1,2 @@
+from .test_s3_read import TestS3Read
+from .test_s3_write import TestS3Write
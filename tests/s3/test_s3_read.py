@@ -0,0 +1,84 @@
+import deltalake as dlt
+import numpy
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from cloud.core import ParquetWriteOptions
+from tests.core import S3TestBase
+
+
+class TestS3Read(S3TestBase):
+
+    @classmethod
+    def setUpClass(cls):
+        S3TestBase.setUpClass()
+
+        bucket_path = f"{cls._bucket}/{cls._base_path}"
+
+        pq.write_to_dataset(cls._fixed_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error', partition_cols=["Pregnancies"],
+                            root_path=f"{bucket_path}/parquet/static/part")
+        pq.write_to_dataset(cls._fixed_table, filesystem=cls._filesystem, compression='none',
+                            existing_data_behavior='error',
+                            root_path=f"{bucket_path}/parquet/static/nopart")
+
+        dlt.write_deltalake(
+            table_or_uri=cls._s3_object_storage._get_deltalake_url(path=f"{cls._base_path}/deltalake/static/part"),
+            data=cls._fixed_table, mode="error", partition_by=["Pregnancies"],
+            storage_options=cls._s3_object_storage._get_deltalake_storage_options(),
+            file_options=ds.ParquetFileFormat().make_write_options(compression='none'))
+
+    def test_s3_read_batches_parquet_part_filters(self):
+        batches = self._s3_object_storage.read_batches(
+            file_format="parquet",
+            path=f"{self._base_path}/parquet/static/part",
+            filters=(ds.field("Pregnancies") == 0),
+            batch_size=40
+        )
+
+        self.assertEqual(sum(batch.num_rows for batch in batches), 111, "Should match")
+
+    def test_s3_read_to_arrow_table_parquet_nopart(self):
+        table = self._s3_object_storage.read_to_arrow_table(
+            file_format="parquet",
+            path=f"{self._base_path}/parquet/static/nopart"
+        )
+
+        self.assertEqual(table.num_rows, self._fixed_table.num_rows, "Should match")
+
+    def test_s3_read_to_pandas_deltalake_part_filters(self):
+        df = self._s3_object_storage.read_to_pandas(
+            file_format="deltalake",
+            path=f"{self._base_path}/deltalake/static/part",
+            filters=(ds.field("Pregnancies") == 0)
+        )
+
+        self.assertEqual(len(df), 111, "Should match")
+
+    def test_s3_read_parquet_coalesces_ranged_gets(self):
+        storage = self.make_storage()
+        requests = self.count_requests(storage._get_filesystem())
+
+        table = storage.read_to_arrow_table(file_format="parquet", path=f"{self._base_path}/parquet/static/nopart")
+        storage.close()
+
+        # the column chunks of the file are fetched with coalesced ranged GETs instead of one GET per column
+        self.assertEqual(table.num_rows, self._fixed_table.num_rows, "Should match")
+        self.assertLess(requests["GetObject"], self._fixed_table.num_columns)
+
+    def test_s3_read_parquet_concurrent_ranges(self):
+        path = f"{self._base_path}/parquet/concurrent_ranges"
+        table = pa.table({"value": numpy.random.uniform(size=2 * 2 ** 20)})
+        self._s3_object_storage.write(data=table, file_format="parquet", path=path, basename_template=None,
+                                      write_options=ParquetWriteOptions(partitions=[], compression_codec="None",
+                                                                        existing_data_behavior="overwrite_or_ignore"))
+
+        storage = self.make_storage(max_concurrency=4)
+        concurrent = self.count_concurrent_requests(storage._get_filesystem())
+
+        # the ~16 MiB column chunk is a single coalesced range, fetched with 4 concurrent ranged GETs
+        self.assertEqual(storage.read_to_arrow_table(file_format="parquet", path=path), table, "Should match")
+        storage.close()
+
+        self.assertEqual(concurrent["GetObject"], 4, "Should match")
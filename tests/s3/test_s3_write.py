@@ -0,0 +1,103 @@
+import numpy
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from cloud.core import ParquetWriteOptions, DeltaLakeWriteOptions
+from tests.core import S3TestBase
+
+
+class TestS3Write(S3TestBase):
+
+    def validate_number_of_records(self, path, rows=25):
+        table_rows = ds.dataset(source=f"{self._bucket}/{path}", filesystem=self._filesystem).count_rows()
+        assert (table_rows == rows)
+
+    def test_s3_write_parquet_part_snappy_arrow_table(self):
+        self._s3_object_storage.write(data=self._test_table,
+                                      file_format="parquet",
+                                      path=f"{self._base_path}/parquet/test_part_snappy",
+                                      basename_template=None,
+                                      write_options=ParquetWriteOptions(
+                                          partitions=["Pregnancies"],
+                                          compression_codec="snappy",
+                                          existing_data_behavior="overwrite_or_ignore")
+                                      )
+
+        self.validate_number_of_records(path=f"{self._base_path}/parquet/test_part_snappy")
+
+    def test_s3_write_deltalake_part_snappy_arrow_table(self):
+        self._s3_object_storage.write(data=self._test_table,
+                                      file_format="deltalake",
+                                      path=f"{self._base_path}/deltalake/test_part_snappy",
+                                      basename_template=None,
+                                      write_options=DeltaLakeWriteOptions(
+                                          partitions=["Pregnancies"],
+                                          compression_codec="snappy",
+                                          existing_data_behavior="overwrite")
+                                      )
+
+        table = self._s3_object_storage.read_to_arrow_table(file_format="deltalake",
+                                                            path=f"{self._base_path}/deltalake/test_part_snappy")
+        self.assertEqual(table.num_rows, 25, "Should match")
+
+    def test_s3_write_parquet_multipart_part_size(self):
+        storage = self.make_storage(part_size=5 * 2 ** 20)
+        requests = self.count_requests(storage._get_filesystem())
+
+        # ~16 MiB of incompressible doubles written as a single file
+        table = pa.table({"value": numpy.random.uniform(size=2 * 2 ** 20)})
+        storage.write(data=table,
+                      file_format="parquet",
+                      path=f"{self._base_path}/parquet/test_multipart",
+                      basename_template=None,
+                      write_options=ParquetWriteOptions(
+                          partitions=[],
+                          compression_codec="None",
+                          existing_data_behavior="overwrite_or_ignore")
+                      )
+        storage.close()
+
+        self.assertEqual(requests["CreateMultipartUpload"], 1, "Should match")
+        self.assertGreaterEqual(requests["UploadPart"], 3)
+        self.validate_number_of_records(path=f"{self._base_path}/parquet/test_multipart", rows=table.num_rows)
+
+    def test_s3_write_parquet_concurrent_parts(self):
+        # ~32 MiB of incompressible doubles written as a single file of 6 parts
+        table = pa.table({"value": numpy.random.uniform(size=4 * 2 ** 20)})
+
+        for max_concurrency in [1, 4]:
+            storage = self.make_storage(part_size=5 * 2 ** 20, max_concurrency=max_concurrency)
+            concurrent = self.count_concurrent_requests(storage._get_filesystem(), latency=0.2)
+            path = f"{self._base_path}/parquet/test_concurrent_parts_{max_concurrency}"
+
+            storage.write(data=table,
+                          file_format="parquet",
+                          path=path,
+                          basename_template=None,
+                          write_options=ParquetWriteOptions(
+                              partitions=[],
+                              compression_codec="None",
+                              existing_data_behavior="overwrite_or_ignore")
+                          )
+            storage.close()
+
+            self.assertLessEqual(concurrent["UploadPart"], max_concurrency)
+            self.validate_number_of_records(path=path, rows=table.num_rows)
+
+            if max_concurrency > 1:
+                self.assertGreater(concurrent["UploadPart"], 1, "Parts should be uploaded concurrently")
+
+    def test_s3_invalid_part_size(self):
+        with self.assertRaises(ValueError):
+            self.make_storage(part_size=2 ** 20)
+
+    def test_s3_close_unused_storage(self):
+        storage = self.make_storage()
+        storage._get_filesystem()
+
+        # no request was made, there is no client to close
+        storage.close()
+        storage.refresh_credentials()
+
+        with self.make_storage() as unused:
+            unused._get_filesystem()